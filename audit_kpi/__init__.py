@@ -0,0 +1,14 @@
+# audit_kpi/__init__.py
+from .catalog import EventCategory, build_lookup, load_change_catalog, load_sensitive_tables
+from .engine import AuditKpiEngine, parse_event_time
+from .window import RollingWindow
+
+__all__ = [
+    'AuditKpiEngine',
+    'build_lookup',
+    'EventCategory',
+    'load_change_catalog',
+    'load_sensitive_tables',
+    'parse_event_time',
+    'RollingWindow',
+]
@@ -0,0 +1,130 @@
+# audit_kpi/catalog.py
+"""
+Precomputed (service_name, action_name) -> category lookup for audit events.
+
+Folds the CASE categorisations repeated across the security dashboards (files.sql, q.sql,
+more_security.sql, encrypt.sql, tables_updated.sql) and the change catalog in `aaa` into one dict,
+so categorising an event is a single lookup instead of a chain of comparisons.
+"""
+import csv
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Optional, Tuple
+
+FILE_SERVICES = frozenset({"filesystem", "workspaceFiles"})
+
+# files.sql operation_type
+FILE_OPERATIONS = {
+    "filesGet": "Read/Download",
+    "createDownloadUrl": "Read/Download",
+    "wsfsStreamingRead": "Read/Download",
+    "filesHead": "Read/Download",
+    "filesPut": "Write/Upload",
+    "createUploadUrl": "Write/Upload",
+    "directoriesGet": "List/Browse",
+    "list": "List/Browse",
+    "filesDelete": "Delete",
+    "directoriesDelete": "Delete",
+}
+
+# q.sql / more_security.sql monitored changes
+PERMISSION_CHANGES = {
+    "accounts": {"createGroup", "add", "addPrincipalToGroup", "removePrincipalFromGroup", "revokeDbToken"},
+    "workspace": {"updatePermissionAssignment"},
+    "sqlPermissions": {"grantPermission", "requestPermissions"},
+    "unityCatalog": {"updatePermissions", "UpdateTagSecurableAssignments"},
+    "clusterPolicies": {"changeClusterPolicyAcl", "create"},
+    "secrets": {"createScope", "putAcl"},
+}
+RESOURCE_CHANGES = {
+    "unityCatalog": {"createCatalog", "createSchema", "deleteTable", "deleteVolume", "createTable", "updateTables",
+                     "createVolume"},
+    "clusters": {"create", "delete"},
+}
+
+# tables_updated.sql operation_category
+TABLE_OPERATIONS = {
+    "getTable": "READ_METADATA",
+    "generateTemporaryTableCredential": "READ_DATA",
+    "createTable": "CREATE",
+    "updateTables": "MODIFY",
+}
+TABLE_READ_OPERATIONS = frozenset({"READ_METADATA", "READ_DATA"})
+
+# encrypt.sql operation_category
+ENCRYPTION_OPERATIONS = {
+    ("secrets", "getSecret"): "Secret Decryption/Retrieval",
+    ("secrets", "putSecret"): "Secret Encryption/Storage",
+    ("secrets", "deleteSecret"): "Secret Deletion",
+    ("secrets", "createScope"): "Secret Vault Management",
+    ("secrets", "deleteScope"): "Secret Vault Management",
+    ("secrets", "putAcl"): "Secret Access Control",
+    ("unityCatalog", "generateTemporaryTableCredential"): "Data Encryption Key Generation",
+    ("unityCatalog", "generateTemporaryVolumeCredential"): "File Encryption Key Generation",
+    ("unityCatalog", "generateTemporaryModelVersionCredential"): "Model Encryption Key Generation",
+    ("unityCatalog", "listCredentials"): "Credential Discovery",
+    ("unityCatalog", "listConnections"): "Credential Discovery",
+}
+
+
+@dataclass(frozen=True)
+class EventCategory:
+    """Every dashboard category an action belongs to; None where a dashboard ignores it."""
+    file_operation: Optional[str] = None
+    change_kind: Optional[str] = None
+    table_operation: Optional[str] = None
+    encryption_operation: Optional[str] = None
+
+
+UNCATEGORISED = EventCategory()
+
+
+def load_change_catalog(path: str) -> Iterable[Tuple[str, str]]:
+    """Read the tab-separated service_name/action_name catalog (the `aaa` file)."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f, delimiter="\t"):
+            service_name, action_name = (row.get("service_name") or "").strip(), (row.get("action_name") or "").strip()
+            if service_name and action_name:
+                yield service_name, action_name
+
+
+def build_lookup(change_catalog: Iterable[Tuple[str, str]] = ()) -> Dict[Tuple[str, str], EventCategory]:
+    """
+    Build the lookup table.
+
+    Catalog entries outside the permission/resource sets of the dashboards are still tracked as
+    changes, with change_kind "other".
+    """
+    lookup: Dict[Tuple[str, str], EventCategory] = {}
+
+    def tag(service_name: str, action_name: str, **fields: str) -> None:
+        key = (service_name, action_name)
+        lookup[key] = replace(lookup.get(key, UNCATEGORISED), **fields)
+
+    for service_name in FILE_SERVICES:
+        for action_name, operation in FILE_OPERATIONS.items():
+            tag(service_name, action_name, file_operation=operation)
+    for service_name, action_name in change_catalog:
+        tag(service_name, action_name, change_kind="other")
+    for kind, changes in (("permission", PERMISSION_CHANGES), ("resource", RESOURCE_CHANGES)):
+        for service_name, action_names in changes.items():
+            for action_name in action_names:
+                tag(service_name, action_name, change_kind=kind)
+    for action_name, operation in TABLE_OPERATIONS.items():
+        tag("unityCatalog", action_name, table_operation=operation)
+    for (service_name, action_name), operation in ENCRYPTION_OPERATIONS.items():
+        tag(service_name, action_name, encryption_operation=operation)
+    return lookup
+
+
+def load_sensitive_tables(path: str) -> Dict[str, str]:
+    """
+    Read an export of the monitoring.sensitive_tables registry.
+
+    Expects a CSV with catalog_name, schema_name, table_name and sensitivity_level columns and
+    returns {"catalog.schema.table": sensitivity_level}.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return {
+            f"{row['catalog_name']}.{row['schema_name']}.{row['table_name']}": row.get("sensitivity_level") or "UNKNOWN"
+            for row in csv.DictReader(f)
+        }
@@ -0,0 +1,66 @@
+# audit_kpi/runner.py
+"""
+Incrementally update the security dashboard KPIs from exported audit events.
+
+Reads the JSONL exports given on the command line (or stdin), resuming from the checkpoint so
+only events appended since the previous run are processed, then prints the KPIs as JSON.
+
+    python -m audit_kpi.runner --catalog aaa --sensitive-tables sensitive_tables.csv \\
+        --checkpoint audit_kpi_state.json exports/audit-*.jsonl
+"""
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+
+from .catalog import build_lookup, load_change_catalog, load_sensitive_tables
+from .engine import PROTECTED_PATH, AuditKpiEngine
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*", help="JSONL audit exports; stdin when omitted")
+    parser.add_argument("--catalog", help="Tab-separated service_name/action_name change catalog")
+    parser.add_argument("--sensitive-tables", help="CSV export of the sensitive_tables registry")
+    parser.add_argument("--checkpoint", help="State file to resume from and update")
+    parser.add_argument("--protected-path", default=PROTECTED_PATH)
+    parser.add_argument("--top", type=int, default=10, help="Rows in each top-N table")
+    parser.add_argument("--now", type=float, help="Epoch seconds the windows end at; defaults to the current time")
+    args = parser.parse_args(argv)
+
+    engine = AuditKpiEngine(
+        build_lookup(load_change_catalog(args.catalog) if args.catalog else ()),
+        sensitive_tables=load_sensitive_tables(args.sensitive_tables) if args.sensitive_tables else None,
+        protected_path=args.protected_path,
+    )
+    if args.checkpoint:
+        engine.load_checkpoint(args.checkpoint)
+
+    if args.files:
+        for path in args.files:
+            engine.ingest_file(path)
+    else:
+        engine.ingest_lines(sys.stdin.buffer)
+
+    if args.checkpoint:
+        engine.save_checkpoint(args.checkpoint)
+
+    report = {
+        "kpis": engine.kpis(now=args.now if args.now is not None else time.time()),
+        "top_file_users_30d": engine.top("file_user", "30d", args.top),
+        "most_accessed_files_30d": engine.top("file_path", "30d", args.top),
+        "top_change_actors_30d": engine.top("change_user", "30d", args.top),
+        "top_sensitive_tables_90d": engine.top("table_access", "90d", args.top),
+        "events": {
+            "seen": engine.events_seen,
+            "counted": engine.events_counted,
+            "skipped": engine.events_skipped,
+        },
+    }
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
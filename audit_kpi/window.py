@@ -0,0 +1,83 @@
+# audit_kpi/window.py
+import heapq
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+class RollingWindow:
+    """
+    Time-bucketed counters over a sliding window, with running totals.
+
+    Counts are kept per bucket and per dimension (e.g. "file_user" -> {email: count}) and are also
+    added to window-wide totals, which are decremented when a bucket falls out of the window.
+    count and distinct are therefore O(1) and never rescan buckets.
+    """
+
+    def __init__(self, window_seconds: int, bucket_seconds: int = 3600):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.buckets: Dict[int, Dict[str, Counter]] = {}
+        self.totals: Dict[str, Counter] = {}
+        self._bucket_heap: List[int] = []
+        self._oldest_allowed = None
+
+    def bucket_of(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+    def add(self, timestamp: float, dimension: str, key: str, count: int = 1) -> bool:
+        """Count an event; False when it is already older than the window."""
+        start = self.bucket_of(timestamp)
+        if self._oldest_allowed is not None and start < self._oldest_allowed:
+            return False
+        bucket = self.buckets.get(start)
+        if bucket is None:
+            bucket = self.buckets[start] = {}
+            heapq.heappush(self._bucket_heap, start)
+        bucket.setdefault(dimension, Counter())[key] += count
+        self.totals.setdefault(dimension, Counter())[key] += count
+        return True
+
+    def advance(self, now: float) -> None:
+        """Drop buckets that ended before now - window_seconds."""
+        oldest_allowed = self.bucket_of(now - self.window_seconds) + self.bucket_seconds
+        if self._oldest_allowed is not None and oldest_allowed <= self._oldest_allowed:
+            return
+        self._oldest_allowed = oldest_allowed
+        while self._bucket_heap and self._bucket_heap[0] < oldest_allowed:
+            for dimension, counts in self.buckets.pop(heapq.heappop(self._bucket_heap)).items():
+                totals = self.totals[dimension]
+                totals.subtract(counts)
+                for key in counts:
+                    if totals[key] <= 0:
+                        del totals[key]
+
+    def count(self, dimension: str, key: str) -> int:
+        return self.totals.get(dimension, Counter()).get(key, 0)
+
+    def distinct(self, dimension: str) -> int:
+        return len(self.totals.get(dimension, ()))
+
+    def top(self, dimension: str, n: int = 10) -> List[Tuple[str, int]]:
+        return self.totals.get(dimension, Counter()).most_common(n)
+
+    def series(self, dimension: str, key: str) -> List[Tuple[int, int]]:
+        """(bucket_start, count) for every bucket in the window, oldest first."""
+        return [(start, self.buckets[start].get(dimension, Counter()).get(key, 0)) for start in sorted(self.buckets)]
+
+    def to_state(self) -> dict:
+        return {
+            "oldest_allowed": self._oldest_allowed,
+            "buckets": {
+                str(start): {dimension: dict(counts) for dimension, counts in bucket.items()}
+                for start, bucket in self.buckets.items()
+            },
+        }
+
+    def load_state(self, state: dict) -> None:
+        self.buckets, self.totals, self._bucket_heap = {}, {}, []
+        self._oldest_allowed = None
+        for start, bucket in state.get("buckets", {}).items():
+            for dimension, counts in bucket.items():
+                for key, count in counts.items():
+                    self.add(int(start), dimension, key, count)
+        self._oldest_allowed = state.get("oldest_allowed")
@@ -1,24 +1,34 @@
+import logging
 from input_management_app.input_management.service.RequestStoreService import RequestStoreService
 
+logger = logging.getLogger(__name__)
+
 
 class DynamoDbService(RequestStoreService):
     async def put(self, request_id: str) -> dict:
-        print(f"DynamoDbService: put called with request_id: {request_id}")
+        logger.debug("DynamoDbService: put called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": "created",
         }
 
     async def get(self, request_id: str) -> dict:
-        print(f"DynamoDbService: get called with request_id: {request_id}")
+        logger.debug("DynamoDbService: get called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": "completed",
         }
 
     async def update(self, request_id: str, status: str) -> dict:
-        print(f"DynamoDbService: update called with request_id: {request_id}")
+        logger.debug("DynamoDbService: update called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": status,
-        }
\ No newline at end of file
+        }
+
+    async def upsert(self, request_id: str) -> dict:
+        logger.debug("DynamoDbService: upsert called with request_id: %s", request_id)
+        return {
+            "request_id": request_id,
+            "status": "created",
+        }
@@ -1,10 +1,18 @@
+import logging
+from input_management_app.cpu.text import ocr_text_is_valid
 from input_management_app.input_management.service.OcrService import OcrService
 
+logger = logging.getLogger(__name__)
+
 
 class TextractService(OcrService):
     async def perform_ocr(self, document_data: dict) -> dict:
-        print(f"TextractService: perform_ocr called with document_data: {document_data}")
+        logger.debug("TextractService: perform_ocr called for document fields: %s", list(document_data))
         return {
             "text": "Sample OCR text",
             "language": "en"
-        }
\ No newline at end of file
+        }
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        logger.debug("TextractService: validate_ocr_response called for document fields: %s", list(document_data))
+        return await ocr_text_is_valid(document_data.get("text") or "")
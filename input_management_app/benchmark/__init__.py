@@ -0,0 +1,19 @@
+# benchmark/__init__.py
+from .fakes import (
+    FakeClassificationService,
+    FakeOcrService,
+    FakeRequestStoreService,
+    FakeStorageService,
+    LatencyProfile,
+)
+from .runner import BenchmarkConfig, run_benchmark
+
+__all__ = [
+    'BenchmarkConfig',
+    'FakeClassificationService',
+    'FakeOcrService',
+    'FakeRequestStoreService',
+    'FakeStorageService',
+    'LatencyProfile',
+    'run_benchmark',
+]
@@ -0,0 +1,167 @@
+# benchmark/fakes.py
+import asyncio
+import math
+import random
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional
+
+from input_management_app.input_management.service.ClassificationService import ClassificationService
+from input_management_app.input_management.service.OcrService import OcrService
+from input_management_app.input_management.service.RequestStoreService import RequestStoreService
+from input_management_app.input_management.service.StorageService import StorageService
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z_99 = 2.326
+
+
+class SimulatedBackendError(Exception):
+    """Raised by fake services to simulate a backend failure."""
+
+
+@dataclass
+class LatencyProfile:
+    """
+    Log-normal latency distribution given by its median and p99 in seconds, plus an error rate.
+
+    The defaults are zero latency and no errors.
+    """
+    median: float = 0.0
+    p99: float = 0.0
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+        if self.median > 0 and self.p99 > self.median:
+            self._mu = math.log(self.median)
+            self._sigma = math.log(self.p99 / self.median) / _Z_99
+        else:
+            self._mu = None
+
+    def sample(self) -> float:
+        if self.median <= 0:
+            return 0.0
+        if self._mu is None:
+            return self.median
+        return self._rng.lognormvariate(self._mu, self._sigma)
+
+    async def simulate(self, name: str) -> None:
+        """Sleep for a sampled latency, then fail with the configured probability."""
+        delay = self.sample()
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            raise SimulatedBackendError(f"Simulated {name} failure")
+
+
+class FakeOcrService(OcrService):
+    def __init__(self, latency: Optional[LatencyProfile] = None, text_size: int = 2048):
+        super().__init__()
+        self.latency = latency or LatencyProfile()
+        self.text = "x" * text_size
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        await self.latency.simulate("OCR")
+        return {
+            "text": self.text,
+            "language": "en"
+        }
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return bool(document_data.get("text"))
+
+
+class FakeClassificationService(ClassificationService):
+    """Fake model endpoint; a batch costs one latency sample, like a real batched endpoint."""
+
+    def __init__(self, latency: Optional[LatencyProfile] = None):
+        super().__init__()
+        self.latency = latency or LatencyProfile()
+
+    async def classify_document(self, document_data: dict) -> dict:
+        return (await self.classify_documents([document_data]))[0]
+
+    async def classify_documents(self, documents: List[dict]) -> List[dict]:
+        model_input = await self.prepare_model_input({"documents": documents})
+        await self.latency.simulate("classification")
+        return [{"document_type": "benchmark", "confidence": 0.9} for _ in model_input["inputs"]]
+
+    async def prepare_model_input(self, document_data: dict) -> dict:
+        return {
+            "inputs": document_data.get("documents", [document_data]),
+        }
+
+    async def validate_model_response(self, document_data: dict) -> dict:
+        return document_data
+
+
+class FakeStorageService(StorageService):
+    """In-memory StorageService; each uploaded part costs one latency sample."""
+
+    def __init__(self, latency: Optional[LatencyProfile] = None, part_size: int = 8 * 1024 * 1024,
+                 max_concurrency: int = 4):
+        super().__init__(part_size=part_size, max_concurrency=max_concurrency)
+        self.latency = latency or LatencyProfile()
+        self.files: Dict[str, bytes] = {}
+
+    async def create_upload(self, path: str) -> dict:
+        return {"path": path, "parts": {}}
+
+    async def upload_part(self, upload: dict, part_number: int, data: bytes) -> int:
+        await self.latency.simulate("storage")
+        upload["parts"][part_number] = data
+        return part_number
+
+    async def complete_upload(self, upload: dict, parts: List[int]) -> dict:
+        self.files[upload["path"]] = b"".join(upload["parts"][n] for n in parts)
+        return {
+            "path": upload["path"],
+            "size": len(self.files[upload["path"]]),
+            "parts": len(parts),
+        }
+
+    async def abort_upload(self, upload: dict) -> None:
+        upload["parts"].clear()
+
+    async def get_file(self, path: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        data = self.files[path]
+        chunk_size = chunk_size or self.part_size
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset:offset + chunk_size]
+
+    async def list_files(self, prefix: str = "", page_size: int = 1000, page_token: Optional[str] = None) -> dict:
+        matching = sorted(p for p in self.files if p.startswith(prefix) and (page_token is None or p > page_token))
+        page = matching[:page_size]
+        return {
+            "files": page,
+            "next_page_token": page[-1] if len(matching) > page_size else None,
+        }
+
+
+class FakeRequestStoreService(RequestStoreService):
+    """In-memory request store; every call costs one latency sample."""
+
+    def __init__(self, latency: Optional[LatencyProfile] = None):
+        super().__init__()
+        self.latency = latency or LatencyProfile()
+        self.records: Dict[str, dict] = {}
+        self.writes = 0
+
+    async def put(self, request_id: str) -> dict:
+        await self.latency.simulate("request store")
+        self.writes += 1
+        self.records[request_id] = {"request_id": request_id, "status": "PENDING"}
+        return dict(self.records[request_id])
+
+    async def get(self, request_id: str) -> dict:
+        await self.latency.simulate("request store")
+        return dict(self.records.get(request_id, {}))
+
+    async def update(self, request_id: str, status: str) -> dict:
+        await self.latency.simulate("request store")
+        self.writes += 1
+        self.records[request_id] = {"request_id": request_id, "status": status}
+        return dict(self.records[request_id])
+
+    async def upsert(self, request_id: str) -> dict:
+        return await self.put(request_id)
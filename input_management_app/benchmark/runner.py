@@ -0,0 +1,244 @@
+# benchmark/runner.py
+"""
+Load-test harness for the /api/request/request path.
+
+Drives the FastAPI app in-process (via httpx's ASGI transport, backed by fake services) or a
+running server over a socket, at fixed concurrency (closed loop) or a Poisson arrival rate (open
+loop), and prints a JSON report with RPS, latency percentiles and peak RSS.
+
+    python -m input_management_app.benchmark.runner --concurrency 32 --requests 2000 \\
+        --ocr-latency 0.8,4.0 --classification-latency 0.2,1.0
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import resource
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI
+
+from input_management_app.benchmark.fakes import (
+    FakeClassificationService,
+    FakeOcrService,
+    FakeRequestStoreService,
+    FakeStorageService,
+    LatencyProfile,
+)
+from input_management_app.input_management.api.routes.request import create_request_router
+from input_management_app.input_management.InputManagementWorkflow import InputManagementWorkflow
+
+REQUEST_PATH = "/api/request/request"
+
+
+@dataclass
+class BenchmarkConfig:
+    base_url: Optional[str] = None
+    concurrency: int = 16
+    rate: Optional[float] = None
+    requests: int = 1000
+    duration: Optional[float] = None
+    corpus: Optional[str] = None
+    document_size: int = 4096
+    ocr_text_size: int = 2048
+    ocr_latency: LatencyProfile = field(default_factory=LatencyProfile)
+    classification_latency: LatencyProfile = field(default_factory=LatencyProfile)
+    storage_latency: LatencyProfile = field(default_factory=LatencyProfile)
+    request_store_latency: LatencyProfile = field(default_factory=LatencyProfile)
+    seed: int = 0
+
+
+def seeded_latency(profile: LatencyProfile, seed: int, backend: str) -> LatencyProfile:
+    """A copy of `profile` with its own RNG; unseeded profiles get a seed derived from `seed` and `backend`."""
+    if profile.seed is not None:
+        return replace(profile)
+    return replace(profile, seed=random.Random(f"{seed}:{backend}").getrandbits(64))
+
+
+def build_app(config: BenchmarkConfig) -> FastAPI:
+    """
+    Build an app whose workflow runs entirely on fake services.
+
+    Every backend samples latency and errors from its own RNG seeded from config.seed, so runs with
+    the same seed see the same per-backend sequences.
+    """
+    workflow = InputManagementWorkflow(
+        extraction_service=None,
+        classification_service=FakeClassificationService(
+            seeded_latency(config.classification_latency, config.seed, "classification")
+        ),
+        storage_service=FakeStorageService(seeded_latency(config.storage_latency, config.seed, "storage")),
+        ocr_service=FakeOcrService(
+            seeded_latency(config.ocr_latency, config.seed, "ocr"), text_size=config.ocr_text_size
+        ),
+        request_store_service=FakeRequestStoreService(
+            seeded_latency(config.request_store_latency, config.seed, "request_store")
+        ),
+        logger=logging.getLogger("benchmark"),
+    )
+    app = FastAPI()
+    app.include_router(create_request_router(workflow=workflow))
+    return app
+
+
+def load_documents(config: BenchmarkConfig) -> List[dict]:
+    """Documents to send: each line of a requests.jsonl-style corpus, or one synthetic payload."""
+    if config.corpus:
+        with open(config.corpus, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return [{"content": "x" * config.document_size}]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class _Recorder:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.status_counts: Dict[str, int] = {}
+        self.errors = 0
+
+    def record(self, started: float, status: str) -> None:
+        self.latencies.append(time.perf_counter() - started)
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if not status.startswith("2"):
+            self.errors += 1
+
+
+async def _send(client: httpx.AsyncClient, document: dict, recorder: _Recorder, started: float) -> None:
+    try:
+        response = await client.post(REQUEST_PATH, json=document, headers={"x-request-id": str(uuid.uuid4())})
+        recorder.record(started, str(response.status_code))
+    except httpx.HTTPError as exc:
+        recorder.record(started, type(exc).__name__)
+
+
+async def _closed_loop(client: httpx.AsyncClient, config: BenchmarkConfig, documents: List[dict],
+                       recorder: _Recorder, deadline: float) -> None:
+    sent = 0
+
+    async def user() -> None:
+        nonlocal sent
+        while sent < config.requests and time.perf_counter() < deadline:
+            document = documents[sent % len(documents)]
+            sent += 1
+            await _send(client, document, recorder, time.perf_counter())
+
+    await asyncio.gather(*(user() for _ in range(config.concurrency)))
+
+
+async def _open_loop(client: httpx.AsyncClient, config: BenchmarkConfig, documents: List[dict],
+                     recorder: _Recorder, deadline: float) -> None:
+    rng = random.Random(config.seed)
+    tasks = set()
+    next_arrival = time.perf_counter()
+    for sent in range(config.requests):
+        next_arrival += rng.expovariate(config.rate)
+        if next_arrival >= deadline:
+            break
+        await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+        # Latency is measured from the scheduled arrival so a slow server cannot hide queueing delay
+        task = asyncio.create_task(_send(client, documents[sent % len(documents)], recorder, next_arrival))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    await asyncio.gather(*tasks)
+
+
+async def run_benchmark(config: BenchmarkConfig) -> dict:
+    """Run one benchmark and return the report."""
+    documents = load_documents(config)
+    if config.base_url:
+        transport = None
+        base_url = config.base_url
+    else:
+        transport = httpx.ASGITransport(app=build_app(config))
+        base_url = "http://benchmark"
+
+    limits = httpx.Limits(max_connections=None if config.rate else config.concurrency)
+    recorder = _Recorder()
+    started = time.perf_counter()
+    deadline = started + config.duration if config.duration else float("inf")
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, limits=limits, timeout=None) as client:
+        if config.rate:
+            await _open_loop(client, config, documents, recorder, deadline)
+        else:
+            await _closed_loop(client, config, documents, recorder, deadline)
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(recorder.latencies)
+    return {
+        "mode": "open_loop" if config.rate else "closed_loop",
+        "target": config.base_url or "in_process",
+        "concurrency": None if config.rate else config.concurrency,
+        "arrival_rate": config.rate,
+        "requests": len(latencies),
+        "errors": recorder.errors,
+        "status_counts": recorder.status_counts,
+        "elapsed_seconds": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_seconds": {
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": latencies[-1] if latencies else float("nan"),
+        },
+        # ru_maxrss is in KiB on Linux; over a socket this is the load generator's own RSS
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _latency_arg(value: str) -> LatencyProfile:
+    """Parse "median,p99[,error_rate]" in seconds."""
+    parts = [float(part) for part in value.split(",")]
+    if not 2 <= len(parts) <= 3:
+        raise argparse.ArgumentTypeError("expected median,p99[,error_rate]")
+    return LatencyProfile(*parts)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--concurrency", type=int, default=16, help="Closed-loop concurrent clients")
+    parser.add_argument("--rate", type=float, help="Open-loop arrival rate in requests/second")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--duration", type=float, help="Stop after this many seconds")
+    parser.add_argument("--corpus", help="Replay documents from a JSONL file")
+    parser.add_argument("--document-size", type=int, default=4096)
+    parser.add_argument("--ocr-text-size", type=int, default=2048)
+    for backend in ("ocr", "classification", "storage", "request-store"):
+        parser.add_argument(f"--{backend}-latency", type=_latency_arg, default=LatencyProfile(),
+                            help="median,p99[,error_rate] in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = BenchmarkConfig(
+        base_url=args.base_url,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        requests=args.requests,
+        duration=args.duration,
+        corpus=args.corpus,
+        document_size=args.document_size,
+        ocr_text_size=args.ocr_text_size,
+        ocr_latency=args.ocr_latency,
+        classification_latency=args.classification_latency,
+        storage_latency=args.storage_latency,
+        request_store_latency=args.request_store_latency,
+        seed=args.seed,
+    )
+    json.dump(asyncio.run(run_benchmark(config)), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# cpu/__init__.py
+"""
+CPU-bound document work run in the CpuExecutor's process pool.
+
+Modules in this package are imported by every pool worker, so they must stay free of side effects
+and depend only on the standard library.
+"""
+from .executor import CpuExecutor, cpu_bound, set_cpu_executor
+from .text import normalize_texts, ocr_text_is_valid
+
+__all__ = [
+    'cpu_bound',
+    'CpuExecutor',
+    'normalize_texts',
+    'ocr_text_is_valid',
+    'set_cpu_executor',
+]
@@ -0,0 +1,147 @@
+# cpu/executor.py
+import asyncio
+import functools
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class _SharedRef:
+    """Placeholder for a bytes argument that was moved into shared memory."""
+    name: str
+    size: int
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+def _invoke(module: str, qualname: str, args: Tuple[Any, ...], kwargs: dict) -> Any:
+    """Worker entry point: resolve the cpu_bound function by name and call the undecorated original."""
+    target: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    func = getattr(target, "__wrapped__", target)
+
+    attached: List[shared_memory.SharedMemory] = []
+    views: List[memoryview] = []
+
+    def resolve(value: Any) -> Any:
+        if isinstance(value, _SharedRef):
+            block = shared_memory.SharedMemory(name=value.name)
+            attached.append(block)
+            view = block.buf[:value.size]
+            readonly = view.toreadonly()
+            views.extend((readonly, view))
+            return readonly
+        return value
+
+    try:
+        return func(*(resolve(arg) for arg in args), **{key: resolve(value) for key, value in kwargs.items()})
+    finally:
+        for view in views:
+            view.release()
+        for block in attached:
+            block.close()
+
+
+class CpuExecutor:
+    """
+    Shared, pre-warmed process pool for CPU-bound document work.
+
+    Workers import each cpu_bound function by its module name, so those functions live in the
+    input_management_app.cpu package, which imports nothing but the standard library; importing
+    them from input_management would run the app's package __init__ in every worker.
+
+    bytes arguments of at least `shared_memory_threshold` bytes are copied once into a shared
+    memory block instead of being pickled, and arrive in the worker as a read-only memoryview.
+    Workers are started with `start_method` ("spawn" by default): forking a server that already
+    runs threads can copy locks held mid-operation into the child and deadlock it.
+    """
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            shared_memory_threshold: int = 256 * 1024,
+            start_method: str = "spawn"
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shared_memory_threshold = shared_memory_threshold
+        self.start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def start(self) -> None:
+        """Create the pool and spawn every worker up front so the first requests do not pay for it."""
+        if self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_up) for _ in range(self.max_workers)))
+
+    async def stop(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, True)
+
+    def _share(self, value: Any, blocks: List[shared_memory.SharedMemory]) -> Any:
+        if isinstance(value, (bytes, bytearray)) and len(value) >= self.shared_memory_threshold:
+            block = shared_memory.SharedMemory(create=True, size=len(value))
+            block.buf[:len(value)] = value
+            blocks.append(block)
+            return _SharedRef(block.name, len(value))
+        return value
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a cpu_bound function in the pool."""
+        if self._pool is None:
+            raise RuntimeError("CpuExecutor is not started")
+        blocks: List[shared_memory.SharedMemory] = []
+        try:
+            shared_args = tuple(self._share(arg, blocks) for arg in args)
+            shared_kwargs = {key: self._share(value, blocks) for key, value in kwargs.items()}
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool,
+                _invoke,
+                func.__module__,
+                func.__qualname__,
+                shared_args,
+                shared_kwargs,
+            )
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+
+_default_executor: Optional[CpuExecutor] = None
+
+
+def set_cpu_executor(executor: Optional[CpuExecutor]) -> None:
+    """Install the executor used by cpu_bound functions; None runs them inline."""
+    global _default_executor
+    _default_executor = executor
+
+
+def cpu_bound(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Mark a module-level function as CPU-bound.
+
+    The decorated function becomes a coroutine function that runs in the installed CpuExecutor,
+    or inline when none is installed (e.g. in tests). Arguments and results must be picklable.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _default_executor is None:
+            return func(*args, **kwargs)
+        return await _default_executor.run(func, *args, **kwargs)
+
+    return wrapper
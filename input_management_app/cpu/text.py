@@ -0,0 +1,42 @@
+# cpu/text.py
+import re
+import unicodedata
+from typing import List
+
+from .executor import cpu_bound
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    # NFKC folds ligatures and full-width forms that OCR engines emit; control characters are dropped
+    text = unicodedata.normalize("NFKC", text)
+    text = "".join(char for char in text if char in "\t\n\r" or unicodedata.category(char)[0] != "C")
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@cpu_bound
+def normalize_texts(texts: List[str]) -> List[str]:
+    """Normalize OCR text for the classification model: Unicode NFKC, no control characters, single spaces."""
+    return [_normalize(text) for text in texts]
+
+
+@cpu_bound
+def ocr_text_is_valid(text: str, max_garbage_ratio: float = 0.3) -> bool:
+    """
+    Whether OCR text looks like readable text.
+
+    Empty text, or text where more than max_garbage_ratio of the non-space characters are
+    replacement, control or private-use characters, is rejected.
+    """
+    checked = garbage = 0
+    letters = False
+    for char in text:
+        if char.isspace():
+            continue
+        checked += 1
+        if char == "�" or unicodedata.category(char) in ("Cc", "Cf", "Co", "Cs", "Cn"):
+            garbage += 1
+        elif char.isalnum():
+            letters = True
+    return letters and garbage <= max_garbage_ratio * checked
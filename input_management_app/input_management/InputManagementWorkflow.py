@@ -1,11 +1,16 @@
+import time
+from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 from common.logging.custom_logger import CustomLogger
-from temp.service import StorageService
-from temp.service.ClassificationService import ClassificationService
-from temp.service.OcrService import OcrService
-from temp.service.RequestStoreService import RequestStoreService
+from input_management_app.input_management.common.admission import AdmissionController
+from input_management_app.input_management.common.metrics import MetricsRegistry, default_registry
+from input_management_app.input_management.common.stage_scheduler import Stage, StageFailedError, StageScheduler
+from input_management_app.input_management.service.StorageService import StorageService
+from input_management_app.input_management.service.ClassificationService import ClassificationService
+from input_management_app.input_management.service.FeedbackSegmentWriter import FeedbackSegmentWriter
+from input_management_app.input_management.service.OcrService import OcrService
+from input_management_app.input_management.service.RequestStoreService import RequestStoreService
 
 
 class JobStatus(Enum):
@@ -25,54 +30,228 @@ class InputManagementWorkflow:
             storage_service: StorageService,
             ocr_service: OcrService,
             request_store_service: RequestStoreService,
-            logger: Optional[CustomLogger] = None
+            logger: Optional[CustomLogger] = None,
+            metrics: Optional[MetricsRegistry] = None,
+            backend_limits: Optional[Dict[str, AdmissionController]] = None,
+            confidence_threshold: Optional[float] = None,
+            progressive_page_steps: Sequence[int] = (1, 2, 4),
+            feedback_writer: Optional[FeedbackSegmentWriter] = None
     ):
-        """Initialize a workflow with required services."""
+        """
+        Initialize a workflow with required services.
+
+        backend_limits caps concurrent calls per backend, keyed by "ocr", "classification",
+        "storage" and "request_store"; calls beyond a limit wait or raise AdmissionRejectedError.
+        When confidence_threshold is set, documents with a "pages" list are classified
+        progressively: the leading progressive_page_steps pages are OCRed and classified first and
+        the remaining pages are only processed while the confidence stays below the threshold.
+        Manual feedback is appended to feedback_writer when one is given.
+        """
         self.extraction_service = extraction_service
         self.classification_service = classification_service
         self.storage_service = storage_service
         self.ocr_service = ocr_service
         self.request_store_service = request_store_service
         self.logger = logger
+        self.metrics = metrics or default_registry
+        self.backend_limits = backend_limits or {}
+        self.confidence_threshold = confidence_threshold
+        self.progressive_page_steps = progressive_page_steps
+        self.feedback_writer = feedback_writer
 
-    async def perform_classification(self, request_id: str, document_data: dict) -> dict:
-        """Orchestrate a full document processing workflow."""
-        if self.logger:
-            self.logger.info(f"Starting document processing workflow for request: {request_id}")
+    @asynccontextmanager
+    async def _backend_call(self, service: str, method: str) -> AsyncIterator[None]:
+        """Apply the backend's concurrency limit, if any, and record the call's latency."""
+        limiter = self.backend_limits.get(service)
+        if limiter is None:
+            async with self.metrics.timed("service_call", service=service, method=method):
+                yield
+            return
+        async with limiter.admit():
+            async with self.metrics.timed("service_call", service=service, method=method):
+                yield
+
+    async def _store_call(self, method: str, *args) -> dict:
+        """Call a request store method through _backend_call."""
+        async with self._backend_call("request_store", method):
+            return await getattr(self.request_store_service, method)(*args)
+
+    def build_stages(self, request_id: str, document_data: dict) -> List[Stage]:
+        """
+        Declare the workflow stages and their dependencies.
 
+        Classification and storage only need the raw document, so they run alongside OCR.
+        """
 
         # Step 1: OCR
-        self.logger.info("Starting OCR processing")
-        await self.request_store_service.put(request_id)
-        ocr_result = await self.ocr_service.perform_ocr(document_data)
-        is_valid = self.ocr_service.validate_ocr_response(ocr_result)
-        if is_valid:
-            await self.request_store_service.update(request_id, JobStatus.PENDING.value)
-            self.logger.info("OCR completed")
-        else:
-            await self.request_store_service.update(request_id, JobStatus.FAILED.value)
-            self.logger.info("OCR failed")
+        async def ocr(_: dict) -> dict:
+            if self.logger:
+                self.logger.info("Starting OCR processing")
+            async with self._backend_call("ocr", "perform_ocr"):
+                ocr_result = await self.ocr_service.perform_ocr(document_data)
+            if not await self.ocr_service.validate_ocr_response(ocr_result):
+                if self.logger:
+                    self.logger.info("OCR failed")
+                raise ValueError("OCR response failed validation")
+            await self._store_call("update", request_id, JobStatus.PENDING.value)
+            if self.logger:
+                self.logger.info("OCR completed")
+            return ocr_result
 
         # Step 2: Classification
-        self.logger.info("Starting Classification ")
-        await self.request_store_service.update(request_id, JobStatus.PENDING.value)
-        classification_result = await self.classification_service.classify_document(document_data)
-        await self.request_store_service.update(request_id, JobStatus.PENDING.value)
-        self.logger.info("Classification completed")
+        async def classification(_: dict) -> dict:
+            if self.logger:
+                self.logger.info("Starting Classification ")
+            async with self._backend_call("classification", "classify_document"):
+                classification_result = await self.classification_service.classify_document(document_data)
+            await self._store_call("update", request_id, JobStatus.PENDING.value)
+            if self.logger:
+                self.logger.info("Classification completed")
+            return classification_result
 
         # Step 3: Storage files/results
-        self.logger.info("Starting storing result")
-        await self.request_store_service.update(request_id, JobStatus.PENDING.value)
-        await self.storage_service.store_document(document_data)
-        self.logger.info("stored completed")
+        async def storage(_: dict) -> dict:
+            if self.logger:
+                self.logger.info("Starting storing result")
+            async with self._backend_call("storage", "store_document"):
+                stored = await self.storage_service.store_document(request_id, document_data)
+            await self._store_call("update", request_id, JobStatus.PENDING.value)
+            if self.logger:
+                self.logger.info("stored completed")
+            return stored
+
+        pages = document_data.get("pages")
+        if self.confidence_threshold is not None and isinstance(pages, list) and len(pages) > 1:
+            async def progressive_classification(_: dict) -> dict:
+                return await self.classify_progressively(request_id, document_data)
+
+            return [
+                Stage("progressive_classification", progressive_classification),
+                Stage("storage", storage),
+            ]
 
+        return [
+            Stage("ocr", ocr),
+            Stage("classification", classification),
+            Stage("storage", storage),
+        ]
+
+    async def classify_progressively(self, request_id: str, document_data: dict) -> dict:
+        """
+        OCR and classify growing page prefixes until the confidence reaches confidence_threshold.
+
+        Only the pages added by each step are OCRed; the classifier sees the document restricted
+        to the pages read so far together with their accumulated OCR text.
+        """
+        pages = document_data["pages"]
+        steps = sorted({step for step in self.progressive_page_steps if 0 < step < len(pages)}) + [len(pages)]
+        texts: List[str] = []
+        languages: List[str] = []
+        classification_result: dict = {}
+        processed = 0
+
+        for step in steps:
+            ocr_input = {**document_data, "pages": pages[processed:step], "first_page": processed}
+            async with self._backend_call("ocr", "perform_ocr"):
+                ocr_result = await self.ocr_service.perform_ocr(ocr_input)
+            if not await self.ocr_service.validate_ocr_response(ocr_result):
+                raise ValueError(f"OCR response for pages {processed}-{step - 1} failed validation")
+            texts.append(ocr_result.get("text") or "")
+            if ocr_result.get("language"):
+                languages.append(ocr_result["language"])
+            processed = step
+
+            classification_input = {
+                **document_data,
+                "pages": pages[:processed],
+                "text": "\n".join(texts),
+                "language": languages[0] if languages else None,
+            }
+            async with self._backend_call("classification", "classify_document"):
+                classification_result = await self.classification_service.classify_document(classification_input)
+            confidence = self.confidence_of(classification_result)
+            if confidence is not None and confidence >= self.confidence_threshold:
+                break
+
+        self.metrics.observe("progressive_pages_fraction", processed / len(pages))
+        if processed < len(pages):
+            self.metrics.inc("progressive_early_exits")
+        await self._store_call("update", request_id, JobStatus.PENDING.value)
         if self.logger:
-            self.logger.info(f"Document workflow completed for request: {request_id}")
+            self.logger.info("Progressive classification stopped after %s of %s pages", processed, len(pages))
 
         return {
+            "classification": classification_result,
+            "pages_processed": processed,
+            "page_count": len(pages),
+        }
+
+    @staticmethod
+    def confidence_of(classification_result: Any) -> Optional[float]:
+        """The confidence reported by the classifier, or None when it reports none."""
+        if not isinstance(classification_result, dict):
+            return None
+        confidence = classification_result.get("confidence")
+        if confidence is None:
+            return None
+        return min(1.0, max(0.0, float(confidence)))
+
+    async def perform_classification(
+            self,
+            request_id: str,
+            document_data: dict,
+            register: bool = True,
+            mark_failed: bool = True
+    ) -> dict:
+        """
+        Orchestrate a full document processing workflow.
+
+        Independent stages run concurrently; a failing stage cancels the others, marks the request
+        FAILED and re-raises as StageFailedError. Pass register=False when the caller has already
+        recorded the request in the request store, and mark_failed=False when a failure may still be
+        retried and the caller records FAILED once it is final.
+        """
+        if self.logger:
+            self.logger.info("Starting document processing workflow for request: %s", request_id)
+
+        if register:
+            await self._store_call("put", request_id)
+        await self._store_call("update", request_id, JobStatus.PENDING.value)
+
+        stage_timings: Dict[str, float] = {}
+        try:
+            async with self.metrics.timed("workflow"):
+                results = await StageScheduler(self.build_stages(request_id, document_data)).run(stage_timings)
+        except StageFailedError as exc:
+            if mark_failed:
+                await self._store_call("update", request_id, JobStatus.FAILED.value)
+            if self.logger:
+                self.logger.error("Document workflow failed for request: %s at stage %s", request_id, exc.stage)
+            raise
+
+        finally:
+            for stage, duration in stage_timings.items():
+                self.metrics.observe("workflow_stage_seconds", duration, stage=stage)
+
+        await self._store_call("update", request_id, JobStatus.COMPLETED.value)
+
+        if self.logger:
+            self.logger.info("Document workflow completed for request: %s stage timings: %s", request_id, stage_timings)
+
+        result = {
             "request_id": request_id,
             "status": "completed",
+            "stage_timings": stage_timings,
         }
+        progressive = results.get("progressive_classification")
+        if progressive is not None:
+            result["classification"] = progressive["classification"]
+            result["pages_processed"] = progressive["pages_processed"]
+            result["page_count"] = progressive["page_count"]
+        else:
+            result["classification"] = results.get("classification")
+        result["confidence"] = self.confidence_of(result["classification"])
+        return result
 
     async def perform_pre_validation(self):
         pass
@@ -86,14 +265,18 @@ class InputManagementWorkflow:
             self.logger.info("Starting OCR processing")
 
         ocr_result = await self.ocr_service.perform_ocr(document_data)
-        is_valid = self.ocr_service.validate_ocr_response(ocr_result)
+        is_valid = await self.ocr_service.validate_ocr_response(ocr_result)
 
-        if is_valid:
-            self.logger.info("OCR completed successfully")
-        else:
-            self.logger.error("OCR failed")
+        if self.logger:
+            if is_valid:
+                self.logger.info("OCR completed successfully")
+            else:
+                self.logger.error("OCR failed")
 
         return ocr_result
 
     async def perform_manualfeedback(self, document_data: dict) -> dict:
-        pass
\ No newline at end of file
+        """Append a feedback record to the feedback segments; it is durable once this returns."""
+        if self.feedback_writer is None:
+            raise RuntimeError("Feedback writer not configured")
+        return await self.feedback_writer.append({"received_at": time.time(), **document_data})
\ No newline at end of file
@@ -0,0 +1,41 @@
+# input_management/api/routes/metrics.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from typing import Optional
+
+from input_management_app.input_management.common.metrics import MetricsRegistry, default_registry
+from input_management_app.input_management.common.registry import ServiceRegistry
+
+OPENMETRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def create_metrics_router(
+        registry: Optional[MetricsRegistry] = None,
+        prefix: str = "",
+        services: Optional[ServiceRegistry] = None,
+) -> APIRouter:
+    """
+    Expose workflow metrics for Prometheus/Datadog openmetrics scraping.
+
+    When services is given, GET /metrics/services returns its per-service import and init cost.
+    """
+    registry = registry or default_registry
+    router = APIRouter(prefix=prefix, tags=["metrics"])
+
+    @router.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Metrics in Prometheus text exposition format."""
+        return PlainTextResponse(registry.render(), media_type=OPENMETRICS_CONTENT_TYPE)
+
+    @router.get("/metrics/summary")
+    async def metrics_summary():
+        """p50/p95/p99 per histogram plus counters and gauges, as JSON."""
+        return registry.snapshot()
+
+    if services is not None:
+        @router.get("/metrics/services")
+        async def services_report():
+            """Import and init seconds per registered service, slowest first; unloaded services have none."""
+            return services.startup_report()
+
+    return router
@@ -1,64 +1,506 @@
 # input_management/api/workflow.py
-from fastapi import APIRouter, Depends, Header, Body, HTTPException
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, Depends, Header, Body, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Collection, Dict, Any, Optional
+import asyncio
+import copy
+import time
 import uuid
 
-from input_management_app.input_management.schemas import ClassificationResponse
-from temp.InputManagementWorkflow import InputManagementWorkflow
+from input_management_app.cpu.executor import CpuExecutor, set_cpu_executor
+from input_management_app.input_management.common.admission import AdmissionController, AdmissionRejectedError
+from input_management_app.input_management.common.document import DocumentHandle, DocumentTooLargeError
+from input_management_app.input_management.common.fair_scheduler import BATCH, INTERACTIVE, FairScheduler
+from input_management_app.input_management.common.fast_json import FastJSONResponse, dumps, loads
+from input_management_app.input_management.common.fingerprint import content_hash
+from input_management_app.input_management.common.ndjson import NdjsonLineTooLongError, iter_ndjson
+from input_management_app.input_management.common.single_flight import SingleFlight
+from input_management_app.input_management.common.stage_scheduler import StageFailedError
+from input_management_app.input_management.common.worker_pool import WorkerPool, WorkerPoolFullError
+from input_management_app.input_management.schemas import (
+    BaseResponse,
+    ClassificationResponse,
+    DocumentRequest,
+    ErrorResponse,
+    JobAcceptedResponse,
+    JobStatusResponse,
+)
+from input_management_app.input_management.service.BufferedRequestStoreService import (
+    TERMINAL_STATUSES,
+    BufferedRequestStoreService,
+)
+from input_management_app.input_management.service.CachedRequestStoreService import CachedRequestStoreService
+from input_management_app.input_management.service.JobQueueService import JobQueueService
+from input_management_app.input_management.service.RequestStoreService import RequestStoreService
+from input_management_app.input_management.InputManagementWorkflow import InputManagementWorkflow, JobStatus
 
 
 def create_request_router(
         workflow: Optional[InputManagementWorkflow] = None,
-        prefix: str = "/api"
+        prefix: str = "/api",
+        worker_pool: Optional[WorkerPool] = None,
+        single_flight: Optional[SingleFlight] = None,
+        max_upload_bytes: int = 200 * 1024 * 1024,
+        upload_memory_bytes: int = 1024 * 1024,
+        admission: Optional[AdmissionController] = None,
+        cpu_executor: Optional[CpuExecutor] = None,
+        job_queue: Optional[JobQueueService] = None,
+        bulk_concurrency: int = 16,
+        status_cache: Optional[CachedRequestStoreService] = None,
+        status_poll_interval: float = 1.0,
+        scheduler: Optional[FairScheduler] = None,
+        default_tenant: str = "default",
+        tenants: Collection[str] = (),
 ) -> APIRouter:
+    """
+    Create the request router.
+
+    When a worker_pool is given, POST /request runs in asynchronous job mode: the request is recorded,
+    a 202 with the request_id is returned immediately and the pool runs the workflow in the background.
+    When single_flight is given, duplicate requests with the same request id or document content
+    attach to the pipeline already running for it instead of starting a new one.
+    POST /request/upload streams the raw body to a spool that stays in memory up to
+    upload_memory_bytes and moves to a temp file beyond that; bodies over max_upload_bytes get a 413.
+    When admission is given, inline requests queue for a workflow slot and are shed with 429/503 and
+    Retry-After once its queue is full or the queue wait runs past its deadline; backend limit
+    rejections from inside the workflow are returned the same way.
+    When cpu_executor is given, it is started with the app and installed for cpu_bound functions.
+    When job_queue is given, JSON requests are enqueued on the durable queue for JobQueueWorker
+    processes (python -m input_management_app.input_management.queue_worker) instead of the
+    in-process pool; streamed uploads keep using the pool or run inline.
+    When status_cache is given, status reads are served from it and the long-poll/SSE endpoints wake
+    as soon as the workflow writes a new status through it; it should wrap the workflow's store.
+    Without it they re-read the store every status_poll_interval seconds.
+    When scheduler is given, it replaces admission: workflow runs are queued per tenant and priority,
+    with single requests as interactive and bulk lines and worker pool jobs as batch. The tenant is
+    the X-Tenant header when it names one of `tenants` and default_tenant otherwise, so unknown or
+    spoofed headers cannot escape their caps or add scheduler flows and metric labels. Fairness
+    across tenants therefore needs a process that serves every tenant in `tenants`; a process
+    serving a single tenant only arbitrates between interactive and batch runs.
+    """
+    allowed_tenants = frozenset(tenants) | {default_tenant}
+
+    def resolve_tenant(x_tenant: Optional[str]) -> str:
+        return x_tenant if x_tenant in allowed_tenants else default_tenant
 
     router = APIRouter(prefix=f"{prefix}/request", tags=["request"])
 
+    if cpu_executor is not None:
+        async def start_cpu_executor() -> None:
+            await cpu_executor.start()
+            set_cpu_executor(cpu_executor)
+
+        async def stop_cpu_executor() -> None:
+            set_cpu_executor(None)
+            await cpu_executor.stop()
+
+        router.add_event_handler("startup", start_cpu_executor)
+        router.add_event_handler("shutdown", stop_cpu_executor)
+
+    if worker_pool is not None:
+        router.add_event_handler("startup", worker_pool.start)
+        router.add_event_handler("shutdown", worker_pool.stop)
+
+    if workflow is not None and workflow.feedback_writer is not None:
+        router.add_event_handler("startup", workflow.feedback_writer.start)
+        router.add_event_handler("shutdown", workflow.feedback_writer.stop)
+
     async def get_workflow_instance() -> InputManagementWorkflow:
         """Dependency to get workflow instance."""
         if workflow is None:
             raise HTTPException(status_code=500, detail="Workflow not configured")
         return workflow
 
-    @router.post("/request", response_model=ClassificationResponse)
+    async def classify(
+            workflow: InputManagementWorkflow,
+            request_id: str,
+            document_data: Dict[str, Any],
+            register: bool = True,
+    ) -> dict:
+        """
+        Run the workflow, deduplicated through single_flight when configured.
+
+        A request served by another run, or by a remembered result, did not write its own statuses,
+        so the terminal status is recorded under its request_id and the result carries its own
+        request_id. This also covers retries of the same request id, whose record job mode has just
+        reset to PENDING.
+        """
+        if single_flight is None:
+            return await workflow.perform_classification(request_id, document_data, register=register)
+
+        request_key = f"request:{request_id}"
+        executed = False
+
+        async def execute() -> dict:
+            nonlocal executed
+            executed = True
+            return await workflow.perform_classification(request_id, document_data, register=register)
+
+        try:
+            result = await single_flight.run([request_key, f"content:{content_hash(document_data)}"], execute)
+        except Exception:
+            if not executed:
+                await record_attached(workflow, request_id, JobStatus.FAILED.value, register)
+            raise
+        if executed:
+            return result
+        await record_attached(workflow, request_id, JobStatus.COMPLETED.value, register)
+        return {**result, "request_id": request_id}
+
+    async def record_attached(
+            workflow: InputManagementWorkflow,
+            request_id: str,
+            status: str,
+            register: bool,
+    ) -> None:
+        if register:
+            await workflow.request_store_service.put(request_id)
+        await workflow.request_store_service.update(request_id, status)
+
+    @asynccontextmanager
+    async def admitted(tenant: str, priority: str) -> AsyncIterator[None]:
+        """Hold a workflow slot from the scheduler, or from admission when there is no scheduler."""
+        if scheduler is not None:
+            async with scheduler.admit(tenant, priority):
+                yield
+        elif admission is not None and priority == INTERACTIVE:
+            async with admission.admit():
+                yield
+        else:
+            yield
+
+    async def run_job(
+            workflow: InputManagementWorkflow,
+            request_id: str,
+            document_data: Dict[str, Any],
+            on_done: Optional[Callable[[], None]] = None,
+            tenant: str = default_tenant,
+    ) -> None:
+        """Run the workflow for an accepted job, recording FAILED if it raises."""
+        try:
+            async with admitted(tenant, BATCH):
+                await classify(workflow, request_id, document_data, register=False)
+        except Exception:
+            await workflow.request_store_service.update(request_id, JobStatus.FAILED.value)
+            raise
+        finally:
+            if on_done:
+                on_done()
+
+    def accepted_response(request_id: str) -> FastJSONResponse:
+        return FastJSONResponse(
+            status_code=202,
+            content=JobAcceptedResponse(request_id=request_id, status=JobStatus.PENDING.value).model_dump(),
+        )
+
+    async def handle_document(
+            workflow: InputManagementWorkflow,
+            request_id: str,
+            document_data: Dict[str, Any],
+            on_done: Optional[Callable[[], None]] = None,
+            tenant: str = default_tenant,
+    ):
+        """Run the workflow inline, or hand it to the job queue or worker pool in asynchronous job mode."""
+        if job_queue is not None and not isinstance(document_data.get("document"), DocumentHandle):
+            await workflow.request_store_service.put(request_id)
+            await job_queue.enqueue({"request_id": request_id, "document_data": document_data}, job_id=request_id)
+            return accepted_response(request_id)
+
+        if worker_pool is not None:
+            await workflow.request_store_service.put(request_id)
+            try:
+                worker_pool.submit(lambda: run_job(workflow, request_id, document_data, on_done, tenant))
+            except WorkerPoolFullError as exc:
+                await workflow.request_store_service.update(request_id, JobStatus.FAILED.value)
+                if on_done:
+                    on_done()
+                raise HTTPException(status_code=503, detail=str(exc))
+
+            return accepted_response(request_id)
+
+        try:
+            async with admitted(tenant, INTERACTIVE):
+                result = await classify(workflow, request_id, document_data)
+        except (AdmissionRejectedError, StageFailedError) as exc:
+            rejection = exc.error if isinstance(exc, StageFailedError) else exc
+            if not isinstance(rejection, AdmissionRejectedError):
+                raise
+            raise HTTPException(
+                status_code=rejection.status_code,
+                detail=str(rejection),
+                headers={"Retry-After": str(rejection.retry_after)},
+            )
+        finally:
+            if on_done:
+                on_done()
+
+        # Serialized directly; ClassificationResponse only documents the shape
+        return FastJSONResponse({
+            "request_id": request_id,
+            "success": True,
+            "classification_result": result,
+            "confidence": result.get("confidence"),
+        })
+
+    @router.post(
+        "/request",
+        response_model=ClassificationResponse,
+        response_class=FastJSONResponse,
+        responses={202: {"model": JobAcceptedResponse}},
+        openapi_extra={
+            "requestBody": {"required": True, "content": {"application/json": {"schema": DocumentRequest.model_json_schema()}}},
+        },
+    )
     async def process_document(
-            document_data: Dict[str, Any] = Body(...),
+            request: Request,
             workflow: InputManagementWorkflow = Depends(get_workflow_instance),
             x_request_id: Optional[str] = Header(None),
+            x_tenant: Optional[str] = Header(None),
     ):
-        """Process and classify a document."""
+        """
+        Process and classify a document.
+
+        The body is parsed with the fast JSON decoder and only the DocumentRequest metadata fields are
+        validated; the parsed dict itself is handed to the workflow so large fields are never copied.
+        """
+        try:
+            document_data = loads(await request.body())
+            DocumentRequest.model_validate(document_data)
+        except ValidationError as exc:
+            raise HTTPException(status_code=422, detail=exc.errors())
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=f"Invalid JSON body: {exc}")
+
         request_id = x_request_id or str(uuid.uuid4())
 
         if workflow.logger:
-            workflow.logger.info(f"Received classification request: {request_id}")
+            workflow.logger.info("Received classification request: %s", request_id)
+
+        return await handle_document(workflow, request_id, document_data, tenant=resolve_tenant(x_tenant))
+
+    @router.post(
+        "/request/upload",
+        response_model=ClassificationResponse,
+        response_class=FastJSONResponse,
+        responses={202: {"model": JobAcceptedResponse}, 413: {"model": ErrorResponse}},
+    )
+    async def upload_document(
+            request: Request,
+            workflow: InputManagementWorkflow = Depends(get_workflow_instance),
+            x_request_id: Optional[str] = Header(None),
+            x_filename: Optional[str] = Header(None),
+            x_tenant: Optional[str] = Header(None),
+    ):
+        """
+        Process and classify a document sent as the raw request body.
 
-        result = await workflow.perform_classification(request_id, document_data)
+        The body is streamed into a bounded spool instead of being parsed as JSON, and the workflow
+        receives {"document": DocumentHandle, "filename": ..., "content_type": ...}.
+        """
+        request_id = x_request_id or str(uuid.uuid4())
 
-        # Return formatted response
-        return ClassificationResponse(
+        if workflow.logger:
+            workflow.logger.info("Received upload request: %s", request_id)
+
+        try:
+            document = await DocumentHandle.from_stream(
+                request.stream(),
+                max_memory_size=upload_memory_bytes,
+                max_size=max_upload_bytes,
+                content_type=request.headers.get("content-type"),
+                filename=x_filename,
+            )
+        except DocumentTooLargeError as exc:
+            raise HTTPException(status_code=413, detail=str(exc))
+
+        document_data = {
+            "document": document,
+            "filename": document.filename,
+            "content_type": document.content_type,
+        }
+        return await handle_document(
+            workflow, request_id, document_data, on_done=document.close, tenant=resolve_tenant(x_tenant)
+        )
+
+    @router.post("/request/bulk")
+    async def process_bulk(
+            request: Request,
+            workflow: InputManagementWorkflow = Depends(get_workflow_instance),
+            x_tenant: Optional[str] = Header(None),
+    ):
+        """
+        Classify a streamed NDJSON batch, one document per line in the requests.jsonl format.
+
+        The body is spooled like an upload (in memory up to upload_memory_bytes, in a temp file beyond
+        that, 413 past max_upload_bytes) before the response starts: once a streaming response has
+        started, the server's disconnect listener consumes the remaining body messages. Up to
+        bulk_concurrency documents then run at once and one NDJSON result line is streamed back per
+        document as it completes. Status updates for the batch go through a shared
+        BufferedRequestStoreService.
+        """
+        try:
+            body = await DocumentHandle.from_stream(
+                request.stream(),
+                max_memory_size=upload_memory_bytes,
+                max_size=max_upload_bytes,
+            )
+        except DocumentTooLargeError as exc:
+            raise HTTPException(status_code=413, detail=str(exc))
+
+        request_store = BufferedRequestStoreService(workflow.request_store_service, logger=workflow.logger)
+        bulk_workflow = copy.copy(workflow)
+        bulk_workflow.request_store_service = request_store
+
+        async def run_one(line_number: int, document_data: Any) -> dict:
+            if isinstance(document_data, ValueError):
+                return {"line": line_number, "success": False, "error": f"Invalid JSON: {document_data}"}
+            if not isinstance(document_data, dict):
+                return {"line": line_number, "success": False, "error": "Line is not a JSON object"}
+            request_id = str(document_data.get("request_id") or uuid.uuid4())
+            try:
+                async with admitted(resolve_tenant(x_tenant), BATCH):
+                    result = await classify(bulk_workflow, request_id, document_data)
+            except Exception as exc:
+                return {"line": line_number, "request_id": request_id, "success": False, "error": str(exc)}
+            return {"line": line_number, "request_id": request_id, "success": True, "classification_result": result}
+
+        async def results() -> AsyncIterator[bytes]:
+            completed: asyncio.Queue = asyncio.Queue()
+            slots = asyncio.Semaphore(bulk_concurrency)
+            tasks = set()
+
+            async def run_and_report(line_number: int, document_data: Any) -> None:
+                try:
+                    await completed.put(await run_one(line_number, document_data))
+                finally:
+                    slots.release()
+
+            async def feed() -> None:
+                try:
+                    async for line_number, document_data in iter_ndjson(body.iter_chunks()):
+                        # Stop reading the body while bulk_concurrency documents are in flight
+                        await slots.acquire()
+                        task = asyncio.create_task(run_and_report(line_number, document_data))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                    if tasks:
+                        await asyncio.gather(*tasks)
+                except NdjsonLineTooLongError as exc:
+                    await completed.put({"success": False, "error": str(exc)})
+                finally:
+                    await completed.put(None)
+
+            await request_store.start()
+            feeder = asyncio.create_task(feed())
+            try:
+                while True:
+                    item = await completed.get()
+                    if item is None:
+                        break
+                    yield dumps(item) + b"\n"
+            finally:
+                feeder.cancel()
+                for task in list(tasks):
+                    task.cancel()
+                await asyncio.gather(feeder, *tasks, return_exceptions=True)
+                await request_store.stop()
+                body.close()
+
+        if workflow.logger:
+            workflow.logger.info("Received bulk classification request")
+
+        return StreamingResponse(results(), media_type="application/x-ndjson")
+
+    def status_store(workflow: InputManagementWorkflow) -> RequestStoreService:
+        return status_cache if status_cache is not None else workflow.request_store_service
+
+    async def read_status(workflow: InputManagementWorkflow, request_id: str) -> JobStatusResponse:
+        record = await status_store(workflow).get(request_id)
+        if not record:
+            raise HTTPException(status_code=404, detail=f"Request {request_id} not found")
+
+        status = str(record.get("status", JobStatus.PENDING.value)).upper()
+        return JobStatusResponse(
             request_id=request_id,
-            success=True,
-            classification_result=result,
-            confidence=1.0  # Set appropriate confidence value from result
+            success=status != JobStatus.FAILED.value,
+            status=status,
+            details=record,
         )
 
+    async def wait_for_status_change(request_id: str, timeout: float) -> None:
+        """Sleep until the cached status changes, or at most one poll interval without a cache."""
+        if status_cache is not None:
+            await status_cache.wait_for_change(request_id, min(timeout, status_poll_interval))
+        else:
+            await asyncio.sleep(min(timeout, status_poll_interval))
+
+    @router.get("/{request_id}", response_model=JobStatusResponse)
+    async def get_request_status(
+            request_id: str,
+            workflow: InputManagementWorkflow = Depends(get_workflow_instance),
+    ):
+        """Return the current status of a request from the request store."""
+        return await read_status(workflow, request_id)
+
+    @router.get("/{request_id}/wait", response_model=JobStatusResponse)
+    async def wait_request_status(
+            request_id: str,
+            timeout: float = Query(30.0, ge=0.0, le=120.0),
+            workflow: InputManagementWorkflow = Depends(get_workflow_instance),
+    ):
+        """Long-poll: return once the request reaches a terminal status or `timeout` seconds pass."""
+        deadline = time.monotonic() + timeout
+        response = await read_status(workflow, request_id)
+        while response.status not in TERMINAL_STATUSES and time.monotonic() < deadline:
+            await wait_for_status_change(request_id, deadline - time.monotonic())
+            response = await read_status(workflow, request_id)
+        return response
+
+    @router.get("/{request_id}/events")
+    async def stream_request_status(
+            request_id: str,
+            timeout: float = Query(300.0, ge=0.0, le=3600.0),
+            workflow: InputManagementWorkflow = Depends(get_workflow_instance),
+    ):
+        """Server-Sent Events: a `status` event per status change, ending at a terminal status or timeout."""
+        first = await read_status(workflow, request_id)
+
+        async def events() -> AsyncIterator[bytes]:
+            deadline = time.monotonic() + timeout
+            response, last_status = first, None
+            while True:
+                if response.status != last_status:
+                    last_status = response.status
+                    yield f"event: status\ndata: {response.model_dump_json()}\n\n".encode("utf-8")
+                if response.status in TERMINAL_STATUSES or time.monotonic() >= deadline:
+                    return
+                await wait_for_status_change(request_id, deadline - time.monotonic())
+                response = await read_status(workflow, request_id)
+
+        return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
     @router.post("/request/feedback", response_model=BaseResponse)
     async def process_feedback(
             feedback_data: Dict[str, Any] = Body(...),
             workflow: InputManagementWorkflow = Depends(get_workflow_instance),
             x_request_id: Optional[str] = Header(None),
     ):
-        """Process manual feedback for a document."""
+        """Record manual feedback for a document; it is batched into feedback segments in the background."""
         request_id = x_request_id or str(uuid.uuid4())
 
         if workflow.logger:
-            workflow.logger.info(f"Received feedback request: {request_id}")
+            workflow.logger.info("Received feedback request: %s", request_id)
 
-        await workflow.perform_manualfeedback(feedback_data)
+        try:
+            await workflow.perform_manualfeedback({"request_id": request_id, **feedback_data})
+        except RuntimeError as exc:
+            raise HTTPException(status_code=503, detail=str(exc))
 
         return BaseResponse(
             request_id=request_id,
             success=True
         )
 
-    return router
\ No newline at end of file
+    return router
@@ -1,22 +1,85 @@
-from temp.InputManagementWorkflow import InputManagementWorkflow
+import logging
+import os
+
+from input_management_app.cpu.executor import CpuExecutor
+from input_management_app.input_management.InputManagementWorkflow import InputManagementWorkflow
+from input_management_app.input_management.api.routes.metrics import create_metrics_router
+from input_management_app.input_management.common.fair_scheduler import FairScheduler
+from input_management_app.input_management.common.queued_logging import QueuedLogging
+from input_management_app.input_management.common.registry import service_registry
+from input_management_app.input_management.service.BatchingClassificationService import BatchingClassificationService
+from input_management_app.input_management.service.CachedRequestStoreService import CachedRequestStoreService
+from input_management_app.input_management.service.ClassificationService import ClassificationService
+from input_management_app.input_management.service.FeedbackSegmentWriter import FeedbackSegmentWriter
+from input_management_app.input_management.service.OcrService import OcrService
+from input_management_app.input_management.service.RequestStoreService import RequestStoreService
+
+logger = logging.getLogger("input_management")
+
+# Only this tenant's services are imported, so only its SDKs are loaded
+tenant = os.environ.get("INPUT_MANAGEMENT_TENANT", "pnc")
+# Log each service's import and init cost as it is loaded
+service_registry.logger = logger
+
+# The workflow writes statuses through the cache, so status polls wake without hitting the store
+status_cache = CachedRequestStoreService(service_registry.lazy(tenant, "request_store", RequestStoreService))
+
+# Manual feedback is batched into segments in storage; the request router starts and stops the writer
+# with the app. Every process needs its own write-ahead log directory
+feedback_writer = FeedbackSegmentWriter(
+    storage_service,
+    wal_dir=os.environ.get("INPUT_MANAGEMENT_FEEDBACK_WAL_DIR", "feedback-wal"),
+    logger=logger,
+)
 
 workflow = InputManagementWorkflow(
     extraction_service=extraction_service,
-    classification_service=classification_service,
+    # Concurrent requests share one model call per batch of up to 16 documents or 10 ms
+    classification_service=BatchingClassificationService(
+        service_registry.lazy(tenant, "classification", ClassificationService),
+        logger=logger,
+    ),
     storage_service=storage_service,
-    ocr_service=ocr_service,
-    request_store_service=request_store_service,
-    logger=logger
+    ocr_service=service_registry.lazy(tenant, "ocr", OcrService),
+    request_store_service=status_cache,
+    logger=logger,
+    feedback_writer=feedback_writer
 )
 
+# Interactive requests get 10x the share of batch work. This process serves only `tenant`, so the
+# router ignores X-Tenant headers and no per-tenant cap is set; tenant weights and caps apply when one
+# process is configured to serve several tenants through the router's `tenants`
+scheduler = FairScheduler(max_concurrency=32, max_batch_concurrency=24, max_queue_wait=30.0)
+
 # Create your app
 app = InputManagementApp(
     # ... your existing parameters
 )
 
+# From startup to shutdown, records reaching the root logger (the tenant services' module loggers and
+# anything else that propagates) are written by a background thread instead of on the event loop
+queued_logging = QueuedLogging(logging.getLogger())
+app.get_app().add_event_handler("startup", queued_logging.start)
+app.get_app().add_event_handler("shutdown", queued_logging.stop)
+# Construct the tenant's services at startup, so a broken registration fails the deploy rather than
+# the first request
+app.get_app().add_event_handler("startup", lambda: service_registry.load_tenant(tenant))
+
 # Register the workflow router
-workflow_router = create_workflow_router(workflow=workflow, prefix=app.api_prefix)
+workflow_router = create_workflow_router(
+    workflow=workflow,
+    prefix=app.api_prefix,
+    status_cache=status_cache,
+    scheduler=scheduler,
+    default_tenant=tenant,
+    # Spawned once at startup; OCR validation and model-input normalization run there instead of on
+    # the event loop
+    cpu_executor=CpuExecutor(max_workers=int(os.environ.get("INPUT_MANAGEMENT_CPU_WORKERS", "0")) or None),
+)
 app.include_router(workflow_router)
+
+# Expose workflow metrics for Datadog scraping
+app.include_router(create_metrics_router(services=service_registry))
 # # input_management/app.py
 # import uuid
 # from typing import List, Optional, Callable
@@ -1,4 +1,43 @@
 # input_management/common/__init__.py
+from .admission import AdmissionController, AdmissionRejectedError
+from .document import DocumentHandle, DocumentTooLargeError
+from .fair_scheduler import FairScheduler
+from .fast_json import FastJSONResponse
+from .fingerprint import content_hash
 from .health import create_health_router
+from .metrics import MetricsRegistry, default_registry
+from .queued_logging import QueuedLogging, QueuedLogHandler, install_queued_logging
+from .ndjson import NdjsonLineTooLongError, iter_ndjson
+from .registry import LazyService, ServiceRegistry, register_default_tenants, service_name, service_registry
+from .single_flight import SingleFlight
+from .stage_scheduler import Stage, StageFailedError, StageScheduler
+from .worker_pool import WorkerPool, WorkerPoolFullError
 
-__all__ = ['create_health_router']
\ No newline at end of file
+__all__ = [
+    'AdmissionController',
+    'AdmissionRejectedError',
+    'content_hash',
+    'create_health_router',
+    'DocumentHandle',
+    'DocumentTooLargeError',
+    'default_registry',
+    'FairScheduler',
+    'FastJSONResponse',
+    'install_queued_logging',
+    'iter_ndjson',
+    'LazyService',
+    'MetricsRegistry',
+    'NdjsonLineTooLongError',
+    'QueuedLogging',
+    'QueuedLogHandler',
+    'register_default_tenants',
+    'service_name',
+    'service_registry',
+    'ServiceRegistry',
+    'SingleFlight',
+    'Stage',
+    'StageFailedError',
+    'StageScheduler',
+    'WorkerPool',
+    'WorkerPoolFullError',
+]
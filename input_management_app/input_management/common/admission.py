@@ -0,0 +1,94 @@
+# input_management/common/admission.py
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from input_management_app.input_management.common.metrics import MetricsRegistry, default_registry
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when work is shed; carries the HTTP status and Retry-After seconds to return."""
+
+    def __init__(self, message: str, status_code: int = 503, retry_after: int = 1):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a bounded wait queue.
+
+    At most `max_concurrency` holders run at once and at most `max_queue` callers wait for a slot.
+    A caller arriving at a full queue is rejected with 429; a caller that waits longer than
+    `max_queue_wait` seconds is rejected with 503. Used both in front of the whole workflow and per
+    backend (OCR, classification, storage, request store).
+    """
+
+    def __init__(
+            self,
+            name: str,
+            max_concurrency: int,
+            max_queue: Optional[int] = None,
+            max_queue_wait: Optional[float] = None,
+            metrics: Optional[MetricsRegistry] = None
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.metrics = metrics or default_registry
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.queue_depth = 0
+
+    def _retry_after(self) -> int:
+        """Suggest roughly one queue wait, at least one second."""
+        return max(1, math.ceil(self.max_queue_wait or 1))
+
+    def _reject(self, reason: str, status_code: int) -> AdmissionRejectedError:
+        self.metrics.inc("admission_rejected_total", controller=self.name, reason=reason)
+        return AdmissionRejectedError(
+            f"{self.name} is overloaded ({reason})",
+            status_code=status_code,
+            retry_after=self._retry_after(),
+        )
+
+    def _update_gauges(self) -> None:
+        self.metrics.gauge_set("admission_queue_depth", self.queue_depth, controller=self.name)
+        self.metrics.gauge_set("admission_in_flight", self.in_flight, controller=self.name)
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block, or raise AdmissionRejectedError."""
+        if not self._slots.locked():
+            # A free slot is taken without suspending, so concurrent arrivals see it as taken
+            await self._slots.acquire()
+        else:
+            if self.max_queue is not None and self.queue_depth >= self.max_queue:
+                raise self._reject("queue_full", 429)
+
+            start = time.perf_counter()
+            self.queue_depth += 1
+            self._update_gauges()
+            try:
+                if self.max_queue_wait is None:
+                    await self._slots.acquire()
+                else:
+                    await asyncio.wait_for(self._slots.acquire(), timeout=self.max_queue_wait)
+            except asyncio.TimeoutError:
+                raise self._reject("queue_timeout", 503)
+            finally:
+                self.queue_depth -= 1
+                self.metrics.observe("admission_wait_seconds", time.perf_counter() - start, controller=self.name)
+
+        self.in_flight += 1
+        self._update_gauges()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+            self._update_gauges()
@@ -0,0 +1,96 @@
+# input_management/common/document.py
+import asyncio
+import hashlib
+import tempfile
+import threading
+from typing import AsyncIterator, BinaryIO, Optional
+
+
+class DocumentTooLargeError(Exception):
+    """Raised when an uploaded document exceeds the configured size limit."""
+
+
+class DocumentHandle:
+    """
+    File-like handle to an uploaded document.
+
+    The body is spooled into memory up to `max_memory_size` bytes and into a temporary file beyond
+    that, so services can read or stream it without the whole document living in RAM. Size and
+    sha256 are computed while spooling. read, read_range and iter_chunks are safe to use from
+    concurrent stages; fileobj is not.
+    """
+
+    def __init__(
+            self,
+            file: BinaryIO,
+            size: int,
+            sha256: str,
+            content_type: Optional[str] = None,
+            filename: Optional[str] = None
+    ):
+        self._file = file
+        self.size = size
+        self.sha256 = sha256
+        self.content_type = content_type
+        self.filename = filename
+        self._lock = threading.Lock()
+
+    @classmethod
+    async def from_stream(
+            cls,
+            chunks: AsyncIterator[bytes],
+            max_memory_size: int = 1024 * 1024,
+            max_size: Optional[int] = None,
+            content_type: Optional[str] = None,
+            filename: Optional[str] = None
+    ) -> "DocumentHandle":
+        """Spool an async byte stream (e.g. starlette's request.stream()) into a new handle."""
+        file = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise DocumentTooLargeError(f"Document exceeds the {max_size} byte limit")
+                digest.update(chunk)
+                file.write(chunk)
+        except BaseException:
+            file.close()
+            raise
+        file.seek(0)
+        return cls(file, size, digest.hexdigest(), content_type=content_type, filename=filename)
+
+    @property
+    def fileobj(self) -> BinaryIO:
+        """The underlying file object, rewound to the start."""
+        self._file.seek(0)
+        return self._file
+
+    def read_range(self, offset: int, size: int) -> bytes:
+        """Read up to `size` bytes starting at `offset`."""
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def read(self) -> bytes:
+        """Read the whole document into memory; prefer iter_chunks for large documents."""
+        return self.read_range(0, self.size)
+
+    async def iter_chunks(self, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Yield the document in chunks, reading off the event loop."""
+        offset = 0
+        while offset < self.size:
+            chunk = await asyncio.to_thread(self.read_range, offset, chunk_size)
+            if not chunk:
+                return
+            offset += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __repr__(self) -> str:
+        return f"DocumentHandle(filename={self.filename!r}, size={self.size}, sha256={self.sha256[:12]})"
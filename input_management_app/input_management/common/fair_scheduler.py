@@ -0,0 +1,171 @@
+# input_management/common/fair_scheduler.py
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from input_management_app.input_management.common.admission import AdmissionRejectedError
+from input_management_app.input_management.common.metrics import MetricsRegistry, default_registry
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    finish_tag: float
+    enqueued_at: float
+
+
+@dataclass
+class _Flow:
+    tenant: str
+    priority: str
+    weight: float
+    waiters: Deque[_Waiter] = field(default_factory=deque)
+    last_finish: float = 0.0
+
+
+class FairScheduler:
+    """
+    Weighted fair queuing of workflow runs across tenants and priorities.
+
+    Every (tenant, priority) pair is a flow with weight tenant_weight * priority_weight. When a slot
+    frees up, the waiting run with the smallest virtual finish tag among flows allowed to run is
+    started, so each backlogged flow gets slots in proportion to its weight. One tenant's burst
+    therefore cannot starve another tenant, and interactive runs overtake batch runs. A run can
+    start only while its tenant is under its concurrency cap. Batch runs are also limited to
+    `max_batch_concurrency`, which keeps slots free for interactive arrivals. Full flow queues
+    are rejected with 429 and waits past `max_queue_wait` with 503, as in AdmissionController.
+    """
+
+    def __init__(
+            self,
+            max_concurrency: int,
+            tenant_weights: Optional[Dict[str, float]] = None,
+            priority_weights: Optional[Dict[str, float]] = None,
+            tenant_limits: Optional[Dict[str, int]] = None,
+            default_tenant_limit: Optional[int] = None,
+            max_batch_concurrency: Optional[int] = None,
+            max_queue: Optional[int] = None,
+            max_queue_wait: Optional[float] = None,
+            metrics: Optional[MetricsRegistry] = None
+    ):
+        self.max_concurrency = max_concurrency
+        self.tenant_weights = tenant_weights or {}
+        self.priority_weights = priority_weights or {INTERACTIVE: 10.0, BATCH: 1.0}
+        self.tenant_limits = tenant_limits or {}
+        self.default_tenant_limit = default_tenant_limit
+        self.max_batch_concurrency = max_batch_concurrency
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.metrics = metrics or default_registry
+        self._flows: Dict[Tuple[str, str], _Flow] = {}
+        self._virtual_time = 0.0
+        self.in_flight = 0
+        self.batch_in_flight = 0
+        self.tenant_in_flight: Dict[str, int] = {}
+
+    def _flow(self, tenant: str, priority: str) -> _Flow:
+        flow = self._flows.get((tenant, priority))
+        if flow is None:
+            if priority not in self.priority_weights:
+                raise ValueError(f"Unknown priority: {priority}")
+            weight = self.tenant_weights.get(tenant, 1.0) * self.priority_weights[priority]
+            flow = self._flows[(tenant, priority)] = _Flow(tenant=tenant, priority=priority, weight=weight)
+        return flow
+
+    def _can_start(self, tenant: str, priority: str) -> bool:
+        if self.in_flight >= self.max_concurrency:
+            return False
+        limit = self.tenant_limits.get(tenant, self.default_tenant_limit)
+        if limit is not None and self.tenant_in_flight.get(tenant, 0) >= limit:
+            return False
+        if priority == BATCH and self.max_batch_concurrency is not None:
+            return self.batch_in_flight < self.max_batch_concurrency
+        return True
+
+    def _start(self, tenant: str, priority: str) -> None:
+        self.in_flight += 1
+        self.tenant_in_flight[tenant] = self.tenant_in_flight.get(tenant, 0) + 1
+        if priority == BATCH:
+            self.batch_in_flight += 1
+        self.metrics.gauge_set("scheduler_in_flight", self.tenant_in_flight[tenant], tenant=tenant)
+
+    def _finish(self, tenant: str, priority: str) -> None:
+        self.in_flight -= 1
+        self.tenant_in_flight[tenant] -= 1
+        if priority == BATCH:
+            self.batch_in_flight -= 1
+        self.metrics.gauge_set("scheduler_in_flight", self.tenant_in_flight[tenant], tenant=tenant)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start waiting runs in finish-tag order while slots and caps allow."""
+        while self.in_flight < self.max_concurrency:
+            best: Optional[_Flow] = None
+            for flow in self._flows.values():
+                if flow.waiters and self._can_start(flow.tenant, flow.priority):
+                    if best is None or flow.waiters[0].finish_tag < best.waiters[0].finish_tag:
+                        best = flow
+            if best is None:
+                return
+            waiter = best.waiters.popleft()
+            self._update_queue_gauge(best)
+            self._virtual_time = max(self._virtual_time, waiter.finish_tag - 1.0 / best.weight)
+            self._start(best.tenant, best.priority)
+            waiter.future.set_result(None)
+
+    def _update_queue_gauge(self, flow: _Flow) -> None:
+        self.metrics.gauge_set("scheduler_queue_depth", len(flow.waiters), tenant=flow.tenant, priority=flow.priority)
+
+    def queue_depth(self, tenant: Optional[str] = None) -> int:
+        return sum(len(flow.waiters) for flow in self._flows.values() if tenant is None or flow.tenant == tenant)
+
+    @asynccontextmanager
+    async def admit(self, tenant: str, priority: str = INTERACTIVE) -> AsyncIterator[None]:
+        """Hold a workflow slot for the duration of the block, or raise AdmissionRejectedError."""
+        flow = self._flow(tenant, priority)
+        start = time.perf_counter()
+        if not flow.waiters and self._can_start(tenant, priority):
+            self._start(tenant, priority)
+        else:
+            await self._wait(flow, start)
+        self.metrics.observe("scheduler_queue_wait_seconds", time.perf_counter() - start,
+                             tenant=tenant, priority=priority)
+        try:
+            yield
+        finally:
+            self._finish(tenant, priority)
+
+    async def _wait(self, flow: _Flow, start: float) -> None:
+        if self.max_queue is not None and len(flow.waiters) >= self.max_queue:
+            self.metrics.inc("scheduler_rejected_total", tenant=flow.tenant, priority=flow.priority, reason="queue_full")
+            raise AdmissionRejectedError(f"Queue for tenant {flow.tenant} ({flow.priority}) is full", status_code=429)
+
+        finish_tag = max(self._virtual_time, flow.last_finish) + 1.0 / flow.weight
+        flow.last_finish = finish_tag
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), finish_tag, start)
+        flow.waiters.append(waiter)
+        self._update_queue_gauge(flow)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.max_queue_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.future.done():
+                # The slot was granted just as the wait ended; give it back
+                self._finish(flow.tenant, flow.priority)
+            else:
+                waiter.future.cancel()
+                flow.waiters.remove(waiter)
+                self._update_queue_gauge(flow)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.metrics.inc("scheduler_rejected_total", tenant=flow.tenant, priority=flow.priority, reason="timeout")
+            raise AdmissionRejectedError(
+                f"Timed out waiting for a workflow slot for tenant {flow.tenant}",
+                status_code=503,
+                retry_after=max(1, int(self.max_queue_wait or 1)),
+            )
@@ -0,0 +1,32 @@
+# input_management/common/fingerprint.py
+import base64
+import hashlib
+import json
+from typing import Any
+
+from input_management_app.input_management.common.document import DocumentHandle
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"__bytes__": base64.b64encode(bytes(value)).decode("ascii")}
+    if isinstance(value, DocumentHandle):
+        return {"__document__": value.sha256}
+    raise TypeError(f"Object of type {type(value).__name__} is not fingerprintable")
+
+
+def content_hash(*parts: Any) -> str:
+    """
+    Return a stable sha256 hex digest of JSON-compatible values.
+
+    Dict keys are sorted so equal documents hash equally regardless of key order;
+    raw bytes values are supported and DocumentHandle values hash by their content digest.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            digest.update(bytes(part))
+        else:
+            digest.update(json.dumps(part, sort_keys=True, separators=(",", ":"), default=_encode).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
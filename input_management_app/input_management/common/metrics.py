@@ -0,0 +1,155 @@
+# input_management/common/metrics.py
+import asyncio
+import math
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Seconds, roughly log-spaced from 1ms to 60s
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0,
+)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    rendered = ",".join(f'{name}="{value}"' for name, value in pairs)
+    return "{" + rendered + "}"
+
+
+class Histogram:
+    """Fixed-bucket histogram; observe is a bisect and two increments."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside the matching bucket."""
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """
+    In-process metrics: latency histograms, in-flight gauges and counters keyed by name and labels.
+
+    Rendered in Prometheus/OpenMetrics text format for scraping by Datadog's openmetrics check.
+    """
+
+    def __init__(self, namespace: str = "input_management", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        series = self._histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        series = self._counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0) + value
+
+    def gauge_add(self, name: str, value: float, **labels: str) -> None:
+        series = self._gauges.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0) + value
+
+    def gauge_set(self, name: str, value: float, **labels: str) -> None:
+        self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    @asynccontextmanager
+    async def timed(self, name: str, **labels: str) -> AsyncIterator[None]:
+        """
+        Time a block into `<name>_seconds`, tracking `<name>_in_flight` and counting `<name>_errors_total`.
+
+        Cancellation is not an error: stages cancelled because a sibling failed and hedge losers are
+        timed but not counted.
+        """
+        self.gauge_add(f"{name}_in_flight", 1, **labels)
+        start = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            raise
+        except BaseException:
+            self.inc(f"{name}_errors_total", **labels)
+            raise
+        finally:
+            self.observe(f"{name}_seconds", time.perf_counter() - start, **labels)
+            self.gauge_add(f"{name}_in_flight", -1, **labels)
+
+    def snapshot(self, quantiles: Sequence[float] = (0.5, 0.95, 0.99)) -> Dict[str, List[dict]]:
+        """Return histogram percentiles, counters and gauges as plain data."""
+        result: Dict[str, List[dict]] = {}
+        for name, series in self._histograms.items():
+            result[name] = [
+                {
+                    "labels": dict(key),
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    **{f"p{round(q * 100)}": histogram.quantile(q) for q in quantiles},
+                }
+                for key, histogram in series.items()
+            ]
+        for name, series in {**self._counters, **self._gauges}.items():
+            result[name] = [{"labels": dict(key), "value": value} for key, value in series.items()]
+        return result
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, series in sorted(self._histograms.items()):
+            metric = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for key, histogram in series.items():
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f"{metric}_bucket{_format_labels(key, ('le', repr(bound)))} {cumulative}")
+                lines.append(f"{metric}_bucket{_format_labels(key, ('le', '+Inf'))} {histogram.count}")
+                lines.append(f"{metric}_sum{_format_labels(key)} {histogram.sum}")
+                lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+        for kind, metrics in (("counter", self._counters), ("gauge", self._gauges)):
+            for name, series in sorted(metrics.items()):
+                metric = f"{self.namespace}_{name}"
+                lines.append(f"# TYPE {metric} {kind}")
+                for key, value in series.items():
+                    lines.append(f"{metric}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+default_registry = MetricsRegistry()
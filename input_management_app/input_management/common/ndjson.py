@@ -0,0 +1,42 @@
+# input_management/common/ndjson.py
+from typing import Any, AsyncIterator, Tuple
+
+from .fast_json import loads
+
+
+class NdjsonLineTooLongError(Exception):
+    """Raised when a single NDJSON line exceeds the configured limit."""
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes], max_line_bytes: int = 16 * 1024 * 1024) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Parse a streamed NDJSON body incrementally, yielding (line_number, value) for each non-blank line.
+
+    Values that fail to parse are yielded as the ValueError itself so one bad line does not
+    abort the stream; only the current partial line is ever buffered.
+    """
+    buffer = bytearray()
+    line_number = 0
+
+    def parse(raw: bytes) -> Any:
+        try:
+            return loads(raw)
+        except ValueError as exc:
+            return exc
+
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while True:
+            newline = buffer.find(b"\n")
+            if newline < 0:
+                break
+            raw = bytes(buffer[:newline])
+            del buffer[:newline + 1]
+            line_number += 1
+            if raw.strip():
+                yield line_number, parse(raw)
+        if len(buffer) > max_line_bytes:
+            raise NdjsonLineTooLongError(f"Line {line_number + 1} exceeds {max_line_bytes} bytes")
+
+    if buffer.strip():
+        yield line_number + 1, parse(bytes(buffer))
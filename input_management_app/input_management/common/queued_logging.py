@@ -0,0 +1,171 @@
+# input_management/common/queued_logging.py
+import asyncio
+import itertools
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+REDACTED = "<redacted>"
+
+
+def _truncate(value: Any, max_chars: int) -> Any:
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    text = value if isinstance(value, str) else repr(value)
+    if len(text) <= max_chars:
+        return value
+    return f"{text[:max_chars]}...<{len(text) - max_chars} chars truncated>"
+
+
+class QueuedLogHandler(logging.Handler):
+    """
+    Non-blocking logging backend for CustomLogger and stdlib loggers.
+
+    emit() only samples the record and appends it to a bounded deque, which is atomic under the GIL
+    and takes no lock. A background thread later formats the record, truncates large arguments,
+    redacts sensitive fields and hands it to the `target` handler (stdout by default). Records
+    arriving at a full queue are dropped and counted instead of blocking the event loop.
+    """
+
+    def __init__(
+            self,
+            target: Optional[logging.Handler] = None,
+            capacity: int = 10000,
+            max_field_chars: int = 512,
+            redact_fields: Iterable[str] = ("document", "document_data", "content", "feedback_data"),
+            info_sample_rate: int = 1,
+            poll_interval: float = 0.05
+    ):
+        """info_sample_rate=N keeps one in every N INFO records; other levels are never sampled."""
+        super().__init__()
+        self.target = target or logging.StreamHandler(sys.stdout)
+        self.capacity = capacity
+        self.max_field_chars = max_field_chars
+        self.redact_fields = frozenset(redact_fields)
+        self.info_sample_rate = max(1, info_sample_rate)
+        self.poll_interval = poll_interval
+        self._queue: deque = deque()
+        self._info_counter = itertools.count()
+        self._stopping = threading.Event()
+        self.dropped = 0
+        self.sampled_out = 0
+        self._thread = threading.Thread(target=self._drain_forever, name="queued-log-handler", daemon=True)
+        self._thread.start()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": len(self._queue),
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+        }
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # logging.Handler.handle wraps emit in the handler lock; the deque makes that unnecessary
+        if not self.filter(record):
+            return False
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno == logging.INFO and self.info_sample_rate > 1:
+            if next(self._info_counter) % self.info_sample_rate:
+                self.sampled_out += 1
+                return
+        if len(self._queue) >= self.capacity:
+            self.dropped += 1
+            return
+        self._queue.append(record)
+
+    def _prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if isinstance(record.args, dict):
+            record.args = {
+                key: REDACTED if key in self.redact_fields else _truncate(value, self.max_field_chars)
+                for key, value in record.args.items()
+            }
+        elif record.args:
+            record.args = tuple(_truncate(arg, self.max_field_chars) for arg in record.args)
+        for field in self.redact_fields:
+            if field in record.__dict__:
+                record.__dict__[field] = REDACTED
+        record.msg = _truncate(record.msg, self.max_field_chars * 4)
+        return record
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                record = self._queue.popleft()
+            except IndexError:
+                return
+            try:
+                self.target.handle(self._prepare(record))
+            except Exception:
+                self.handleError(record)
+
+    def _drain_forever(self) -> None:
+        while not self._stopping.is_set():
+            if self._queue:
+                self._drain()
+            else:
+                time.sleep(self.poll_interval)
+        self._drain()
+
+    def flush(self) -> None:
+        self._wait_until_drained()
+        self.target.flush()
+
+    def _wait_until_drained(self) -> None:
+        # Wait for the background thread to empty the queue rather than draining concurrently with it
+        while self._queue and self._thread.is_alive():
+            time.sleep(self.poll_interval / 10)
+
+    def close(self) -> None:
+        self._stopping.set()
+        self._thread.join()
+        self.target.close()
+        super().close()
+
+
+def install_queued_logging(logger: logging.Logger, **kwargs: Any) -> QueuedLogHandler:
+    """Route a logger's output through a QueuedLogHandler, replacing its existing handlers."""
+    handler = QueuedLogHandler(**kwargs)
+    for existing in list(logger.handlers):
+        logger.removeHandler(existing)
+    logger.addHandler(handler)
+    logger.propagate = False
+    return handler
+
+
+class QueuedLogging:
+    """
+    Installs a QueuedLogHandler on `logger` at app startup and removes it at shutdown.
+
+    Register start/stop as startup/shutdown handlers. stop() drains the queue on a thread, so
+    records logged during shutdown are still written, and restores the logger's previous handlers.
+    """
+
+    def __init__(self, logger: logging.Logger, **handler_options: Any):
+        self.logger = logger
+        self.handler_options = handler_options
+        self.handler: Optional[QueuedLogHandler] = None
+        self._previous_handlers: List[logging.Handler] = []
+        self._previous_propagate = logger.propagate
+
+    async def start(self) -> None:
+        if self.handler is not None:
+            return
+        self._previous_handlers = list(self.logger.handlers)
+        self._previous_propagate = self.logger.propagate
+        self.handler = install_queued_logging(self.logger, **self.handler_options)
+
+    async def stop(self) -> None:
+        if self.handler is None:
+            return
+        handler, self.handler = self.handler, None
+        self.logger.removeHandler(handler)
+        for previous in self._previous_handlers:
+            self.logger.addHandler(previous)
+        self.logger.propagate = self._previous_propagate
+        await asyncio.to_thread(handler.close)
@@ -0,0 +1,201 @@
+# input_management/common/registry.py
+import importlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from common.logging.custom_logger import CustomLogger
+
+ServiceRef = Union[str, Callable[..., Any]]
+
+
+@dataclass
+class _Registration:
+    ref: ServiceRef
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    instance: Any = None
+    import_seconds: Optional[float] = None
+    init_seconds: Optional[float] = None
+
+
+class LazyService:
+    """
+    Proxy that resolves its registry entry on first attribute access.
+
+    Proxies created for an interface are instances of it (see ServiceRegistry.lazy), so isinstance
+    checks against the service ABCs pass without importing the implementation.
+    """
+
+    def __init__(self, registry: "ServiceRegistry", tenant: str, role: str):
+        self._registry = registry
+        self._tenant = tenant
+        self._role = role
+
+    @property
+    def service_name(self) -> str:
+        """Name of the implementation, taken from its reference without importing it."""
+        return self._registry.service_name(self._tenant, self._role)
+
+    def resolve(self) -> Any:
+        return self._registry.get(self._tenant, self._role)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"LazyService({self._tenant!r}, {self._role!r})"
+
+
+def _forward(name: str) -> Callable[..., Any]:
+    def method(self: LazyService, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self.resolve(), name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+_lazy_classes: Dict[type, type] = {}
+
+
+def _lazy_class(interface: type) -> type:
+    """A LazyService subclass of `interface` that forwards every method the interface defines."""
+    lazy_class = _lazy_classes.get(interface)
+    if lazy_class is None:
+        methods = {
+            name: _forward(name)
+            for klass in interface.__mro__[:-1]
+            for name, value in vars(klass).items()
+            if callable(value) and not (name.startswith("__") and name.endswith("__"))
+        }
+        lazy_class = _lazy_classes[interface] = type(f"Lazy{interface.__name__}", (LazyService, interface), methods)
+    return lazy_class
+
+
+def service_name(service: Any) -> str:
+    """Implementation name of a service, for labels and logs; lazy proxies are not resolved."""
+    if isinstance(service, LazyService):
+        return service.service_name
+    return type(service).__name__
+
+
+class ServiceRegistry:
+    """
+    Service implementations keyed by (tenant, role), imported and constructed on first use.
+
+    References are entry-point style strings ("package.module:ClassName") or factories. Only the
+    modules of the services a process actually uses are imported, so a pnc process never pays for
+    the AWS SDKs and vice versa.
+    """
+
+    def __init__(self, logger: Optional[CustomLogger] = None):
+        self._registrations: Dict[Tuple[str, str], _Registration] = {}
+        self._lock = threading.RLock()
+        self.logger = logger
+
+    def register(self, tenant: str, role: str, ref: ServiceRef, **kwargs: Any) -> None:
+        """Register an implementation; kwargs are passed to it on construction."""
+        with self._lock:
+            self._registrations[(tenant, role)] = _Registration(ref=ref, kwargs=kwargs)
+
+    def tenants(self) -> List[str]:
+        return sorted({tenant for tenant, _ in self._registrations})
+
+    def get(self, tenant: str, role: str) -> Any:
+        """Return the service instance, importing and constructing it on the first call."""
+        try:
+            registration = self._registrations[(tenant, role)]
+        except KeyError:
+            raise KeyError(f"No service registered for tenant '{tenant}' and role '{role}'")
+        if registration.instance is not None:
+            return registration.instance
+
+        with self._lock:
+            if registration.instance is None:
+                start = time.perf_counter()
+                factory = self._resolve(registration.ref)
+                registration.import_seconds = time.perf_counter() - start
+
+                start = time.perf_counter()
+                registration.instance = factory(**registration.kwargs)
+                registration.init_seconds = time.perf_counter() - start
+                if self.logger:
+                    self.logger.info(
+                        "Loaded %s service for tenant %s: import %.3fs, init %.3fs",
+                        role, tenant, registration.import_seconds, registration.init_seconds,
+                    )
+        return registration.instance
+
+    def load_tenant(self, tenant: str) -> None:
+        """
+        Import and construct every service of a tenant now.
+
+        Call it at startup so a broken registration fails the deploy instead of the first request
+        that reaches its lazy proxy.
+        """
+        for registered_tenant, role in list(self._registrations):
+            if registered_tenant == tenant:
+                self.get(tenant, role)
+
+    def lazy(self, tenant: str, role: str, interface: Optional[type] = None) -> LazyService:
+        """
+        Return a proxy that defers get() until the service is first used.
+
+        With an interface (e.g. OcrService) the proxy is an instance of it and forwards the
+        interface's methods, including the concrete ones, to the resolved implementation.
+        """
+        if (tenant, role) not in self._registrations:
+            raise KeyError(f"No service registered for tenant '{tenant}' and role '{role}'")
+        if interface is None:
+            return LazyService(self, tenant, role)
+        return _lazy_class(interface)(self, tenant, role)
+
+    def service_name(self, tenant: str, role: str) -> str:
+        ref = self._registrations[(tenant, role)].ref
+        if isinstance(ref, str):
+            return ref.rpartition(":")[2].rpartition(".")[2]
+        return getattr(ref, "__name__", repr(ref))
+
+    def startup_report(self) -> List[dict]:
+        """Per-service import and init cost, slowest first; unloaded services have None timings."""
+        report = [
+            {
+                "tenant": tenant,
+                "role": role,
+                "ref": registration.ref if isinstance(registration.ref, str) else repr(registration.ref),
+                "loaded": registration.instance is not None,
+                "import_seconds": registration.import_seconds,
+                "init_seconds": registration.init_seconds,
+            }
+            for (tenant, role), registration in self._registrations.items()
+        ]
+        return sorted(report, key=lambda row: -((row["import_seconds"] or 0) + (row["init_seconds"] or 0)))
+
+    @staticmethod
+    def _resolve(ref: ServiceRef) -> Callable[..., Any]:
+        if not isinstance(ref, str):
+            return ref
+        module_name, _, attribute = ref.partition(":")
+        if not attribute:
+            raise ValueError(f"Service reference must look like 'package.module:Name', got '{ref}'")
+        target: Any = importlib.import_module(module_name)
+        for part in attribute.split("."):
+            target = getattr(target, part)
+        return target
+
+
+def register_default_tenants(registry: ServiceRegistry) -> ServiceRegistry:
+    """Register the pnc_app and health_app implementations."""
+    registry.register("pnc", "ocr", "pnc_app.service.AzureAiVisionService:AzureAiVisionService")
+    registry.register("pnc", "classification", "pnc_app.service.PncClassificationService:PncClassificationService")
+    registry.register("pnc", "request_store", "pnc_app.service.CosmosDbService:CosmosDbService")
+    registry.register("pnc", "databricks_volume", "pnc_app.service.DatabricsVolumeService:DatabricksVolumeService")
+
+    registry.register("health", "ocr", "health_app.service.TextractService:TextractService")
+    registry.register("health", "classification", "health_app.service.HealthClassificationService:HealthClassificationService")
+    registry.register("health", "request_store", "health_app.service.DynamoDBService:DynamoDbService")
+    registry.register("health", "databricks_volume", "health_app.service.DatabricsVolumeService:DatabricksVolumeService")
+    return registry
+
+
+service_registry = register_default_tenants(ServiceRegistry())
@@ -0,0 +1,87 @@
+# input_management/common/single_flight.py
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Sequence, Tuple
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent executions of the same work.
+
+    A call registers its result future under every key it is given (e.g. request id and content
+    hash). Later calls sharing any of those keys await the running future instead of starting new
+    work, and for `result_ttl` seconds after success they get the stored result directly.
+    Failures are shared with attached callers but never remembered.
+    """
+
+    def __init__(self, result_ttl: float = 30.0, max_results: int = 10000):
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._results: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.executions = 0
+        self.deduplicated = 0
+
+    def in_flight(self, key: str) -> bool:
+        """Whether work registered under `key` is currently running."""
+        return key in self._in_flight
+
+    def _recent_result(self, keys: Sequence[str]) -> Tuple[bool, Any]:
+        now = time.monotonic()
+        for key in keys:
+            entry = self._results.get(key)
+            if entry is None:
+                continue
+            expires_at, result = entry
+            if expires_at < now:
+                del self._results[key]
+                continue
+            return True, result
+        return False, None
+
+    def _remember(self, keys: Sequence[str], result: Any) -> None:
+        expires_at = time.monotonic() + self.result_ttl
+        for key in keys:
+            self._results[key] = (expires_at, result)
+            self._results.move_to_end(key)
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+    async def run(self, keys: Sequence[str], func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `func` unless work for any of `keys` is in flight or recently finished."""
+        found, result = self._recent_result(keys)
+        if found:
+            self.deduplicated += 1
+            return result
+
+        for key in keys:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.deduplicated += 1
+                # Shield so a disconnecting duplicate does not cancel the shared work
+                return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        for key in keys:
+            self._in_flight[key] = future
+        self.executions += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited failure does not log "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            if self.result_ttl > 0:
+                self._remember(keys, result)
+            return result
+        finally:
+            for key in keys:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
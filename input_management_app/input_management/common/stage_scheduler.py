@@ -0,0 +1,94 @@
+# input_management/common/stage_scheduler.py
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+class StageFailedError(Exception):
+    """Raised when a stage fails; the original exception is available as __cause__."""
+
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(f"Stage '{stage}' failed: {error}")
+        self.stage = stage
+        self.error = error
+
+
+@dataclass
+class Stage:
+    """
+    A unit of workflow work.
+
+    `func` receives a dict with the results of the stages listed in `depends_on`.
+    """
+    name: str
+    func: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: List[str] = field(default_factory=list)
+
+
+class StageScheduler:
+    """Runs a DAG of stages, starting every stage as soon as all its dependencies have finished."""
+
+    def __init__(self, stages: Sequence[Stage]):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        for stage in stages:
+            missing = [dep for dep in stage.depends_on if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {missing}")
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        remaining = {name: set(stage.depends_on) for name, stage in self.stages.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Stage dependencies contain a cycle: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    async def run(self, timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Run all stages and return their results keyed by stage name.
+
+        Per-stage durations in seconds are written into `timings` when given. On the first failure
+        the remaining running stages are cancelled and StageFailedError is raised.
+        """
+        results: Dict[str, Any] = {}
+        running: Dict[asyncio.Task, str] = {}
+        started = set()
+
+        async def run_stage(stage: Stage) -> Any:
+            start = time.perf_counter()
+            try:
+                return await stage.func({dep: results[dep] for dep in stage.depends_on})
+            finally:
+                if timings is not None:
+                    timings[stage.name] = time.perf_counter() - start
+
+        def launch_ready() -> None:
+            for name, stage in self.stages.items():
+                if name not in started and all(dep in results for dep in stage.depends_on):
+                    started.add(name)
+                    running[asyncio.create_task(run_stage(stage))] = name
+
+        launch_ready()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    if task.exception() is not None:
+                        raise StageFailedError(name, task.exception()) from task.exception()
+                    results[name] = task.result()
+                launch_ready()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return results
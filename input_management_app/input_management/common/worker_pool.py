@@ -0,0 +1,85 @@
+# input_management/common/worker_pool.py
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+from common.logging.custom_logger import CustomLogger
+
+
+class WorkerPoolFullError(Exception):
+    """Raised when a job is submitted while the pool queue is at capacity."""
+
+
+class WorkerPool:
+    """
+    Bounded in-process pool of asyncio workers draining a job queue.
+
+    Jobs are zero-argument coroutine factories. The queue size caps how many
+    accepted jobs may wait, the worker count caps how many run at once.
+    """
+
+    def __init__(
+            self,
+            workers: int = 4,
+            max_queue_size: int = 100,
+            logger: Optional[CustomLogger] = None
+    ):
+        """Initialize the pool; workers are started by `start`."""
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.logger = logger
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of accepted jobs not yet picked up by a worker."""
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """Start worker tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(index), name=f"worker-pool-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop workers, optionally waiting for queued jobs to finish first."""
+        if not self._tasks:
+            return
+        if drain:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, job: Callable[[], Awaitable[Any]]) -> None:
+        """Enqueue a job without waiting; raises WorkerPoolFullError when saturated."""
+        if not self._tasks:
+            raise RuntimeError("WorkerPool is not started")
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise WorkerPoolFullError(f"Worker pool queue is full ({self.max_queue_size} jobs)")
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if self.logger:
+                    self.logger.error("Worker %s job failed: %s", index, exc)
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,171 @@
+# input_management/queue_worker.py
+import argparse
+import asyncio
+import importlib
+import os
+import signal
+import socket
+import time
+from typing import List, Optional, Set
+
+from common.logging.custom_logger import CustomLogger
+from input_management_app.input_management.InputManagementWorkflow import InputManagementWorkflow, JobStatus
+from input_management_app.input_management.service.JobQueueService import Job, JobQueueService
+from input_management_app.input_management.service.SqliteJobQueueService import SqliteJobQueueService
+
+
+class JobQueueWorker:
+    """
+    Pulls classification jobs from a durable JobQueueService and runs them through the workflow.
+
+    Jobs carry {"request_id": ..., "document_data": ...}. Leases are extended while a job runs;
+    failed jobs are nacked with a linear backoff and their requests stay PENDING until the job is
+    dead-lettered. Every `report_interval` seconds the worker marks the requests of unreported
+    dead letters FAILED, which also covers jobs that died by losing their lease on the last attempt.
+    Run one worker per process; any number of processes can share the same queue.
+    """
+
+    def __init__(
+            self,
+            job_queue: JobQueueService,
+            workflow: InputManagementWorkflow,
+            concurrency: int = 4,
+            visibility_timeout: float = 300.0,
+            poll_interval: float = 0.5,
+            retry_delay: float = 5.0,
+            report_interval: float = 30.0,
+            worker_id: Optional[str] = None,
+            logger: Optional[CustomLogger] = None
+    ):
+        self.job_queue = job_queue
+        self.workflow = workflow
+        self.concurrency = concurrency
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.report_interval = report_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.logger = logger
+        self._stopping = asyncio.Event()
+        self._running: Set[asyncio.Task] = set()
+
+    def stop(self) -> None:
+        """Stop leasing new jobs; run() returns once the running ones finish."""
+        self._stopping.set()
+
+    async def report_dead_letters(self, batch_size: int = 100) -> List[str]:
+        """
+        Mark the requests of unreported dead-lettered jobs FAILED and return their request ids.
+
+        Requests are updated before their jobs are marked reported, so a worker that dies in between
+        only repeats the idempotent FAILED update.
+        """
+        reported: List[str] = []
+        while True:
+            dead = await self.job_queue.dead_letters(limit=batch_size, unreported_only=True)
+            if not dead:
+                return reported
+            for job in dead:
+                request_id = job["payload"]["request_id"]
+                await self.workflow.request_store_service.update(request_id, JobStatus.FAILED.value)
+                reported.append(request_id)
+                if self.logger:
+                    self.logger.error("Request %s failed after %s attempts: %s", request_id, job["attempts"], job["last_error"])
+            await self.job_queue.mark_reported([job["job_id"] for job in dead])
+
+    async def run(self) -> None:
+        slots = asyncio.Semaphore(self.concurrency)
+        next_report = time.monotonic()
+        while not self._stopping.is_set():
+            if time.monotonic() >= next_report:
+                next_report = time.monotonic() + self.report_interval
+                try:
+                    await self.report_dead_letters()
+                except Exception as exc:
+                    if self.logger:
+                        self.logger.error("Reporting dead-lettered jobs failed: %s", exc)
+            await slots.acquire()
+            job = await self.job_queue.lease(self.worker_id, self.visibility_timeout)
+            if job is None:
+                slots.release()
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.create_task(self._process(job))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+            task.add_done_callback(lambda _: slots.release())
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def _keep_leased(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(self.visibility_timeout / 3)
+            if not await self.job_queue.extend(job, self.visibility_timeout):
+                return
+
+    async def _process(self, job: Job) -> None:
+        request_id = job.payload["request_id"]
+        heartbeat = asyncio.create_task(self._keep_leased(job))
+        try:
+            # The attempt may still be retried, so FAILED is only written once the job is dead-lettered
+            await self.workflow.perform_classification(
+                request_id,
+                job.payload["document_data"],
+                register=False,
+                mark_failed=False,
+            )
+        except Exception as exc:
+            if self.logger:
+                self.logger.error("Job %s attempt %s failed: %s", job.job_id, job.attempts, exc)
+            await self.job_queue.nack(job, retry_delay=self.retry_delay * job.attempts, error=str(exc))
+            if job.attempts >= self.job_queue.max_attempts:
+                await self.report_dead_letters()
+        else:
+            await self.job_queue.ack(job)
+        finally:
+            heartbeat.cancel()
+
+
+def _load_workflow(reference: str) -> InputManagementWorkflow:
+    """Import a workflow given as "package.module:attribute"."""
+    module_name, _, attribute = reference.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "workflow")
+
+
+async def _serve(worker: JobQueueWorker) -> None:
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+    await worker.run()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a JobQueueWorker against a SQLite queue file until SIGINT or SIGTERM."""
+    parser = argparse.ArgumentParser(description="Process queued classification jobs.")
+    parser.add_argument("--queue", default=os.environ.get("INPUT_MANAGEMENT_QUEUE", "jobs.sqlite3"),
+                        help="path of the SQLite queue file shared with the API")
+    parser.add_argument("--workflow", default="input_management_app.input_management.app:workflow",
+                        help="workflow to run, as package.module:attribute")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--visibility-timeout", type=float, default=300.0)
+    parser.add_argument("--max-attempts", type=int, default=5)
+    parser.add_argument("--retry-delay", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    workflow = _load_workflow(args.workflow)
+    worker = JobQueueWorker(
+        job_queue=SqliteJobQueueService(args.queue, max_attempts=args.max_attempts),
+        workflow=workflow,
+        concurrency=args.concurrency,
+        visibility_timeout=args.visibility_timeout,
+        retry_delay=args.retry_delay,
+        logger=workflow.logger,
+    )
+    asyncio.run(_serve(worker))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,4 +9,23 @@ class BaseRequest(BaseModel):
 class ClassificationRequest(BaseRequest):
     """Request model for classification."""
     content: Dict[str, Any] = Field(..., description="Content to classify")
-    options: Optional[Dict[str, Any]] = Field(None, description="Classification options")
\ No newline at end of file
+    options: Optional[Dict[str, Any]] = Field(None, description="Classification options")
+
+class DocumentRequest(BaseModel):
+    """
+    Request model for POST /request.
+
+    Only the small metadata fields are validated. `document`, `text` and `documents` are typed Any
+    so pydantic passes them through without walking or copying them, and unknown keys are kept.
+    """
+    request_id: Optional[str] = Field(None, description="Unique identifier for the request")
+    document_type: Optional[str] = Field(None, description="Declared document type")
+    filename: Optional[str] = Field(None, description="Original file name")
+    content_type: Optional[str] = Field(None, description="MIME type of the document")
+    document: Any = Field(None, description="Raw document content, passed through unvalidated")
+    text: Any = Field(None, description="Pre-extracted OCR text, passed through unvalidated")
+    documents: Any = Field(None, description="Documents for multi-document requests, passed through unvalidated")
+    options: Optional[Dict[str, Any]] = Field(None, description="Classification options")
+
+    class Config:
+        extra = "allow"
@@ -1,6 +1,6 @@
 # input_management/schemas/responses.py
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 
 class BaseResponse(BaseModel):
     """Base class for all response models."""
@@ -14,13 +14,36 @@ class ErrorResponse(BaseResponse):
     error_message: str = Field(..., description="Error message")
     error_details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
 
+class ClassificationResult(BaseModel):
+    """Workflow result embedded in ClassificationResponse; extra keys from the workflow are kept."""
+    request_id: str = Field(..., description="Unique identifier for the request")
+    status: str = Field(..., description="Final workflow status")
+    stage_timings: Optional[Dict[str, float]] = Field(None, description="Seconds spent per workflow stage")
+    classification: Optional[Dict[str, Any]] = Field(None, description="Result returned by the classification service")
+    confidence: Optional[float] = Field(None, description="Classifier confidence score")
+    pages_processed: Optional[int] = Field(None, description="Pages read before progressive classification stopped")
+    page_count: Optional[int] = Field(None, description="Total pages in the document")
+
+    class Config:
+        extra = "allow"
+
 class ClassificationResponse(BaseResponse):
     """Response model for classification."""
     success: bool = Field(True, description="Always True for successful responses")
-    classification_result: Dict[str, Any] = Field(..., description="Classification result")
-    confidence: float = Field(..., description="Confidence score", ge=0.0, le=1.0)
+    classification_result: ClassificationResult = Field(..., description="Classification result")
+    confidence: Optional[float] = Field(..., description="Classifier confidence score, null when the classifier reports none", ge=0.0, le=1.0)
 
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str = Field(..., description="Service status")
-    version: str = Field(..., description="Service version")
\ No newline at end of file
+    version: str = Field(..., description="Service version")
+
+class JobAcceptedResponse(BaseResponse):
+    """Response model for a request accepted for asynchronous processing."""
+    success: bool = Field(True, description="Always True for accepted requests")
+    status: str = Field(..., description="Job status at the time of acceptance")
+
+class JobStatusResponse(BaseResponse):
+    """Response model for job status lookups."""
+    status: str = Field(..., description="Current job status")
+    details: Optional[Dict[str, Any]] = Field(None, description="Raw record from the request store")
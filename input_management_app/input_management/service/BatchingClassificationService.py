@@ -0,0 +1,94 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+from common.logging.custom_logger import CustomLogger
+from input_management_app.input_management.service.ClassificationService import ClassificationService
+
+
+class BatchingClassificationService(ClassificationService):
+    """
+    Dynamic micro-batcher in front of a batch-capable ClassificationService.
+
+    Concurrent classify_document calls are collected until `max_batch_size` documents are waiting
+    or `max_wait_seconds` has passed since the first one arrived, then sent to the wrapped
+    service's classify_documents in one call. A lone request waits at most one window.
+    An exception returned in place of a document's result is raised to that caller only; a batch
+    call that raises fails every caller in the batch.
+    """
+
+    def __init__(
+            self,
+            classification_service: ClassificationService,
+            max_batch_size: int = 16,
+            max_wait_seconds: float = 0.01,
+            max_concurrent_batches: int = 4,
+            logger: Optional[CustomLogger] = None
+    ):
+        super().__init__()
+        self.classification_service = classification_service
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.logger = logger
+        self._pending: List[Tuple[dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batch_slots = asyncio.Semaphore(max_concurrent_batches)
+        self._batch_tasks = set()
+        self.batches = 0
+        self.documents = 0
+
+    async def classify_document(self, document_data: dict) -> dict:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((document_data, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._dispatch)
+
+        return await future
+
+    async def classify_documents(self, documents: List[dict]) -> List[dict]:
+        return await self.classification_service.classify_documents(documents)
+
+    async def prepare_model_input(self, document_data: dict) -> dict:
+        return await self.classification_service.prepare_model_input(document_data)
+
+    async def validate_model_response(self, document_data: dict) -> dict:
+        return await self.classification_service.validate_model_response(document_data)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = [(document, future) for document, future in self._pending if not future.cancelled()]
+        self._pending = []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+        async with self._batch_slots:
+            try:
+                results = await self.classification_service.classify_documents([document for document, _ in batch])
+                if len(results) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} classification results, got {len(results)}")
+            except Exception as exc:
+                if self.logger:
+                    self.logger.error("Classification batch of %s failed: %s", len(batch), exc)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+
+        self.batches += 1
+        self.documents += len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,134 @@
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Optional, Set
+
+from common.logging.custom_logger import CustomLogger
+from input_management_app.input_management.service.RequestStoreService import RequestStoreService
+
+TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED"})
+
+
+class BufferedRequestStoreService(RequestStoreService):
+    """
+    Write-behind wrapper that coalesces status updates for any RequestStoreService.
+
+    Updates that repeat the last known status are dropped, the remaining ones are merged per request
+    (last status wins) and flushed in batches every `flush_interval` seconds. Terminal statuses
+    (COMPLETED/FAILED) are written before `update` returns. The last written status is remembered
+    for at most `max_tracked_requests` requests; forgetting one only costs a repeated write.
+    """
+
+    def __init__(
+            self,
+            store: RequestStoreService,
+            flush_interval: float = 0.5,
+            max_batch_size: int = 100,
+            max_tracked_requests: int = 10000,
+            logger: Optional[CustomLogger] = None
+    ):
+        super().__init__()
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_tracked_requests = max_tracked_requests
+        self.logger = logger
+        self._pending: Dict[str, str] = {}
+        self._last_status: "OrderedDict[str, str]" = OrderedDict()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+        self.dropped_updates = 0
+        self.written_updates = 0
+
+    async def start(self) -> None:
+        """Start the periodic background flush."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop the background flush and write everything still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        await self.flush()
+
+    async def put(self, request_id: str) -> dict:
+        self._last_status.pop(request_id, None)
+        self._pending.pop(request_id, None)
+        return await self.store.put(request_id)
+
+    async def get(self, request_id: str) -> dict:
+        record = await self.store.get(request_id)
+        pending_status = self._pending.get(request_id)
+        if pending_status is not None:
+            record = {**(record or {}), "request_id": request_id, "status": pending_status}
+        return record
+
+    async def update(self, request_id: str, status: str) -> dict:
+        if self._pending.get(request_id, self._last_status.get(request_id)) == status:
+            self.dropped_updates += 1
+            return {"request_id": request_id, "status": status}
+
+        if status in TERMINAL_STATUSES:
+            async with self._flush_lock:
+                if self._pending.pop(request_id, None) is not None:
+                    self.dropped_updates += 1
+                result = await self.store.update(request_id, status)
+                self.written_updates += 1
+                self._last_status.pop(request_id, None)
+            return result
+
+        if request_id in self._pending:
+            self.dropped_updates += 1
+        self._pending[request_id] = status
+        if len(self._pending) >= self.max_batch_size:
+            task = asyncio.create_task(self.flush())
+            self._background.add(task)
+            task.add_done_callback(self._background_done)
+        return {"request_id": request_id, "status": status}
+
+    async def upsert(self, request_id: str) -> dict:
+        return await self.store.upsert(request_id)
+
+    async def flush(self) -> None:
+        """Write all buffered updates to the underlying store concurrently."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            results = await asyncio.gather(
+                *(self.store.update(request_id, status) for request_id, status in batch.items()),
+                return_exceptions=True,
+            )
+            for (request_id, status), result in zip(batch.items(), results):
+                if isinstance(result, Exception):
+                    # Keep the update for the next flush unless a newer one arrived meanwhile
+                    self._pending.setdefault(request_id, status)
+                    if self.logger:
+                        self.logger.error("Failed to flush status %s for request %s: %s", status, request_id, result)
+                else:
+                    self._remember(request_id, status)
+                    self.written_updates += 1
+
+    def _remember(self, request_id: str, status: str) -> None:
+        self._last_status[request_id] = status
+        self._last_status.move_to_end(request_id)
+        while len(self._last_status) > self.max_tracked_requests:
+            self._last_status.popitem(last=False)
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None and self.logger:
+            self.logger.error("Status flush failed: %s", task.exception())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                if self.logger:
+                    self.logger.error("Status flush failed: %s", exc)
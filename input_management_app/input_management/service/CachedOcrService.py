@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from input_management_app.input_management.common.fingerprint import content_hash
+from input_management_app.input_management.common.registry import service_name
+from input_management_app.input_management.service.OcrService import OcrService
+
+
+class CachedOcrService(OcrService):
+    """
+    Content-addressed cache in front of any OcrService.
+
+    Results are keyed on a hash of the document plus the provider name and options, kept in a
+    bounded in-memory LRU with TTL and, when `cache_dir` is set, in an on-disk tier that survives
+    restarts. Only responses that pass the provider's validation are cached.
+    """
+
+    def __init__(
+            self,
+            ocr_service: OcrService,
+            max_entries: int = 1024,
+            ttl_seconds: float = 24 * 3600,
+            cache_dir: Optional[str] = None,
+            options: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__()
+        self.ocr_service = ocr_service
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self.options = options or {}
+        self.provider = service_name(ocr_service)
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def cache_key(self, document_data: dict) -> str:
+        return content_hash(self.provider, self.options, document_data)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current in-memory size."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        key = self.cache_key(document_data)
+
+        cached = self._get_memory(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        if self.cache_dir:
+            cached = await asyncio.to_thread(self._read_disk, key)
+            if cached is not None:
+                self.disk_hits += 1
+                self._set_memory(key, cached)
+                return cached
+
+        self.misses += 1
+        result = await self.ocr_service.perform_ocr(document_data)
+        if await self.ocr_service.validate_ocr_response(result):
+            self._set_memory(key, result)
+            if self.cache_dir:
+                await asyncio.to_thread(self._write_disk, key, result)
+        return result
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return await self.ocr_service.validate_ocr_response(document_data)
+
+    def _get_memory(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            self.evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def _set_memory(self, key: str, result: dict) -> None:
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[dict]:
+        path = self._disk_path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                os.remove(path)
+                self.evictions += 1
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, result: dict) -> None:
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from input_management_app.input_management.service.BufferedRequestStoreService import TERMINAL_STATUSES
+from input_management_app.input_management.service.RequestStoreService import RequestStoreService
+
+
+class CachedRequestStoreService(RequestStoreService):
+    """
+    Read-through status cache with change notifications for any RequestStoreService.
+
+    Writes go through to the store and refresh the cached record, so a workflow writing through
+    this wrapper keeps the cache current. Reads are served from a bounded LRU; entries expire after
+    `ttl_seconds`, while terminal statuses are kept until evicted since they never change.
+    wait_for_change lets long-poll and SSE handlers sleep until a request's status changes.
+    """
+
+    def __init__(
+            self,
+            store: RequestStoreService,
+            max_entries: int = 10000,
+            ttl_seconds: float = 5.0
+    ):
+        super().__init__()
+        self.store = store
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._waiters: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, request_id: str) -> Optional[dict]:
+        entry = self._entries.get(request_id)
+        if entry is None:
+            return None
+        stored_at, record = entry
+        if record.get("status") not in TERMINAL_STATUSES and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[request_id]
+            return None
+        self._entries.move_to_end(request_id)
+        return record
+
+    def _remember(self, request_id: str, record: dict) -> None:
+        previous = self._entries.get(request_id)
+        self._entries[request_id] = (time.monotonic(), record)
+        self._entries.move_to_end(request_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        if previous is None or previous[1].get("status") != record.get("status"):
+            event = self._changed.pop(request_id, None)
+            if event is not None:
+                event.set()
+
+    async def put(self, request_id: str) -> dict:
+        result = await self.store.put(request_id)
+        self._remember(request_id, {**(result or {}), "request_id": request_id, "status": "PENDING"})
+        return result
+
+    async def get(self, request_id: str) -> dict:
+        record = self._cached(request_id)
+        if record is not None:
+            self.hits += 1
+            return record
+        self.misses += 1
+        record = await self.store.get(request_id)
+        if record:
+            self._remember(request_id, record)
+        return record
+
+    async def update(self, request_id: str, status: str) -> dict:
+        result = await self.store.update(request_id, status)
+        self._remember(request_id, {**(result or {}), "request_id": request_id, "status": status})
+        return result
+
+    async def upsert(self, request_id: str) -> dict:
+        result = await self.store.upsert(request_id)
+        self._entries.pop(request_id, None)
+        return result
+
+    async def wait_for_change(self, request_id: str, timeout: float) -> bool:
+        """
+        Wait until this process records a new status for the request; False on timeout.
+
+        Updates written by other processes are only noticed once the cached entry expires, so
+        callers should re-read with get() after every wake-up.
+        """
+        event = self._changed.get(request_id)
+        if event is None:
+            event = self._changed[request_id] = asyncio.Event()
+        self._waiters[request_id] = self._waiters.get(request_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters[request_id] -= 1
+            if not self._waiters[request_id]:
+                del self._waiters[request_id]
+                if self._changed.get(request_id) is event:
+                    del self._changed[request_id]
@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class ClassificationService(ABC):
@@ -12,6 +14,20 @@ class ClassificationService(ABC):
         """Classify the document and return classification results."""
         pass
 
+    async def classify_documents(self, documents: List[dict]) -> List[dict]:
+        """
+        Classify a batch of documents, returning results in input order.
+
+        A document that fails on its own is returned as its exception instead of a result, so the
+        rest of the batch still succeeds; an exception raised by the call fails the whole batch.
+        The default classifies documents one by one; implementations backed by a batched model
+        endpoint should override it to call prepare_model_input and the model once per batch.
+        """
+        return list(await asyncio.gather(
+            *(self.classify_document(document) for document in documents),
+            return_exceptions=True,
+        ))
+
     @abstractmethod
     async def prepare_model_input(self, document_data: dict) -> dict:
         pass
@@ -19,4 +35,3 @@ class ClassificationService(ABC):
     @abstractmethod
     async def validate_model_response(self, document_data: dict) -> dict:
         pass
-
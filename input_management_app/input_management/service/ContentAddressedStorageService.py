@@ -0,0 +1,160 @@
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from common.logging.custom_logger import CustomLogger
+from input_management_app.input_management.common.document import DocumentHandle
+from input_management_app.input_management.service.StorageService import FileData, StorageService
+
+
+class ContentAddressedStorageService(StorageService):
+    """
+    Deduplicating layer over any StorageService.
+
+    store_document writes the document bytes once under blobs/sha256/<aa>/<digest> and records a
+    small per-request reference at requests/<request_id>/document.ref.json pointing at that blob.
+    A bounded in-memory index of known digests skips the existence check for recently seen blobs,
+    and concurrent stores of the same digest share one upload. Blob paths are derived from their
+    content, so a duplicate write from another process only rewrites identical bytes.
+    """
+
+    BLOB_PREFIX = "blobs/sha256"
+
+    def __init__(
+            self,
+            storage_service: StorageService,
+            max_index_entries: int = 100000,
+            logger: Optional[CustomLogger] = None
+    ):
+        super().__init__(part_size=storage_service.part_size, max_concurrency=storage_service.max_concurrency)
+        self.storage_service = storage_service
+        self.max_index_entries = max_index_entries
+        self.logger = logger
+        self._known: "OrderedDict[str, int]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.blobs_written = 0
+        self.blobs_deduplicated = 0
+        self.bytes_written = 0
+        self.bytes_deduplicated = 0
+
+    @classmethod
+    def blob_path(cls, digest: str) -> str:
+        return f"{cls.BLOB_PREFIX}/{digest[:2]}/{digest}"
+
+    @staticmethod
+    def reference_path(request_id: str) -> str:
+        return f"requests/{request_id}/document.ref.json"
+
+    async def create_upload(self, path: str) -> Any:
+        return await self.storage_service.create_upload(path)
+
+    async def upload_part(self, upload: Any, part_number: int, data: bytes) -> Any:
+        return await self.storage_service.upload_part(upload, part_number, data)
+
+    async def complete_upload(self, upload: Any, parts: List[Any]) -> dict:
+        return await self.storage_service.complete_upload(upload, parts)
+
+    async def abort_upload(self, upload: Any) -> None:
+        await self.storage_service.abort_upload(upload)
+
+    def get_file(self, path: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        return self.storage_service.get_file(path, chunk_size)
+
+    async def list_files(self, prefix: str = "", page_size: int = 1000, page_token: Optional[str] = None) -> dict:
+        return await self.storage_service.list_files(prefix=prefix, page_size=page_size, page_token=page_token)
+
+    async def exists(self, path: str) -> bool:
+        return await self.storage_service.exists(path)
+
+    async def put_file(self, path: str, data: FileData) -> dict:
+        return await self.storage_service.put_file(path, data)
+
+    async def store_document(self, request_id: str, document_data: dict) -> dict:
+        """Store the document as a shared blob and write the request's reference to it."""
+        document = document_data.get("document")
+        if isinstance(document, DocumentHandle):
+            digest, size, encoding = document.sha256, document.size, "raw"
+            data = lambda: document.iter_chunks(self.part_size)
+            filename, content_type = document.filename, document.content_type
+        elif isinstance(document, (bytes, bytearray, memoryview)):
+            raw = bytes(document)
+            digest, size, encoding = hashlib.sha256(raw).hexdigest(), len(raw), "raw"
+            data = lambda: raw
+            filename, content_type = document_data.get("filename"), document_data.get("content_type")
+        else:
+            # The request id is left out so that retries under a new id map to the same blob
+            payload = json.dumps(
+                {key: value for key, value in document_data.items() if key != "request_id"},
+                sort_keys=True,
+            ).encode("utf-8")
+            digest, size, encoding = hashlib.sha256(payload).hexdigest(), len(payload), "json"
+            data = lambda: payload
+            filename, content_type = document_data.get("filename"), "application/json"
+
+        deduplicated = await self._ensure_blob(digest, size, data)
+        reference = {
+            "request_id": request_id,
+            "blob": self.blob_path(digest),
+            "sha256": digest,
+            "size": size,
+            "encoding": encoding,
+            "filename": filename,
+            "content_type": content_type,
+        }
+        await self.storage_service.put_file(
+            self.reference_path(request_id), json.dumps(reference).encode("utf-8")
+        )
+        return {**reference, "deduplicated": deduplicated}
+
+    async def read_reference(self, request_id: str) -> dict:
+        return json.loads(await self.storage_service.read_file(self.reference_path(request_id)))
+
+    async def get_document(self, request_id: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream the document stored for a request by following its reference."""
+        reference = await self.read_reference(request_id)
+        async for chunk in self.storage_service.get_file(reference["blob"], chunk_size):
+            yield chunk
+
+    async def _ensure_blob(self, digest: str, size: int, data: Callable[[], FileData]) -> bool:
+        """Upload the blob unless it is already stored; True when the upload was skipped."""
+        if digest in self._known:
+            self._known.move_to_end(digest)
+            self._count_duplicate(size)
+            return True
+
+        in_flight = self._in_flight.get(digest)
+        if in_flight is not None:
+            # Wait for the upload already running, then look again: it is indexed if it succeeded
+            await asyncio.wait([in_flight])
+            return await self._ensure_blob(digest, size, data)
+
+        done = asyncio.get_running_loop().create_future()
+        self._in_flight[digest] = done
+        try:
+            path = self.blob_path(digest)
+            deduplicated = await self.storage_service.exists(path)
+            if deduplicated:
+                self._count_duplicate(size)
+            else:
+                await self.storage_service.put_file(path, data())
+                self.blobs_written += 1
+                self.bytes_written += size
+                if self.logger:
+                    self.logger.info("Stored blob %s (%s bytes)", digest, size)
+            self._remember(digest, size)
+            return deduplicated
+        finally:
+            del self._in_flight[digest]
+            done.set_result(None)
+
+    def _remember(self, digest: str, size: int) -> None:
+        self._known[digest] = size
+        self._known.move_to_end(digest)
+        while len(self._known) > self.max_index_entries:
+            self._known.popitem(last=False)
+
+    def _count_duplicate(self, size: int) -> None:
+        self.blobs_deduplicated += 1
+        self.bytes_deduplicated += size
@@ -0,0 +1,273 @@
+import asyncio
+import datetime
+import glob
+import gzip
+import os
+import time
+import uuid
+import zlib
+from typing import AsyncIterator, List, Optional, Set
+
+from common.logging.custom_logger import CustomLogger
+from input_management_app.input_management.common.fast_json import dumps, loads
+from input_management_app.input_management.service.StorageService import StorageService
+
+
+class FeedbackSegmentWriter:
+    """
+    Batched, append-only writer for manual feedback records.
+
+    append() makes a record durable in a local write-ahead log and returns; concurrent appends
+    share one fsync. Buffered records are flushed every `flush_interval` seconds, or as soon as
+    `max_segment_bytes` are waiting, as gzip-compressed JSONL segments of at most that size under
+    <prefix>/dt=<YYYY-MM-DD>/. A log file is deleted only once its records are in storage, and
+    start() re-buffers whatever the log still holds, so a crash loses nothing that was acknowledged.
+    Each writer needs its own wal_dir; processes sharing a volume must not share one.
+    """
+
+    def __init__(
+            self,
+            storage_service: StorageService,
+            wal_dir: str,
+            prefix: str = "feedback",
+            max_segment_bytes: int = 64 * 1024 * 1024,
+            flush_interval: float = 60.0,
+            compress: bool = True,
+            logger: Optional[CustomLogger] = None
+    ):
+        self.storage_service = storage_service
+        self.wal_dir = wal_dir
+        self.prefix = prefix.rstrip("/")
+        self.max_segment_bytes = max_segment_bytes
+        self.flush_interval = flush_interval
+        self.compress = compress
+        self.logger = logger
+        self._buffer: List[bytes] = []
+        self._buffer_bytes = 0
+        self._sealed_wals: List[str] = []
+        self._wal = None
+        self._wal_path: Optional[str] = None
+        self._written_seq = 0
+        self._synced_seq = 0
+        self._sync_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._background: Set[asyncio.Task] = set()
+        self.records_written = 0
+        self.segments_written = 0
+
+    async def start(self) -> None:
+        """Recover records left in the write-ahead log and start the periodic flush."""
+        if self._wal is not None:
+            return
+        os.makedirs(self.wal_dir, exist_ok=True)
+        for path in sorted(glob.glob(os.path.join(self.wal_dir, "wal-*.jsonl"))):
+            with open(path, "rb") as f:
+                lines = f.read().split(b"\n")
+            # A torn final line was never acknowledged
+            for line in lines[:-1]:
+                self._buffer.append(line + b"\n")
+                self._buffer_bytes += len(line) + 1
+            self._sealed_wals.append(path)
+        if self._buffer and self.logger:
+            self.logger.info("Recovered %s feedback records from the write-ahead log", len(self._buffer))
+        self._open_wal()
+        self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush, write everything still buffered and close the log."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        await self.flush()
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+            # Everything was flushed, so the fresh log holds no records
+            os.remove(self._wal_path)
+
+    async def append(self, record: dict) -> dict:
+        """Durably record one feedback record; it reaches storage with the next flush."""
+        if self._wal is None:
+            raise RuntimeError("FeedbackSegmentWriter is not started")
+        line = dumps(record) + b"\n"
+        self._wal.write(line)
+        self._buffer.append(line)
+        self._buffer_bytes += len(line)
+        self._written_seq += 1
+        await self._sync(self._written_seq)
+        if self._buffer_bytes >= self.max_segment_bytes and not self._flush_lock.locked():
+            task = asyncio.create_task(self._flush_logged())
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        return {"status": "accepted", "buffered_records": len(self._buffer)}
+
+    async def flush(self) -> List[str]:
+        """Write all buffered records as segments and return the segment paths."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return []
+            async with self._sync_lock:
+                # Swap the buffer and the log together so every buffered record is in a sealed log
+                batch, self._buffer, self._buffer_bytes = self._buffer, [], 0
+                sealed = self._sealed_wals + [self._rotate_wal()]
+            self._sealed_wals = []
+            try:
+                paths = await self._write_segments(batch)
+            except BaseException:
+                # Keep the records and their logs for the next flush
+                self._buffer = batch + self._buffer
+                self._buffer_bytes += sum(len(line) for line in batch)
+                self._sealed_wals = sealed + self._sealed_wals
+                raise
+            for path in sealed:
+                os.remove(path)
+            self.records_written += len(batch)
+            self.segments_written += len(paths)
+            return paths
+
+    async def _write_segments(self, batch: List[bytes]) -> List[str]:
+        paths = []
+        segment: List[bytes] = []
+        segment_bytes = 0
+        for line in batch:
+            if segment and segment_bytes + len(line) > self.max_segment_bytes:
+                paths.append(await self._write_segment(segment))
+                segment, segment_bytes = [], 0
+            segment.append(line)
+            segment_bytes += len(line)
+        if segment:
+            paths.append(await self._write_segment(segment))
+        return paths
+
+    async def _write_segment(self, lines: List[bytes]) -> str:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        extension = ".jsonl.gz" if self.compress else ".jsonl"
+        path = (
+            f"{self.prefix}/dt={now:%Y-%m-%d}/"
+            f"segment-{now:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}{extension}"
+        )
+        data = b"".join(lines)
+        if self.compress:
+            data = await asyncio.to_thread(gzip.compress, data, 6)
+        await self.storage_service.put_file(path, data)
+        if self.logger:
+            self.logger.info("Wrote feedback segment %s with %s records", path, len(lines))
+        return path
+
+    async def _sync(self, seq: int) -> None:
+        async with self._sync_lock:
+            # Appends that queued behind an fsync are usually covered by it already
+            if self._synced_seq >= seq:
+                return
+            target = self._written_seq
+            self._wal.flush()
+            await asyncio.to_thread(os.fsync, self._wal.fileno())
+            self._synced_seq = target
+
+    def _open_wal(self) -> None:
+        self._wal_path = os.path.join(self.wal_dir, f"wal-{time.time_ns():020d}.jsonl")
+        self._wal = open(self._wal_path, "ab")
+
+    def _rotate_wal(self) -> str:
+        """Seal the current log and open a new one; the caller holds the sync lock."""
+        sealed = self._wal_path
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+        self._synced_seq = self._written_seq
+        self._wal.close()
+        self._open_wal()
+        return sealed
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:
+            if self.logger:
+                self.logger.error("Feedback flush failed: %s", exc)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_logged()
+
+
+class FeedbackSegmentReader:
+    """
+    Scans feedback segments written by FeedbackSegmentWriter, e.g. for retraining jobs.
+
+    Only the dt= partitions in the requested date range are listed, and segments are streamed and
+    decompressed incrementally, so memory stays bounded by one storage chunk plus one record.
+    """
+
+    def __init__(self, storage_service: StorageService, prefix: str = "feedback"):
+        self.storage_service = storage_service
+        self.prefix = prefix.rstrip("/")
+
+    async def list_segments(
+            self,
+            start_date: Optional[datetime.date] = None,
+            end_date: Optional[datetime.date] = None
+    ) -> List[str]:
+        """
+        Segment paths with a partition date in [start_date, end_date], oldest first.
+
+        With both bounds only the partitions of the days in the range are listed; an open-ended range
+        lists every partition and filters them.
+        """
+        if start_date is not None and end_date is not None:
+            days = range((end_date - start_date).days + 1)
+            prefixes = [f"{self.prefix}/dt={start_date + datetime.timedelta(days=n):%Y-%m-%d}/" for n in days]
+        else:
+            prefixes = [f"{self.prefix}/dt="]
+
+        segments = []
+        for prefix in prefixes:
+            page_token = None
+            while True:
+                listing = await self.storage_service.list_files(prefix=prefix, page_token=page_token)
+                segments.extend(path for path in listing["files"] if self._in_range(path, start_date, end_date))
+                page_token = listing["next_page_token"]
+                if page_token is None:
+                    break
+        return sorted(segments)
+
+    async def iter_records(
+            self,
+            start_date: Optional[datetime.date] = None,
+            end_date: Optional[datetime.date] = None
+    ) -> AsyncIterator[dict]:
+        for path in await self.list_segments(start_date, end_date):
+            async for record in self.read_segment(path):
+                yield record
+
+    async def read_segment(self, path: str) -> AsyncIterator[dict]:
+        decompressor = zlib.decompressobj(wbits=31) if path.endswith(".gz") else None
+        pending = b""
+        async for chunk in self.storage_service.get_file(path):
+            if decompressor is not None:
+                chunk = decompressor.decompress(chunk)
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                if line:
+                    yield loads(line)
+        if decompressor is not None:
+            pending += decompressor.flush()
+        for line in pending.split(b"\n"):
+            if line:
+                yield loads(line)
+
+    def _in_range(self, path: str, start_date: Optional[datetime.date], end_date: Optional[datetime.date]) -> bool:
+        marker = path.find("/dt=")
+        if marker < 0 or not (path.endswith(".jsonl") or path.endswith(".jsonl.gz")):
+            return False
+        day = path[marker + 4:marker + 14]
+        if start_date is not None and day < f"{start_date:%Y-%m-%d}":
+            return False
+        if end_date is not None and day > f"{end_date:%Y-%m-%d}":
+            return False
+        return True
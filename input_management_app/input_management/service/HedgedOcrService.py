@@ -0,0 +1,152 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from common.logging.custom_logger import CustomLogger
+from input_management_app.input_management.common.registry import service_name
+from input_management_app.input_management.service.OcrService import OcrService
+
+# Key added to every result, naming the provider ("primary" or "secondary") that produced it
+OCR_SOURCE_KEY = "ocr_source"
+
+
+class HedgedOcrService(OcrService):
+    """
+    Composite OcrService that hedges slow primary calls with a secondary provider.
+
+    The request goes to the primary; if no reply arrives within the hedge delay (the primary's
+    recent `hedge_percentile` latency, clamped to [min_delay, max_delay]) it is also sent to the
+    secondary. The first reply that passes its provider's validate_ocr_response wins and the other
+    call is cancelled. Hedges are capped at `max_hedge_ratio` of requests by a token budget.
+    A primary error or invalid reply fails over to the secondary without using the budget.
+    Results carry the answering provider under OCR_SOURCE_KEY, and validate_ocr_response checks
+    them with that provider's rules.
+    """
+
+    def __init__(
+            self,
+            primary: OcrService,
+            secondary: OcrService,
+            hedge_percentile: float = 0.95,
+            initial_delay: float = 2.0,
+            min_delay: float = 0.05,
+            max_delay: float = 30.0,
+            max_hedge_ratio: float = 0.05,
+            window_size: int = 500,
+            logger: Optional[CustomLogger] = None
+    ):
+        super().__init__()
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_percentile = hedge_percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.logger = logger
+        self._primary_latencies = deque(maxlen=window_size)
+        # Start with one token so the first slow request can be hedged
+        self._hedge_tokens = 1.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def hedge_delay(self) -> float:
+        """Current hedge delay in seconds, from the primary's recent latency percentile."""
+        if len(self._primary_latencies) < 20:
+            return self.initial_delay
+        ordered = sorted(self._primary_latencies)
+        index = min(len(ordered) - 1, math.ceil(self.hedge_percentile * len(ordered)) - 1)
+        return min(self.max_delay, max(self.min_delay, ordered[index]))
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+            "hedge_delay": self.hedge_delay(),
+        }
+
+    def _take_hedge_token(self) -> bool:
+        if self._hedge_tokens >= 1.0:
+            self._hedge_tokens -= 1.0
+            return True
+        return False
+
+    async def _call(self, provider: OcrService, document_data: dict) -> dict:
+        start = time.perf_counter()
+        cancelled = False
+        try:
+            result = await provider.perform_ocr(document_data)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            # A cancelled primary only tells us it took longer than the hedge delay, not how long it
+            # takes, so only completed and failed calls feed the window
+            if provider is self.primary and not cancelled:
+                self._primary_latencies.append(time.perf_counter() - start)
+        return {**result, OCR_SOURCE_KEY: "primary" if provider is self.primary else "secondary"}
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        self.requests += 1
+        self._hedge_tokens = min(10.0, self._hedge_tokens + self.max_hedge_ratio)
+
+        tasks: Dict[asyncio.Task, OcrService] = {
+            asyncio.create_task(self._call(self.primary, document_data)): self.primary
+        }
+        secondary_started = False
+        hedged = False
+        last_result: Optional[dict] = None
+        last_error: Optional[BaseException] = None
+
+        def start_secondary() -> None:
+            nonlocal secondary_started
+            secondary_started = True
+            tasks[asyncio.create_task(self._call(self.secondary, document_data))] = self.secondary
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if not done and self._take_hedge_token():
+                self.hedges += 1
+                hedged = True
+                start_secondary()
+
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider = tasks.pop(task)
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        reason = str(last_error)
+                    else:
+                        last_result = task.result()
+                        if await provider.validate_ocr_response(last_result):
+                            if hedged and provider is self.secondary:
+                                self.hedge_wins += 1
+                            return last_result
+                        reason = "invalid response"
+                    if self.logger:
+                        self.logger.info("OCR provider %s failed: %s", service_name(provider), reason)
+                    if not secondary_started:
+                        self.failovers += 1
+                        start_secondary()
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        if last_result is not None:
+            # Let the caller's own validation reject it
+            return last_result
+        raise last_error
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        if document_data.get(OCR_SOURCE_KEY) == "secondary":
+            return await self.secondary.validate_ocr_response(document_data)
+        return await self.primary.validate_ocr_response(document_data)
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+@dataclass
+class Job:
+    """A leased job; lease_token must be passed back to ack/nack/extend."""
+    job_id: str
+    payload: dict
+    attempts: int
+    lease_token: str
+
+
+class JobQueueService(ABC):
+    """
+    Interface for durable job queues.
+
+    A leased job is invisible to other workers until its visibility timeout expires, after which
+    it is handed out again, so jobs of a crashed worker are recovered automatically. Jobs that
+    exhaust their `max_attempts`, by failing or by losing their lease, are moved to the dead-letter
+    set, where they stay unreported until mark_reported is called for them.
+    """
+
+    def __init__(self, max_attempts: int = 5):
+        self.max_attempts = max_attempts
+
+    @abstractmethod
+    async def enqueue(self, payload: dict, job_id: Optional[str] = None, delay: float = 0.0) -> str:
+        """
+        Add a job and return its id.
+
+        Enqueueing the id of a job that is waiting or leased is a no-op; a done or dead-lettered job
+        with that id is queued again with the new payload and fresh attempts.
+        """
+        pass
+
+    @abstractmethod
+    async def lease(self, worker_id: str, visibility_timeout: float = 300.0) -> Optional[Job]:
+        """Lease the oldest available job, or return None when the queue is empty."""
+        pass
+
+    @abstractmethod
+    async def extend(self, job: Job, visibility_timeout: float = 300.0) -> bool:
+        """Push out the lease deadline of a job still being worked on; False if the lease was lost."""
+        pass
+
+    @abstractmethod
+    async def ack(self, job: Job) -> bool:
+        """Mark a job done; False if the lease was lost."""
+        pass
+
+    @abstractmethod
+    async def nack(self, job: Job, retry_delay: float = 0.0, error: Optional[str] = None) -> bool:
+        """Release a failed job for retry, or dead-letter it when out of attempts."""
+        pass
+
+    @abstractmethod
+    async def dead_letters(self, limit: int = 100, unreported_only: bool = False) -> List[dict]:
+        """Dead-lettered jobs, oldest first; unreported_only skips those passed to mark_reported."""
+        pass
+
+    @abstractmethod
+    async def mark_reported(self, job_ids: Sequence[str]) -> None:
+        """Record that the failure of these dead-lettered jobs has been handled."""
+        pass
+
+    @abstractmethod
+    async def stats(self) -> dict:
+        pass
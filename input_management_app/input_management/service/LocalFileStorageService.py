@@ -0,0 +1,108 @@
+import asyncio
+import mmap
+import os
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional
+
+from input_management_app.input_management.service.StorageService import StorageService
+
+
+@dataclass
+class _LocalUpload:
+    path: str
+    tmp_path: str
+    fd: int
+
+
+class LocalFileStorageService(StorageService):
+    """
+    StorageService backed by a local directory, e.g. a mounted /Volumes path or a temp dir in tests.
+
+    Parts are written in parallel with positional writes into a temporary file that is atomically
+    renamed on completion; reads stream from a memory-mapped file.
+    """
+
+    def __init__(self, root: str, part_size: int = 8 * 1024 * 1024, max_concurrency: int = 4):
+        super().__init__(part_size=part_size, max_concurrency=max_concurrency)
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _full_path(self, path: str) -> str:
+        full_path = os.path.abspath(os.path.join(self.root, path.lstrip("/")))
+        if os.path.commonpath([self.root, full_path]) != self.root:
+            raise ValueError(f"Path escapes storage root: {path}")
+        return full_path
+
+    async def create_upload(self, path: str) -> _LocalUpload:
+        full_path = self._full_path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        tmp_path = f"{full_path}.upload-{uuid.uuid4().hex}"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        return _LocalUpload(path=path, tmp_path=tmp_path, fd=fd)
+
+    async def upload_part(self, upload: _LocalUpload, part_number: int, data: bytes) -> int:
+        # Every part but the last is exactly part_size long, so the offset follows from the part number
+        await asyncio.to_thread(os.pwrite, upload.fd, data, part_number * self.part_size)
+        return len(data)
+
+    async def complete_upload(self, upload: _LocalUpload, parts: List[int]) -> dict:
+        os.close(upload.fd)
+        os.replace(upload.tmp_path, self._full_path(upload.path))
+        return {
+            "path": upload.path,
+            "size": sum(parts),
+            "parts": len(parts),
+        }
+
+    async def abort_upload(self, upload: _LocalUpload) -> None:
+        try:
+            os.close(upload.fd)
+        except OSError:
+            pass
+        try:
+            os.remove(upload.tmp_path)
+        except FileNotFoundError:
+            pass
+
+    async def get_file(self, path: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or self.part_size
+        # Opening, mapping and copying chunks can fault pages in from disk, so it all runs on a thread
+        mapped = await asyncio.to_thread(self._map, self._full_path(path))
+        if mapped is None:
+            return
+        try:
+            for offset in range(0, len(mapped), chunk_size):
+                yield await asyncio.to_thread(mapped.__getitem__, slice(offset, offset + chunk_size))
+        finally:
+            mapped.close()
+
+    @staticmethod
+    def _map(full_path: str) -> Optional[mmap.mmap]:
+        with open(full_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            # The mapping stays valid after the file is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    async def list_files(self, prefix: str = "", page_size: int = 1000, page_token: Optional[str] = None) -> dict:
+        """List files in lexicographic order; page_token is the last path of the previous page."""
+        paths = await asyncio.to_thread(self._walk)
+        matching = [p for p in paths if p.startswith(prefix) and (page_token is None or p > page_token)]
+        page = matching[:page_size]
+        return {
+            "files": page,
+            "next_page_token": page[-1] if len(matching) > page_size else None,
+        }
+
+    async def exists(self, path: str) -> bool:
+        return os.path.isfile(self._full_path(path))
+
+    def _walk(self) -> List[str]:
+        paths = []
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if ".upload-" in filename:
+                    continue
+                paths.append(os.path.relpath(os.path.join(directory, filename), self.root).replace(os.sep, "/"))
+        return sorted(paths)
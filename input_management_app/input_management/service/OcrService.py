@@ -8,6 +8,7 @@ class OcrService(ABC):
 
     @abstractmethod
     async def perform_ocr(self, document_data: dict) -> dict:
+        """Run OCR; uploaded documents arrive as a DocumentHandle under document_data["document"]."""
         pass
 
     @abstractmethod
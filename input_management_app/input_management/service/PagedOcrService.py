@@ -0,0 +1,125 @@
+import asyncio
+from collections import Counter
+from typing import Callable, List, Optional
+
+from common.logging.custom_logger import CustomLogger
+from input_management_app.input_management.service.OcrService import OcrService
+
+PageSplitter = Callable[[dict, int], List[dict]]
+
+
+class PageOcrError(Exception):
+    """Raised when a page range still fails after all of its attempts."""
+
+    def __init__(self, first_page: int, error: BaseException):
+        super().__init__(f"OCR of pages starting at {first_page} failed: {error}")
+        self.first_page = first_page
+        self.error = error
+
+
+def split_pages(document_data: dict, pages_per_call: int = 1) -> List[dict]:
+    """
+    Split document_data["pages"] into documents of up to pages_per_call pages each.
+
+    Each part keeps the other keys of the document and records the absolute number of its first
+    page as "first_page", counted from the document's own "first_page" when it is already a part.
+    Returns an empty list when there is nothing to split.
+    """
+    pages = document_data.get("pages")
+    if not isinstance(pages, list) or len(pages) <= pages_per_call:
+        return []
+    base = {key: value for key, value in document_data.items() if key != "pages"}
+    offset = document_data.get("first_page", 0)
+    return [
+        {**base, "pages": pages[first:first + pages_per_call], "first_page": offset + first}
+        for first in range(0, len(pages), pages_per_call)
+    ]
+
+
+class PagedOcrService(OcrService):
+    """
+    Page-level fan-out in front of any OcrService.
+
+    Multi-page documents are split into page ranges that are OCRed concurrently, at most
+    `max_concurrency` at a time per document. Every range is checked with the wrapped service's
+    validate_ocr_response and retried on its own with exponential backoff, and the results are
+    merged in page order into {"text", "language", "page_count"}. Documents that cannot be split
+    go to the wrapped service unchanged.
+    """
+
+    def __init__(
+            self,
+            ocr_service: OcrService,
+            max_concurrency: int = 8,
+            pages_per_call: int = 1,
+            max_attempts: int = 3,
+            retry_backoff: float = 0.2,
+            splitter: Optional[PageSplitter] = None,
+            page_separator: str = "\n\f\n",
+            logger: Optional[CustomLogger] = None
+    ):
+        super().__init__()
+        self.ocr_service = ocr_service
+        self.max_concurrency = max_concurrency
+        self.pages_per_call = pages_per_call
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.splitter = splitter or split_pages
+        self.page_separator = page_separator
+        self.logger = logger
+        self.documents = 0
+        self.page_calls = 0
+        self.page_retries = 0
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        parts = self.splitter(document_data, self.pages_per_call)
+        if not parts:
+            return await self.ocr_service.perform_ocr(document_data)
+
+        self.documents += 1
+        slots = asyncio.Semaphore(self.max_concurrency)
+        tasks = [asyncio.create_task(self._ocr_part(part, slots)) for part in parts]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # A range that gave up fails the document, so stop the ranges still running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return self.merge(results, len(document_data["pages"]))
+
+    async def _ocr_part(self, part: dict, slots: asyncio.Semaphore) -> dict:
+        first_page = part.get("first_page", 0)
+        error: Optional[BaseException] = None
+        for attempt in range(self.max_attempts):
+            if attempt:
+                self.page_retries += 1
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            try:
+                async with slots:
+                    self.page_calls += 1
+                    result = await self.ocr_service.perform_ocr(part)
+                if await self.ocr_service.validate_ocr_response(result):
+                    return result
+                error = ValueError("OCR response failed validation")
+            except Exception as exc:
+                error = exc
+            if self.logger:
+                self.logger.info("OCR of pages from %s failed on attempt %s: %s", first_page, attempt + 1, error)
+        raise PageOcrError(first_page, error)
+
+    def merge(self, results: List[dict], page_count: int) -> dict:
+        """Join page texts in order; the language is the one covering the most text."""
+        texts = [result.get("text") or "" for result in results]
+        languages = Counter()
+        for result, text in zip(results, texts):
+            if result.get("language"):
+                languages[result["language"]] += len(text) or 1
+        return {
+            "text": self.page_separator.join(texts),
+            "language": languages.most_common(1)[0][0] if languages else None,
+            "page_count": page_count,
+        }
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return await self.ocr_service.validate_ocr_response(document_data)
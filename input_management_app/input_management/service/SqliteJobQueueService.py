@@ -0,0 +1,200 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence
+
+from input_management_app.input_management.service.JobQueueService import Job, JobQueueService
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_token TEXT,
+    leased_by TEXT,
+    last_error TEXT,
+    reported INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_available ON jobs (state, available_at);
+"""
+
+READY = "READY"
+LEASED = "LEASED"
+DONE = "DONE"
+DEAD = "DEAD"
+
+
+class SqliteJobQueueService(JobQueueService):
+    """
+    Durable local job queue in a SQLite file, shared safely by several worker processes.
+
+    WAL mode lets readers and a writer proceed together, and every state change runs in a
+    BEGIN IMMEDIATE transaction so two processes can never lease the same job. Expired leases are
+    treated as available, which is how jobs of a crashed worker come back. Calls run on a thread
+    so the event loop never blocks on the database.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 5, keep_done: bool = False):
+        super().__init__(max_attempts=max_attempts)
+        self.path = path
+        self.keep_done = keep_done
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+        if "reported" not in columns:
+            # Queue files created before dead letters were reported
+            connection.execute("ALTER TABLE jobs ADD COLUMN reported INTEGER NOT NULL DEFAULT 0")
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    async def enqueue(self, payload: dict, job_id: Optional[str] = None, delay: float = 0.0) -> str:
+        return await asyncio.to_thread(self._enqueue, payload, job_id or str(uuid.uuid4()), delay)
+
+    def _enqueue(self, payload: dict, job_id: str, delay: float) -> str:
+        now = time.time()
+        with self._transaction() as connection:
+            # A job id that is already queued or running is left alone; a finished or dead-lettered
+            # one is re-armed, so a client retrying a failed request id gets a fresh run
+            connection.execute(
+                "INSERT INTO jobs (job_id, payload, state, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (job_id) DO UPDATE SET payload = excluded.payload, state = excluded.state, "
+                "attempts = 0, available_at = excluded.available_at, lease_token = NULL, leased_by = NULL, "
+                "last_error = NULL, reported = 0, updated_at = excluded.updated_at "
+                "WHERE jobs.state IN (?, ?)",
+                (job_id, json.dumps(payload), READY, now + delay, now, now, DONE, DEAD),
+            )
+        return job_id
+
+    async def lease(self, worker_id: str, visibility_timeout: float = 300.0) -> Optional[Job]:
+        return await asyncio.to_thread(self._lease, worker_id, visibility_timeout)
+
+    def _lease(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        now = time.time()
+        with self._transaction() as connection:
+            # Leases that expired with no attempts left belong to workers that kept dying on the job;
+            # they stay unreported so a worker marks their requests FAILED
+            connection.execute(
+                "UPDATE jobs SET state = ?, lease_token = NULL, last_error = 'lease expired', updated_at = ? "
+                "WHERE state = ? AND available_at <= ? AND attempts >= ?",
+                (DEAD, now, LEASED, now, self.max_attempts),
+            )
+            row = connection.execute(
+                "SELECT job_id, payload, attempts FROM jobs "
+                "WHERE state IN (?, ?) AND available_at <= ? ORDER BY available_at LIMIT 1",
+                (READY, LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            job_id, payload, attempts = row
+            lease_token = uuid.uuid4().hex
+            connection.execute(
+                "UPDATE jobs SET state = ?, attempts = ?, available_at = ?, lease_token = ?, leased_by = ?, "
+                "updated_at = ? WHERE job_id = ?",
+                (LEASED, attempts + 1, now + visibility_timeout, lease_token, worker_id, now, job_id),
+            )
+        return Job(job_id=job_id, payload=json.loads(payload), attempts=attempts + 1, lease_token=lease_token)
+
+    async def extend(self, job: Job, visibility_timeout: float = 300.0) -> bool:
+        return await asyncio.to_thread(self._update_leased, job, "available_at = ?", (time.time() + visibility_timeout,))
+
+    async def ack(self, job: Job) -> bool:
+        if self.keep_done:
+            return await asyncio.to_thread(self._update_leased, job, "state = ?, lease_token = NULL", (DONE,))
+        return await asyncio.to_thread(self._delete_leased, job)
+
+    async def nack(self, job: Job, retry_delay: float = 0.0, error: Optional[str] = None) -> bool:
+        state = DEAD if job.attempts >= self.max_attempts else READY
+        return await asyncio.to_thread(
+            self._update_leased,
+            job,
+            "state = ?, available_at = ?, lease_token = NULL, last_error = ?",
+            (state, time.time() + retry_delay, error),
+        )
+
+    def _update_leased(self, job: Job, assignments: str, values: tuple) -> bool:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE job_id = ? AND state = ? AND lease_token = ?",
+                (*values, time.time(), job.job_id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount == 1
+
+    def _delete_leased(self, job: Job) -> bool:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM jobs WHERE job_id = ? AND state = ? AND lease_token = ?",
+                (job.job_id, LEASED, job.lease_token),
+            )
+            return cursor.rowcount == 1
+
+    async def dead_letters(self, limit: int = 100, unreported_only: bool = False) -> List[dict]:
+        return await asyncio.to_thread(self._dead_letters, limit, unreported_only)
+
+    def _dead_letters(self, limit: int, unreported_only: bool) -> List[dict]:
+        rows = self._connection().execute(
+            "SELECT job_id, payload, attempts, last_error, updated_at FROM jobs WHERE state = ? "
+            + ("AND reported = 0 " if unreported_only else "")
+            + "ORDER BY updated_at LIMIT ?",
+            (DEAD, limit),
+        ).fetchall()
+        return [
+            {
+                "job_id": job_id,
+                "payload": json.loads(payload),
+                "attempts": attempts,
+                "last_error": last_error,
+                "dead_at": updated_at,
+            }
+            for job_id, payload, attempts, last_error, updated_at in rows
+        ]
+
+    async def mark_reported(self, job_ids: Sequence[str]) -> None:
+        if job_ids:
+            await asyncio.to_thread(self._mark_reported, list(job_ids))
+
+    def _mark_reported(self, job_ids: List[str]) -> None:
+        with self._transaction() as connection:
+            connection.executemany(
+                "UPDATE jobs SET reported = 1 WHERE job_id = ? AND state = ?",
+                [(job_id, DEAD) for job_id in job_ids],
+            )
+
+    async def stats(self) -> dict:
+        return await asyncio.to_thread(self._stats)
+
+    def _stats(self) -> dict:
+        rows = self._connection().execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        counts = {READY: 0, LEASED: 0, DONE: 0, DEAD: 0}
+        counts.update(dict(rows))
+        return {state.lower(): count for state, count in counts.items()}
@@ -1,21 +1,119 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from input_management_app.input_management.common.document import DocumentHandle
+
+FileData = Union[bytes, AsyncIterator[bytes]]
+
+
+async def _iter_parts(data: FileData, part_size: int) -> AsyncIterator[bytes]:
+    """Re-chunk bytes or an async byte stream into parts of exactly part_size (the last may be shorter)."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data)
+        for offset in range(0, len(view), part_size):
+            yield bytes(view[offset:offset + part_size])
+        return
+
+    buffer = bytearray()
+    async for chunk in data:
+        buffer.extend(chunk)
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
 
 
 class StorageService(ABC):
-    def __init__(self):
+    """
+    Interface for document storage.
+
+    Writes go through multipart uploads: put_file splits the data into `part_size` parts and uploads
+    up to `max_concurrency` of them at once, so memory use is bounded by part_size * max_concurrency
+    regardless of file size. Implementations provide the multipart primitives, streaming reads and
+    paginated listing.
+    """
+
+    def __init__(self, part_size: int = 8 * 1024 * 1024, max_concurrency: int = 4):
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+
+    @abstractmethod
+    async def create_upload(self, path: str) -> Any:
+        """Start a multipart upload to `path` and return an implementation-specific upload handle."""
         pass
 
     @abstractmethod
-    async def put_file(self) -> dict:
+    async def upload_part(self, upload: Any, part_number: int, data: bytes) -> Any:
+        """Upload one part (numbered from 0) and return its receipt for complete_upload."""
         pass
 
     @abstractmethod
-    async def get_file(self) -> dict:
+    async def complete_upload(self, upload: Any, parts: List[Any]) -> dict:
+        """Commit the uploaded parts, ordered by part number, as the final file."""
         pass
 
     @abstractmethod
-    async def list_files(self) -> dict:
+    async def abort_upload(self, upload: Any) -> None:
         pass
 
+    @abstractmethod
+    def get_file(self, path: str, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream the file at `path` as an async iterator of byte chunks."""
+        pass
+
+    @abstractmethod
+    async def list_files(self, prefix: str = "", page_size: int = 1000, page_token: Optional[str] = None) -> dict:
+        """Return {"files": [...], "next_page_token": str or None} for paths under `prefix`."""
+        pass
+
+    async def exists(self, path: str) -> bool:
+        listing = await self.list_files(prefix=path, page_size=1)
+        return path in listing["files"]
+
+    async def put_file(self, path: str, data: FileData) -> dict:
+        """Upload bytes or an async byte stream to `path` using concurrent multipart writes."""
+        upload = await self.create_upload(path)
+        slots = asyncio.Semaphore(self.max_concurrency)
+        receipts: Dict[int, Any] = {}
+        tasks: List[asyncio.Task] = []
+
+        async def send(part_number: int, part: bytes) -> None:
+            try:
+                receipts[part_number] = await self.upload_part(upload, part_number, part)
+            finally:
+                slots.release()
+
+        try:
+            part_number = 0
+            async for part in _iter_parts(data, self.part_size):
+                # Acquire before reading further so at most max_concurrency parts are held in memory
+                await slots.acquire()
+                tasks.append(asyncio.create_task(send(part_number, part)))
+                part_number += 1
+                for task in tasks:
+                    if task.done() and task.exception():
+                        raise task.exception()
+            await asyncio.gather(*tasks)
+            return await self.complete_upload(upload, [receipts[n] for n in range(part_number)])
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.abort_upload(upload)
+            raise
 
+    async def read_file(self, path: str) -> bytes:
+        """Read a whole file into memory; prefer get_file for large files."""
+        return b"".join([chunk async for chunk in self.get_file(path)])
 
+    async def store_document(self, request_id: str, document_data: dict) -> dict:
+        """Store the raw document for a request, streaming it when it is a DocumentHandle."""
+        document = document_data.get("document")
+        if isinstance(document, DocumentHandle):
+            return await self.put_file(f"requests/{request_id}/document", document.iter_chunks(self.part_size))
+        if isinstance(document, (bytes, bytearray, memoryview)):
+            return await self.put_file(f"requests/{request_id}/document", bytes(document))
+        return await self.put_file(f"requests/{request_id}/document.json", json.dumps(document_data).encode("utf-8"))
@@ -1,18 +1,18 @@
+import logging
+from input_management_app.cpu.text import ocr_text_is_valid
 from temp.service.OcrService import OcrService
 
+logger = logging.getLogger(__name__)
+
 
 class AzureAiVisionService(OcrService):
     async def perform_ocr(self, document_data: dict) -> dict:
-        print(f"AzureAiVisionService: perform_ocr called with document_data: {document_data}")
+        logger.debug("AzureAiVisionService: perform_ocr called for document fields: %s", list(document_data))
         return {
             "text": "Sample OCR text",
             "language": "en"
         }
 
     async def validate_ocr_response(self, document_data: dict) -> bool:
-        print(f"AzureAiVisionService: validate_ocr_response called with document_data: {document_data}")
-        return True
-        print("calling AzureAiVisionService perform_ocr")
-
-    async def validate_ocr_response(self, document_data: dict) -> bool:
-        return True
\ No newline at end of file
+        logger.debug("AzureAiVisionService: validate_ocr_response called for document fields: %s", list(document_data))
+        return await ocr_text_is_valid(document_data.get("text") or "")
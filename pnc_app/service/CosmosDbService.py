@@ -1,24 +1,34 @@
+import logging
 from input_management_app.input_management.service.RequestStoreService import RequestStoreService
 
+logger = logging.getLogger(__name__)
+
 
 class CosmosDbService(RequestStoreService):
     async def put(self, request_id: str) -> dict:
-        print(f"CosmosDbService: put called with request_id: {request_id}")
+        logger.debug("CosmosDbService: put called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": "created",
         }
 
     async def get(self, request_id: str) -> dict:
-        print(f"CosmosDbService: get called with request_id: {request_id}")
+        logger.debug("CosmosDbService: get called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": "completed",
         }
 
     async def update(self, request_id: str, status: str) -> dict:
-        print(f"CosmosDbService: update called with request_id: {request_id}")
+        logger.debug("CosmosDbService: update called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": status,
-        }
\ No newline at end of file
+        }
+
+    async def upsert(self, request_id: str) -> dict:
+        logger.debug("CosmosDbService: upsert called with request_id: %s", request_id)
+        return {
+            "request_id": request_id,
+            "status": "created",
+        }
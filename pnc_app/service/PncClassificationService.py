@@ -1,17 +1,47 @@
+import logging
+from typing import List
+
+from input_management_app.cpu.text import normalize_texts
 from input_management_app.input_management.service.ClassificationService import ClassificationService
 
+logger = logging.getLogger(__name__)
+
 
 class PncClassificationService(ClassificationService):
     async def put(self, request_id: str) -> dict:
-        print(f"PncClassificationService: put called with request_id: {request_id}")
+        logger.debug("PncClassificationService: put called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": "created",
         }
 
     async def get(self, request_id: str) -> dict:
-        print(f"PncClassificationService: get called with request_id: {request_id}")
+        logger.debug("PncClassificationService: get called with request_id: %s", request_id)
         return {
             "request_id": request_id,
             "status": "completed",
-        }
\ No newline at end of file
+        }
+
+    async def classify_document(self, document_data: dict) -> dict:
+        return (await self.classify_documents([document_data]))[0]
+
+    async def classify_documents(self, documents: List[dict]) -> List[dict]:
+        model_input = await self.prepare_model_input({"documents": documents})
+        logger.debug("PncClassificationService: classify_documents called with %d documents", len(model_input["inputs"]))
+        model_response = {
+            "predictions": [
+                {"document_type": "unknown", "confidence": 1.0} for _ in model_input["inputs"]
+            ]
+        }
+        return (await self.validate_model_response(model_response))["predictions"]
+
+    async def prepare_model_input(self, document_data: dict) -> dict:
+        documents = document_data.get("documents", [document_data])
+        # one normalize_texts call per batch keeps it to a single round trip to the CPU pool
+        texts = await normalize_texts([document.get("text", "") for document in documents])
+        return {
+            "inputs": [{**document, "text": text} for document, text in zip(documents, texts)],
+        }
+
+    async def validate_model_response(self, document_data: dict) -> dict:
+        return document_data
@@ -0,0 +1,79 @@
+import datetime
+
+from audit_kpi import AuditKpiEngine, build_lookup
+from audit_kpi.engine import PROTECTED_PATH
+
+NOW = datetime.datetime(2024, 3, 6, 12, tzinfo=datetime.timezone.utc).timestamp()
+
+
+def event(action_name, service_name="filesystem", path=PROTECTED_PATH + "/a.json", email="a@example.com",
+          status_code=200, hours_ago=1.0):
+    return {
+        "event_time": NOW - hours_ago * 3600,
+        "service_name": service_name,
+        "action_name": action_name,
+        "user_identity": {"email": email, "subject_type": "USER"},
+        "request_params": {"path": path},
+        "response": {"status_code": status_code},
+    }
+
+
+def sql_file_kpis(events):
+    """KPIs 1-3 of files.sql evaluated row by row, with SQL NULL semantics."""
+    rows = [
+        e for e in events
+        if e["event_time"] >= NOW - 24 * 3600
+        and e["service_name"] in ("filesystem", "workspaceFiles")
+        and (e["request_params"].get("path") or "").startswith(PROTECTED_PATH)
+    ]
+    return {
+        "protected_file_access_24h": len(rows),
+        "unique_users_protected_files_24h": len({e["user_identity"]["email"] for e in rows} - {None}),
+        "failed_file_access_24h": sum(
+            1 for e in rows if e["response"]["status_code"] is not None and e["response"]["status_code"] != 200
+        ),
+    }
+
+
+EVENTS = [
+    event("filesGet"),
+    event("filesPut", email="b@example.com", status_code=403),
+    # Actions files.sql does not categorise still count towards KPIs 1-3
+    event("createUploadPartUrls", email="c@example.com"),
+    event("createAbortUploadUrl", service_name="workspaceFiles", status_code=500),
+    # A missing email is not a distinct user
+    event("filesHead", email=None),
+    event("filesGet", status_code=None),
+    event("filesGet", path="/Volumes/other/a.json", email="d@example.com"),
+    event("filesGet", service_name="clusters", email="e@example.com"),
+    event("filesGet", email="f@example.com", hours_ago=30),
+]
+
+
+def test_file_kpis_match_the_dashboard_queries():
+    engine = AuditKpiEngine(build_lookup())
+    for e in EVENTS:
+        engine.ingest_event(e)
+
+    kpis = engine.kpis(now=NOW)
+
+    assert {name: kpis[name] for name in sql_file_kpis(EVENTS)} == sql_file_kpis(EVENTS)
+    assert kpis["protected_file_access_30d"] == 7
+
+
+def test_uncategorised_file_actions_are_grouped_as_other():
+    engine = AuditKpiEngine(build_lookup())
+    for e in EVENTS:
+        engine.ingest_event(e)
+    engine.advance(NOW)
+
+    assert dict(engine.top("file_operation")) == {"Read/Download": 4, "Write/Upload": 1, "Other": 2}
+    assert "unknown" not in dict(engine.top("file_user"))
+
+
+def test_events_outside_every_dashboard_are_skipped():
+    engine = AuditKpiEngine(build_lookup())
+
+    assert not engine.ingest_event(event("filesGet", service_name="clusters"))
+    assert not engine.ingest_event(event("createUploadPartUrls", path="/Volumes/other/a.json"))
+    assert engine.events_skipped == 2
@@ -0,0 +1,32 @@
+from audit_kpi import RollingWindow
+
+HOUR = 3600
+
+
+def test_buckets_expire_from_running_totals():
+    window = RollingWindow(24 * HOUR, HOUR)
+    window.add(0, "file_user", "a")
+    window.add(10 * HOUR, "file_user", "a")
+    window.add(10 * HOUR, "file_user", "b")
+
+    window.advance(25 * HOUR)
+
+    assert window.count("file_user", "a") == 1
+    assert window.distinct("file_user") == 2
+    window.advance(35 * HOUR)
+    assert window.distinct("file_user") == 0
+    assert not window.add(0, "file_user", "a")
+
+
+def test_state_round_trips():
+    window = RollingWindow(24 * HOUR, HOUR)
+    window.add(HOUR, "file_access", "all", 3)
+    window.add(2 * HOUR, "file_access", "all")
+    window.advance(3 * HOUR)
+
+    restored = RollingWindow(24 * HOUR, HOUR)
+    restored.load_state(window.to_state())
+
+    assert restored.count("file_access", "all") == 4
+    assert restored.series("file_access", "all") == [(HOUR, 3), (2 * HOUR, 1)]
+    assert restored.top("file_access") == [("all", 4)]
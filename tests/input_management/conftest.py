@@ -0,0 +1,32 @@
+import pytest
+
+from input_management_app.input_management.service.RequestStoreService import RequestStoreService
+
+
+class InMemoryRequestStore(RequestStoreService):
+    """Request store that keeps the latest record per request and every status update, in order."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = {}
+        self.updates = []
+
+    async def put(self, request_id: str) -> dict:
+        self.records[request_id] = {"request_id": request_id, "status": "PENDING"}
+        return self.records[request_id]
+
+    async def get(self, request_id: str) -> dict:
+        return self.records.get(request_id)
+
+    async def update(self, request_id: str, status: str) -> dict:
+        self.updates.append((request_id, status))
+        self.records[request_id] = {"request_id": request_id, "status": status}
+        return self.records[request_id]
+
+    async def upsert(self, request_id: str) -> dict:
+        return await self.put(request_id)
+
+
+@pytest.fixture
+def request_store() -> InMemoryRequestStore:
+    return InMemoryRequestStore()
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.common.admission import AdmissionController, AdmissionRejectedError
+from input_management_app.input_management.common.metrics import MetricsRegistry
+
+
+async def hold(controller: AdmissionController, release: asyncio.Event, entered: list, label: str) -> None:
+    async with controller.admit():
+        entered.append(label)
+        await release.wait()
+
+
+def rejections(metrics: MetricsRegistry) -> dict:
+    return {row["labels"]["reason"]: row["value"] for row in metrics.snapshot().get("admission_rejected_total", [])}
+
+
+def test_waiting_caller_is_admitted_when_a_slot_frees():
+    async def scenario():
+        controller = AdmissionController("workflow", max_concurrency=1, max_queue=1, metrics=MetricsRegistry())
+        release, entered = asyncio.Event(), []
+        first = asyncio.create_task(hold(controller, release, entered, "first"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(hold(controller, release, entered, "second"))
+        await asyncio.sleep(0.01)
+        waiting = (list(entered), controller.queue_depth, controller.in_flight)
+        release.set()
+        await asyncio.gather(first, second)
+        return waiting, entered, controller
+
+    waiting, entered, controller = asyncio.run(scenario())
+    assert waiting == (["first"], 1, 1)
+    assert entered == ["first", "second"]
+    assert (controller.queue_depth, controller.in_flight) == (0, 0)
+
+
+def test_full_queue_is_rejected_with_429():
+    async def scenario():
+        metrics = MetricsRegistry()
+        controller = AdmissionController("workflow", max_concurrency=1, max_queue=0, max_queue_wait=5.0, metrics=metrics)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(controller, release, [], "holder"))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(AdmissionRejectedError) as excinfo:
+                async with controller.admit():
+                    pass
+        finally:
+            release.set()
+            await holder
+        return excinfo.value, metrics
+
+    error, metrics = asyncio.run(scenario())
+    assert (error.status_code, error.retry_after) == (429, 5)
+    assert rejections(metrics) == {"queue_full": 1}
+
+
+def test_queue_wait_timeout_is_rejected_with_503():
+    async def scenario():
+        metrics = MetricsRegistry()
+        controller = AdmissionController("ocr", max_concurrency=1, max_queue_wait=0.01, metrics=metrics)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(controller, release, [], "holder"))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(AdmissionRejectedError) as excinfo:
+                async with controller.admit():
+                    pass
+        finally:
+            release.set()
+            await holder
+        return excinfo.value, metrics, controller
+
+    error, metrics, controller = asyncio.run(scenario())
+    assert (error.status_code, error.retry_after) == (503, 1)
+    assert rejections(metrics) == {"queue_timeout": 1}
+    assert controller.queue_depth == 0
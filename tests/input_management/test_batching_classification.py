@@ -0,0 +1,88 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from input_management_app.input_management.service.BatchingClassificationService import BatchingClassificationService
+from input_management_app.input_management.service.ClassificationService import ClassificationService
+
+
+class RecordingClassifier(ClassificationService):
+    """Classifies documents one by one through the default classify_documents and records each batch."""
+
+    def __init__(self, fail_batches: bool = False):
+        super().__init__()
+        self.fail_batches = fail_batches
+        self.batches: List[List[str]] = []
+
+    async def classify_documents(self, documents: List[dict]) -> List[dict]:
+        self.batches.append([document["id"] for document in documents])
+        if self.fail_batches:
+            raise ConnectionError("model endpoint down")
+        return await super().classify_documents(documents)
+
+    async def classify_document(self, document_data: dict) -> dict:
+        if document_data.get("poison"):
+            raise ValueError(f"cannot classify {document_data['id']}")
+        return {"id": document_data["id"], "document_type": "invoice"}
+
+    async def prepare_model_input(self, document_data: dict) -> dict:
+        return document_data
+
+    async def validate_model_response(self, document_data: dict) -> dict:
+        return document_data
+
+
+def classify_concurrently(batcher: BatchingClassificationService, documents: List[dict]) -> list:
+    async def scenario():
+        return await asyncio.gather(
+            *(batcher.classify_document(document) for document in documents), return_exceptions=True,
+        )
+
+    return asyncio.run(scenario())
+
+
+def test_concurrent_calls_are_batched_up_to_the_max_size():
+    classifier = RecordingClassifier()
+    batcher = BatchingClassificationService(classifier, max_batch_size=3, max_wait_seconds=0.05)
+    results = classify_concurrently(batcher, [{"id": str(number)} for number in range(5)])
+
+    assert [result["id"] for result in results] == ["0", "1", "2", "3", "4"]
+    # The first three fill a batch at once; the last two go out when the window closes
+    assert classifier.batches == [["0", "1", "2"], ["3", "4"]]
+    assert batcher.batches == 2
+    assert batcher.documents == 5
+
+
+def test_a_lone_call_is_sent_when_the_window_closes():
+    classifier = RecordingClassifier()
+    batcher = BatchingClassificationService(classifier, max_batch_size=16, max_wait_seconds=0.01)
+    assert classify_concurrently(batcher, [{"id": "only"}]) == [{"id": "only", "document_type": "invoice"}]
+    assert classifier.batches == [["only"]]
+
+
+def test_a_failing_document_fails_only_its_own_caller():
+    classifier = RecordingClassifier()
+    batcher = BatchingClassificationService(classifier, max_batch_size=3)
+    results = classify_concurrently(batcher, [{"id": "a"}, {"id": "b", "poison": True}, {"id": "c"}])
+
+    assert classifier.batches == [["a", "b", "c"]]
+    assert results[0]["id"] == "a" and results[2]["id"] == "c"
+    assert isinstance(results[1], ValueError)
+
+
+def test_a_failing_batch_call_fails_every_caller():
+    batcher = BatchingClassificationService(RecordingClassifier(fail_batches=True), max_batch_size=2)
+    results = classify_concurrently(batcher, [{"id": "a"}, {"id": "b"}])
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert batcher.batches == 0
+
+
+def test_result_count_mismatch_fails_the_batch():
+    class ShortClassifier(RecordingClassifier):
+        async def classify_documents(self, documents: List[dict]) -> List[dict]:
+            return []
+
+    batcher = BatchingClassificationService(ShortClassifier(), max_batch_size=1)
+    with pytest.raises(ValueError, match="Expected 1 classification results"):
+        asyncio.run(batcher.classify_document({"id": "a"}))
@@ -0,0 +1,25 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from input_management_app.benchmark.fakes import LatencyProfile  # noqa: E402
+from input_management_app.benchmark.runner import seeded_latency  # noqa: E402
+
+
+def samples(profile: LatencyProfile, n: int = 20) -> list:
+    return [profile.sample() for _ in range(n)]
+
+
+def test_same_seed_gives_the_same_latency_sequence_per_backend():
+    profile = LatencyProfile(median=0.1, p99=1.0, error_rate=0.1)
+    first = samples(seeded_latency(profile, 7, "ocr"))
+    assert samples(seeded_latency(profile, 7, "ocr")) == first
+    assert samples(seeded_latency(profile, 8, "ocr")) != first
+    assert samples(seeded_latency(profile, 7, "storage")) != first
+
+
+def test_explicit_profile_seed_is_kept():
+    profile = LatencyProfile(median=0.1, p99=1.0, seed=42)
+    assert seeded_latency(profile, 7, "ocr").seed == 42
+    assert samples(seeded_latency(profile, 7, "ocr")) == samples(LatencyProfile(median=0.1, p99=1.0, seed=42))
@@ -0,0 +1,46 @@
+import asyncio
+
+from input_management_app.input_management.service.BufferedRequestStoreService import BufferedRequestStoreService
+
+
+def test_intermediate_updates_are_coalesced_and_terminal_written_through(request_store):
+    async def scenario():
+        store = BufferedRequestStoreService(request_store, flush_interval=60)
+        await store.put("r1")
+        await store.update("r1", "OCR")
+        await store.update("r1", "OCR")
+        await store.update("r1", "CLASSIFYING")
+        assert request_store.updates == []
+        assert (await store.get("r1"))["status"] == "CLASSIFYING"
+        await store.update("r1", "COMPLETED")
+        return store
+
+    store = asyncio.run(scenario())
+    assert request_store.updates == [("r1", "COMPLETED")]
+    assert store.dropped_updates == 3
+
+
+def test_full_batch_flush_runs_in_a_tracked_task(request_store):
+    async def scenario():
+        store = BufferedRequestStoreService(request_store, flush_interval=60, max_batch_size=2)
+        await store.update("r1", "OCR")
+        await store.update("r2", "OCR")
+        assert len(store._background) == 1
+        await store.stop()
+        return store
+
+    store = asyncio.run(scenario())
+    assert sorted(request_store.updates) == [("r1", "OCR"), ("r2", "OCR")]
+    assert not store._background
+
+
+def test_remembered_statuses_are_bounded(request_store):
+    async def scenario():
+        store = BufferedRequestStoreService(request_store, flush_interval=60, max_tracked_requests=3)
+        for i in range(10):
+            await store.update(f"r{i}", "OCR")
+        await store.flush()
+        return store
+
+    store = asyncio.run(scenario())
+    assert list(store._last_status) == ["r7", "r8", "r9"]
@@ -0,0 +1,77 @@
+import asyncio
+
+from input_management_app.input_management.service.CachedOcrService import CachedOcrService
+from input_management_app.input_management.service.OcrService import OcrService
+
+
+class CountingOcrService(OcrService):
+    def __init__(self, text: str = "text"):
+        super().__init__()
+        self.text = text
+        self.calls = 0
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        self.calls += 1
+        return {"text": self.text, "language": "en", "document": document_data.get("document")}
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return bool(document_data.get("text"))
+
+
+def run_ocr(cache: CachedOcrService, *documents: str) -> list:
+    async def scenario():
+        return [await cache.perform_ocr({"document": document}) for document in documents]
+
+    return asyncio.run(scenario())
+
+
+def test_repeated_document_is_a_hit():
+    ocr = CountingOcrService()
+    cache = CachedOcrService(ocr)
+    first, second = run_ocr(cache, "a", "a")
+    assert first == second
+    assert ocr.calls == 1
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_different_documents_and_options_miss():
+    ocr = CountingOcrService()
+    run_ocr(CachedOcrService(ocr), "a", "b")
+    run_ocr(CachedOcrService(ocr, options={"language": "de"}), "a")
+    assert ocr.calls == 3
+
+
+def test_invalid_responses_are_not_cached():
+    ocr = CountingOcrService(text="")
+    cache = CachedOcrService(ocr)
+    run_ocr(cache, "a", "a")
+    assert ocr.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    ocr = CountingOcrService()
+    cache = CachedOcrService(ocr, max_entries=2)
+    # "a" is used again before "c" arrives, so "b" is the one evicted
+    run_ocr(cache, "a", "b", "a", "c")
+    assert cache.evictions == 1
+    run_ocr(cache, "a", "b")
+    assert ocr.calls == 4
+    assert cache.hits == 2
+
+
+def test_expired_entries_are_evicted():
+    ocr = CountingOcrService()
+    cache = CachedOcrService(ocr, ttl_seconds=-1)
+    run_ocr(cache, "a", "a")
+    assert ocr.calls == 2
+    assert cache.evictions == 1
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    ocr = CountingOcrService()
+    first = run_ocr(CachedOcrService(ocr, cache_dir=str(tmp_path)), "a")
+    restarted = CachedOcrService(ocr, cache_dir=str(tmp_path))
+    assert run_ocr(restarted, "a") == first
+    assert ocr.calls == 1
+    assert restarted.disk_hits == 1
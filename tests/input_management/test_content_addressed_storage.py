@@ -0,0 +1,19 @@
+import asyncio
+
+from input_management_app.input_management.service.ContentAddressedStorageService import ContentAddressedStorageService
+from input_management_app.input_management.service.LocalFileStorageService import LocalFileStorageService
+
+
+def test_byte_documents_are_stored_raw_and_deduplicated(tmp_path):
+    async def scenario():
+        storage = ContentAddressedStorageService(LocalFileStorageService(str(tmp_path)))
+        first = await storage.store_document("r1", {"request_id": "r1", "document": b"%PDF-1.7 body"})
+        second = await storage.store_document("r2", {"request_id": "r2", "document": bytearray(b"%PDF-1.7 body")})
+        content = b"".join([chunk async for chunk in storage.get_document("r2")])
+        return first, second, content
+
+    first, second, content = asyncio.run(scenario())
+    assert first["encoding"] == "raw" and first["size"] == len(b"%PDF-1.7 body")
+    assert not first["deduplicated"] and second["deduplicated"]
+    assert second["sha256"] == first["sha256"]
+    assert content == b"%PDF-1.7 body"
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+from input_management_app.cpu.executor import CpuExecutor, cpu_bound, set_cpu_executor
+
+
+@cpu_bound
+def checksum(data) -> int:
+    return sum(data)
+
+
+@cpu_bound
+def overwrite(data) -> None:
+    data[0] = 0
+
+
+def run_with_executor(coro_factory, **executor_options):
+    async def scenario():
+        executor = CpuExecutor(max_workers=1, **executor_options)
+        await executor.start()
+        set_cpu_executor(executor)
+        try:
+            return executor, await coro_factory()
+        finally:
+            set_cpu_executor(None)
+            await executor.stop()
+
+    return asyncio.run(scenario())
+
+
+def test_cpu_bound_runs_inline_without_an_executor():
+    assert asyncio.run(checksum(b"\x01\x02\x03")) == 6
+
+
+def test_workers_are_spawned_and_large_arguments_use_shared_memory():
+    data = bytes(range(256)) * 8
+    executor, result = run_with_executor(lambda: checksum(data), shared_memory_threshold=1024)
+    assert result == sum(data)
+    assert executor.start_method == "spawn"
+
+
+def test_shared_memory_arguments_are_read_only():
+    with pytest.raises(TypeError):
+        run_with_executor(lambda: overwrite(b"\x01" * 2048), shared_memory_threshold=1024)
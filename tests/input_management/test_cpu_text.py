@@ -0,0 +1,29 @@
+import asyncio
+
+from input_management_app.cpu.executor import CpuExecutor, set_cpu_executor
+from input_management_app.cpu.text import normalize_texts, ocr_text_is_valid
+
+
+def test_normalize_texts_folds_compatibility_forms_and_whitespace():
+    texts = asyncio.run(normalize_texts(["  ﬁle Ｎｏ.\t 12\x00\n\nend  ", ""]))
+    assert texts == ["file No. 12 end", ""]
+
+
+def test_ocr_text_is_valid_rejects_empty_and_garbled_text():
+    assert asyncio.run(ocr_text_is_valid("Sample OCR text"))
+    assert not asyncio.run(ocr_text_is_valid("   "))
+    assert not asyncio.run(ocr_text_is_valid("ab����"))
+
+
+def test_text_functions_run_in_spawned_workers():
+    async def scenario():
+        executor = CpuExecutor(max_workers=1)
+        await executor.start()
+        set_cpu_executor(executor)
+        try:
+            return await normalize_texts(["a  b"]), await ocr_text_is_valid("text")
+        finally:
+            set_cpu_executor(None)
+            await executor.stop()
+
+    assert asyncio.run(scenario()) == (["a b"], True)
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.common.admission import AdmissionRejectedError
+from input_management_app.input_management.common.fair_scheduler import BATCH, INTERACTIVE, FairScheduler
+from input_management_app.input_management.common.metrics import MetricsRegistry
+
+
+async def run_backlog(scheduler: FairScheduler, arrivals) -> list:
+    """Queue `arrivals` of (tenant, priority) behind a held slot and return the order they start in."""
+    started = []
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with scheduler.admit("holder"):
+            await release.wait()
+
+    async def run(tenant: str, priority: str) -> None:
+        async with scheduler.admit(tenant, priority):
+            started.append(tenant if priority == INTERACTIVE else f"{tenant}:{priority}")
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    runs = []
+    for tenant, priority in arrivals:
+        runs.append(asyncio.create_task(run(tenant, priority)))
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(holder, *runs)
+    return started
+
+
+def test_backlogged_tenants_get_slots_in_proportion_to_their_weight():
+    scheduler = FairScheduler(max_concurrency=1, tenant_weights={"a": 3.0, "b": 1.0}, metrics=MetricsRegistry())
+    arrivals = [("b", INTERACTIVE)] * 4 + [("a", INTERACTIVE)] * 4
+
+    started = asyncio.run(run_backlog(scheduler, arrivals))
+
+    assert started == ["a", "a", "b", "a", "a", "b", "b", "b"]
+
+
+def test_interactive_runs_overtake_queued_batch_runs():
+    scheduler = FairScheduler(max_concurrency=1, metrics=MetricsRegistry())
+    arrivals = [("a", BATCH)] * 2 + [("a", INTERACTIVE)] * 2
+
+    started = asyncio.run(run_backlog(scheduler, arrivals))
+
+    assert started == ["a", "a", "a:batch", "a:batch"]
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        scheduler = FairScheduler(max_concurrency=1, metrics=MetricsRegistry())
+        async with scheduler.admit("a"):
+            waiter = asyncio.create_task(scheduler.admit("b").__aenter__())
+            await asyncio.sleep(0)
+            assert scheduler.queue_depth("b") == 1
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            assert scheduler.queue_depth() == 0
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    assert scheduler.in_flight == 0
+
+
+def test_slot_granted_as_the_waiter_is_cancelled_is_handed_back():
+    async def scenario():
+        scheduler = FairScheduler(max_concurrency=1, metrics=MetricsRegistry())
+
+        async def wait_for_slot() -> None:
+            async with scheduler.admit("b"):
+                pytest.fail("the cancelled waiter must not run")
+
+        async with scheduler.admit("a"):
+            waiter = asyncio.create_task(wait_for_slot())
+            await asyncio.sleep(0)
+        # Leaving the block granted the slot to the waiter; cancel it before it can resume
+        assert scheduler.tenant_in_flight["b"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    assert scheduler.in_flight == 0
+    assert scheduler.tenant_in_flight["b"] == 0
+
+
+def test_wait_past_max_queue_wait_is_rejected_with_503():
+    async def scenario():
+        scheduler = FairScheduler(max_concurrency=1, max_queue_wait=0.01, metrics=MetricsRegistry())
+        async with scheduler.admit("a"):
+            with pytest.raises(AdmissionRejectedError) as rejected:
+                async with scheduler.admit("b"):
+                    pass
+        return scheduler, rejected.value
+
+    scheduler, rejected = asyncio.run(scenario())
+    assert rejected.status_code == 503
+    assert scheduler.queue_depth() == 0
+    assert scheduler.in_flight == 0
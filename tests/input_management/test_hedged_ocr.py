@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.service.HedgedOcrService import OCR_SOURCE_KEY, HedgedOcrService
+from input_management_app.input_management.service.OcrService import OcrService
+
+
+class ScriptedOcrService(OcrService):
+    def __init__(self, delay: float, text: str = "text", error: bool = False):
+        super().__init__()
+        self.delay = delay
+        self.text = text
+        self.error = error
+        self.calls = 0
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise ConnectionError("provider down")
+        return {"text": self.text, "language": "en"}
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return bool(document_data.get("text"))
+
+
+def test_slow_primary_is_hedged_and_its_cancelled_call_is_not_recorded():
+    async def scenario():
+        primary = ScriptedOcrService(delay=1.0, text="primary")
+        secondary = ScriptedOcrService(delay=0.0, text="secondary")
+        hedged = HedgedOcrService(primary, secondary, initial_delay=0.02)
+        result = await hedged.perform_ocr({})
+        return result, hedged
+
+    result, hedged = asyncio.run(scenario())
+    assert result["text"] == "secondary"
+    assert result[OCR_SOURCE_KEY] == "secondary"
+    assert hedged.hedges == hedged.hedge_wins == 1
+    assert len(hedged._primary_latencies) == 0
+
+
+def test_failing_primary_fails_over_and_is_recorded():
+    async def scenario():
+        primary = ScriptedOcrService(delay=0.0, error=True)
+        secondary = ScriptedOcrService(delay=0.0, text="secondary")
+        hedged = HedgedOcrService(primary, secondary, initial_delay=1.0)
+        return await hedged.perform_ocr({}), hedged
+
+    result, hedged = asyncio.run(scenario())
+    assert result["text"] == "secondary"
+    assert hedged.failovers == 1
+    assert hedged.hedges == 0
+    assert len(hedged._primary_latencies) == 1
+
+
+def test_hedge_budget_limits_hedges():
+    async def scenario():
+        primary = ScriptedOcrService(delay=0.03, text="primary")
+        secondary = ScriptedOcrService(delay=0.0, text="secondary")
+        hedged = HedgedOcrService(primary, secondary, initial_delay=0.01, max_hedge_ratio=0.0)
+        for _ in range(3):
+            await hedged.perform_ocr({})
+        return hedged, secondary
+
+    hedged, secondary = asyncio.run(scenario())
+    assert hedged.hedges == 1
+    assert secondary.calls == 1
+
+
+def test_both_providers_failing_raises_the_last_error():
+    async def scenario():
+        hedged = HedgedOcrService(ScriptedOcrService(0.0, error=True), ScriptedOcrService(0.0, error=True))
+        await hedged.perform_ocr({})
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(scenario())
+
+
+class StrictOcrService(ScriptedOcrService):
+    """Accepts only replies carrying its own text, like a provider with its own response format."""
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return document_data.get("text") == self.text
+
+
+def test_result_is_validated_by_the_provider_that_answered():
+    async def scenario():
+        hedged = HedgedOcrService(
+            StrictOcrService(0.0, text="primary", error=True), StrictOcrService(0.0, text="secondary"),
+        )
+        result = await hedged.perform_ocr({})
+        return result, await hedged.validate_ocr_response(result)
+
+    result, valid = asyncio.run(scenario())
+    assert result[OCR_SOURCE_KEY] == "secondary"
+    assert valid
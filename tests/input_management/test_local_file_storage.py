@@ -0,0 +1,53 @@
+import asyncio
+
+from input_management_app.input_management.service.LocalFileStorageService import LocalFileStorageService
+
+
+def test_multipart_round_trip(tmp_path):
+    async def scenario():
+        storage = LocalFileStorageService(str(tmp_path), part_size=4, max_concurrency=2)
+        data = bytes(range(256)) * 3
+        receipt = await storage.put_file("a/b.bin", data)
+        chunks = [chunk async for chunk in storage.get_file("a/b.bin", chunk_size=100)]
+        return data, receipt, chunks
+
+    data, receipt, chunks = asyncio.run(scenario())
+    assert receipt == {"path": "a/b.bin", "size": len(data), "parts": 192}
+    assert b"".join(chunks) == data
+    assert [len(chunk) for chunk in chunks[:-1]] == [100] * (len(chunks) - 1)
+
+
+def test_empty_file_yields_nothing(tmp_path):
+    async def scenario():
+        storage = LocalFileStorageService(str(tmp_path))
+        await storage.put_file("empty", b"")
+        return [chunk async for chunk in storage.get_file("empty")]
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_store_document_accepts_raw_bytes_and_json(tmp_path):
+    async def scenario():
+        storage = LocalFileStorageService(str(tmp_path))
+        await storage.store_document("r1", {"document": b"\\x00\\xffraw"})
+        await storage.store_document("r2", {"document": "text", "filename": "a.txt"})
+        return await storage.read_file("requests/r1/document"), await storage.read_file("requests/r2/document.json")
+
+    raw, as_json = asyncio.run(scenario())
+    assert raw == b"\\x00\\xffraw"
+    assert as_json == b'{"document": "text", "filename": "a.txt"}'
+
+
+def test_listing_is_paginated_and_skips_partial_uploads(tmp_path):
+    async def scenario():
+        storage = LocalFileStorageService(str(tmp_path))
+        for name in ("p/1", "p/2", "p/3", "q/1"):
+            await storage.put_file(name, b"x")
+        await storage.create_upload("p/4")
+        first = await storage.list_files(prefix="p/", page_size=2)
+        second = await storage.list_files(prefix="p/", page_size=2, page_token=first["next_page_token"])
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == {"files": ["p/1", "p/2"], "next_page_token": "p/2"}
+    assert second == {"files": ["p/3"], "next_page_token": None}
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.common.metrics import Histogram, MetricsRegistry
+
+
+def counter(registry: MetricsRegistry, name: str) -> float:
+    return sum(series["value"] for series in registry.snapshot().get(name, []))
+
+
+def test_timed_counts_errors_but_not_cancellations():
+    async def scenario():
+        registry = MetricsRegistry()
+
+        async def fails():
+            async with registry.timed("stage", stage="ocr"):
+                raise ValueError("boom")
+
+        async def cancelled():
+            async with registry.timed("stage", stage="ocr"):
+                await asyncio.sleep(10)
+
+        with pytest.raises(ValueError):
+            await fails()
+        task = asyncio.create_task(cancelled())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return registry
+
+    registry = asyncio.run(scenario())
+    assert counter(registry, "stage_errors_total") == 1
+    assert registry.snapshot()["stage_seconds"][0]["count"] == 2
+    assert counter(registry, "stage_in_flight") == 0
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(1.0) == pytest.approx(4.0)
+
+
+def test_render_emits_cumulative_buckets():
+    registry = MetricsRegistry(namespace="t", buckets=(1.0, 2.0))
+    registry.observe("latency_seconds", 0.5, stage="a")
+    registry.observe("latency_seconds", 1.5, stage="a")
+    text = registry.render()
+    assert 't_latency_seconds_bucket{stage="a",le="1.0"} 1' in text
+    assert 't_latency_seconds_bucket{stage="a",le="2.0"} 2' in text
+    assert 't_latency_seconds_count{stage="a"} 2' in text
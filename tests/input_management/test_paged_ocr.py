@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.service.OcrService import OcrService
+from input_management_app.input_management.service.PagedOcrService import PageOcrError, PagedOcrService, split_pages
+
+
+class PageEchoOcrService(OcrService):
+    """Returns the text of the pages it was given; page ranges listed in `failures` fail that many times."""
+
+    def __init__(self, failures: dict = None):
+        super().__init__()
+        self.failures = dict(failures or {})
+        self.calls = []
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        first_page = document_data.get("first_page", 0)
+        self.calls.append(first_page)
+        if self.failures.get(first_page, 0) > 0:
+            self.failures[first_page] -= 1
+            raise ConnectionError("provider down")
+        return {"text": " ".join(page["text"] for page in document_data["pages"]), "language": "en"}
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return bool(document_data.get("text"))
+
+
+def document(page_count: int) -> dict:
+    return {"request_id": "r1", "pages": [{"text": f"page{number}"} for number in range(page_count)]}
+
+
+def test_split_pages_records_absolute_first_pages():
+    parts = split_pages(document(5), pages_per_call=2)
+    assert [part["first_page"] for part in parts] == [0, 2, 4]
+    assert [len(part["pages"]) for part in parts] == [2, 2, 1]
+    assert all(part["request_id"] == "r1" for part in parts)
+
+    # Splitting a part again counts from the part's own first page
+    subparts = split_pages(parts[1], pages_per_call=1)
+    assert [subpart["first_page"] for subpart in subparts] == [2, 3]
+    assert split_pages(document(1)) == []
+
+
+def test_pages_are_merged_in_order():
+    ocr = PageEchoOcrService()
+    result = asyncio.run(PagedOcrService(ocr, page_separator="|").perform_ocr(document(4)))
+    assert result == {"text": "page0|page1|page2|page3", "language": "en", "page_count": 4}
+    assert sorted(ocr.calls) == [0, 1, 2, 3]
+
+
+def test_a_failed_page_is_retried_on_its_own():
+    ocr = PageEchoOcrService(failures={2: 1})
+    paged = PagedOcrService(ocr, retry_backoff=0.0, page_separator="|")
+    result = asyncio.run(paged.perform_ocr(document(3)))
+    assert result["text"] == "page0|page1|page2"
+    assert ocr.calls.count(2) == 2
+    assert ocr.calls.count(0) == ocr.calls.count(1) == 1
+    assert paged.page_retries == 1
+
+
+def test_a_page_that_keeps_failing_fails_the_document():
+    ocr = PageEchoOcrService(failures={1: 5})
+    paged = PagedOcrService(ocr, max_attempts=2, retry_backoff=0.0)
+    with pytest.raises(PageOcrError) as excinfo:
+        asyncio.run(paged.perform_ocr(document(3)))
+    assert excinfo.value.first_page == 1
+    assert ocr.calls.count(1) == 2
@@ -0,0 +1,91 @@
+import asyncio
+
+from input_management_app.input_management.queue_worker import JobQueueWorker, _load_workflow
+from input_management_app.input_management.service.SqliteJobQueueService import SqliteJobQueueService
+
+
+class FailingWorkflow:
+    def __init__(self, request_store_service):
+        self.request_store_service = request_store_service
+        self.calls = []
+
+    async def perform_classification(self, request_id, document_data, register=True, mark_failed=True):
+        self.calls.append((register, mark_failed))
+        raise RuntimeError("backend down")
+
+
+workflow = object()
+
+
+def test_failed_attempts_only_mark_failed_once_dead_lettered(tmp_path, request_store):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"), max_attempts=2)
+        flow = FailingWorkflow(request_store)
+        worker = JobQueueWorker(queue, flow, retry_delay=0.0)
+        await queue.enqueue({"request_id": "r1", "document_data": {}}, job_id="r1")
+        await worker._process(await queue.lease(worker.worker_id))
+        after_first = list(flow.request_store_service.updates)
+        await worker._process(await queue.lease(worker.worker_id))
+        return flow, after_first, await queue.dead_letters(unreported_only=True)
+
+    flow, after_first, unreported = asyncio.run(scenario())
+    assert flow.calls == [(False, False), (False, False)]
+    assert after_first == []
+    assert flow.request_store_service.updates == [("r1", "FAILED")]
+    assert unreported == []
+
+
+def test_requests_of_lease_expired_dead_letters_are_marked_failed(tmp_path, request_store):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"), max_attempts=1)
+        flow = FailingWorkflow(request_store)
+        worker = JobQueueWorker(queue, flow)
+        await queue.enqueue({"request_id": "r1", "document_data": {}}, job_id="r1")
+        # A worker that crashed mid-job never acks or nacks it
+        await queue.lease("crashed", visibility_timeout=0.0)
+        assert await queue.lease(worker.worker_id) is None
+        first = await worker.report_dead_letters()
+        second = await worker.report_dead_letters()
+        return flow, first, second
+
+    flow, first, second = asyncio.run(scenario())
+    assert first == ["r1"]
+    assert second == []
+    assert flow.request_store_service.updates == [("r1", "FAILED")]
+
+
+def test_run_reports_dead_letters_and_stops(tmp_path, request_store):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"), max_attempts=1)
+        flow = FailingWorkflow(request_store)
+        worker = JobQueueWorker(queue, flow, poll_interval=0.01, report_interval=0.01)
+        await queue.enqueue({"request_id": "r1", "document_data": {}}, job_id="r1")
+        await queue.lease("crashed", visibility_timeout=0.0)
+        running = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.05)
+        worker.stop()
+        await asyncio.wait_for(running, timeout=1.0)
+        return flow
+
+    flow = asyncio.run(scenario())
+    assert flow.request_store_service.updates == [("r1", "FAILED")]
+
+
+def test_load_workflow_resolves_module_attribute():
+    assert _load_workflow(f"{__name__}:workflow") is workflow
+
+
+def test_retried_dead_request_runs_again(tmp_path, request_store):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"), max_attempts=1)
+        flow = FailingWorkflow(request_store)
+        worker = JobQueueWorker(queue, flow, retry_delay=0.0)
+        await queue.enqueue({"request_id": "r1", "document_data": {}}, job_id="r1")
+        await worker._process(await queue.lease(worker.worker_id))
+        await queue.enqueue({"request_id": "r1", "document_data": {}}, job_id="r1")
+        await worker._process(await queue.lease(worker.worker_id))
+        return flow
+
+    flow = asyncio.run(scenario())
+    assert len(flow.calls) == 2
+    assert flow.request_store_service.updates == [("r1", "FAILED"), ("r1", "FAILED")]
@@ -0,0 +1,74 @@
+import asyncio
+import io
+import logging
+from typing import Tuple
+
+from input_management_app.input_management.common.queued_logging import QueuedLogging, QueuedLogHandler
+
+
+def make_handler(**options) -> Tuple[QueuedLogHandler, io.StringIO]:
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    return QueuedLogHandler(target=target, poll_interval=0.001, **options), stream
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_records_are_written_by_the_background_thread_with_large_arguments_truncated():
+    handler, stream = make_handler(max_field_chars=10)
+    logger = make_logger("test_queued_logging.truncate", handler)
+    logger.info("payload %s", "x" * 100)
+    logger.info("fields %(document)s %(request_id)s", {"document": "secret", "request_id": "r1"})
+    handler.close()
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == "INFO payload xxxxxxxxxx...<90 chars truncated>"
+    assert lines[1] == "INFO fields <redacted> r1"
+
+
+def test_full_queue_drops_and_counts_instead_of_blocking():
+    handler, _ = make_handler(capacity=2)
+    handler._stopping.set()
+    handler._thread.join()
+    record = logging.LogRecord("t", logging.WARNING, __file__, 1, "message", None, None)
+    for _ in range(5):
+        handler.handle(record)
+    assert handler.stats() == {"queued": 2, "dropped": 3, "sampled_out": 0}
+
+
+def test_info_records_are_sampled_but_warnings_are_not():
+    handler, stream = make_handler(info_sample_rate=3)
+    logger = make_logger("test_queued_logging.sampling", handler)
+    for i in range(6):
+        logger.info("info %s", i)
+    logger.warning("warning")
+    handler.close()
+
+    assert stream.getvalue().splitlines() == ["INFO info 0", "INFO info 3", "WARNING warning"]
+    assert handler.sampled_out == 4
+
+
+def test_queued_logging_installs_on_start_and_restores_handlers_on_stop():
+    logger = logging.getLogger("test_queued_logging.lifecycle")
+    original = logging.NullHandler()
+    logger.handlers = [original]
+    lifecycle = QueuedLogging(logger, target=logging.NullHandler())
+
+    async def scenario():
+        await lifecycle.start()
+        installed = list(logger.handlers)
+        logger.warning("during")
+        await lifecycle.stop()
+        return installed
+
+    installed = asyncio.run(scenario())
+    assert len(installed) == 1 and isinstance(installed[0], QueuedLogHandler)
+    assert not installed[0]._thread.is_alive()
+    assert logger.handlers == [original]
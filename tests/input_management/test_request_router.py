@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import json
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+from input_management_app.input_management.api.routes.request import create_request_router  # noqa: E402
+from input_management_app.input_management.common.admission import AdmissionController, AdmissionRejectedError  # noqa: E402
+from input_management_app.input_management.common.document import DocumentHandle  # noqa: E402
+from input_management_app.input_management.common.fair_scheduler import INTERACTIVE, FairScheduler  # noqa: E402
+from input_management_app.input_management.common.metrics import MetricsRegistry  # noqa: E402
+from input_management_app.input_management.common.single_flight import SingleFlight  # noqa: E402
+from input_management_app.input_management.common.stage_scheduler import StageFailedError  # noqa: E402
+from input_management_app.input_management.common.worker_pool import WorkerPool  # noqa: E402
+
+
+class FakeWorkflow:
+    def __init__(self, request_store_service, fail: bool = False):
+        self.request_store_service = request_store_service
+        self.logger = None
+        self.feedback_writer = None
+        self.fail = fail
+        self.runs = []
+
+    async def perform_classification(self, request_id: str, document_data: dict, register: bool = True) -> dict:
+        self.runs.append(request_id)
+        if register:
+            await self.request_store_service.put(request_id)
+        await asyncio.sleep(0.05)
+        if self.fail:
+            await self.request_store_service.update(request_id, "FAILED")
+            raise ValueError("classifier unavailable")
+        await self.request_store_service.update(request_id, "COMPLETED")
+        return {"request_id": request_id, "status": "completed", "classification": {"label": "invoice"}}
+
+
+async def post_duplicates(workflow: FakeWorkflow):
+    app = fastapi.FastAPI()
+    app.include_router(create_request_router(workflow=workflow, single_flight=SingleFlight()))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://test") as client:
+        body = {"document": "same bytes"}
+        leader = asyncio.create_task(client.post("/api/request/request", json=body, headers={"X-Request-ID": "a"}))
+        await asyncio.sleep(0.01)
+        follower = await client.post("/api/request/request", json=body, headers={"X-Request-ID": "b"})
+        return await leader, follower
+
+
+def test_request_attached_by_content_gets_its_own_status_and_request_id(request_store):
+    workflow = FakeWorkflow(request_store)
+    leader, follower = asyncio.run(post_duplicates(workflow))
+
+    assert workflow.runs == ["a"]
+    assert leader.json()["classification_result"]["request_id"] == "a"
+    assert follower.status_code == 200
+    assert follower.json()["request_id"] == "b"
+    assert follower.json()["classification_result"]["request_id"] == "b"
+    assert workflow.request_store_service.records["b"]["status"] == "COMPLETED"
+
+
+def test_request_attached_to_a_failed_run_is_marked_failed(request_store):
+    workflow = FakeWorkflow(request_store, fail=True)
+    leader, follower = asyncio.run(post_duplicates(workflow))
+
+    assert workflow.runs == ["a"]
+    assert leader.status_code == follower.status_code == 500
+    assert workflow.request_store_service.records["b"]["status"] == "FAILED"
+
+
+def test_job_mode_retry_served_from_a_remembered_result_is_completed_again(request_store):
+    async def scenario():
+        workflow = FakeWorkflow(request_store)
+        pool = WorkerPool(workers=1)
+        app = fastapi.FastAPI()
+        app.include_router(create_request_router(workflow=workflow, worker_pool=pool, single_flight=SingleFlight()))
+        await pool.start()
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                for _ in range(2):
+                    response = await client.post("/api/request/request", json={"document": "x"}, headers={"X-Request-ID": "a"})
+                    assert response.status_code == 202
+                    await asyncio.sleep(0.1)
+        finally:
+            await pool.stop()
+        return workflow
+
+    workflow = asyncio.run(scenario())
+    assert workflow.runs == ["a"]
+    assert workflow.request_store_service.records["a"]["status"] == "COMPLETED"
+
+
+class RecordingScheduler(FairScheduler):
+    def __init__(self):
+        super().__init__(max_concurrency=4, metrics=MetricsRegistry())
+        self.tenants = []
+
+    def admit(self, tenant: str, priority: str = INTERACTIVE):
+        self.tenants.append(tenant)
+        return super().admit(tenant, priority)
+
+
+def test_unknown_tenant_headers_fall_back_to_the_default_tenant(request_store):
+    async def scenario():
+        scheduler = RecordingScheduler()
+        app = fastapi.FastAPI()
+        app.include_router(create_request_router(
+            workflow=FakeWorkflow(request_store), scheduler=scheduler, default_tenant="pnc", tenants=("pnc", "acme"),
+        ))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            for tenant in ("acme", "spoofed", None):
+                headers = {"X-Tenant": tenant} if tenant else {}
+                response = await client.post("/api/request/request", json={"document": tenant}, headers=headers)
+                assert response.status_code == 200
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    assert scheduler.tenants == ["acme", "pnc", "pnc"]
+    assert {tenant for tenant, _ in scheduler._flows} == {"acme", "pnc"}
+
+
+def test_bulk_request_streams_one_result_per_line(request_store):
+    async def scenario():
+        app = fastapi.FastAPI()
+        app.include_router(create_request_router(workflow=FakeWorkflow(request_store), bulk_concurrency=2))
+        body = b'{"request_id": "a", "document": "1"}\n\nnot json\n{"request_id": "b", "document": "2"}\n[1]'
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await asyncio.wait_for(client.post("/api/request/request/bulk", content=body), timeout=5.0)
+
+    response = asyncio.run(scenario())
+    lines = sorted((json.loads(line) for line in response.text.splitlines()), key=lambda item: item["line"])
+    assert response.status_code == 200
+    assert [(item["line"], item["success"]) for item in lines] == [(1, True), (3, False), (4, True), (5, False)]
+    assert [lines[0]["request_id"], lines[2]["request_id"]] == ["a", "b"]
+
+
+class UploadRecordingWorkflow(FakeWorkflow):
+    """Records what the spooled document looked like while the workflow had it."""
+
+    async def perform_classification(self, request_id: str, document_data: dict, register: bool = True) -> dict:
+        document = document_data["document"]
+        self.seen = {
+            "is_handle": isinstance(document, DocumentHandle),
+            "body": b"".join([chunk async for chunk in document.iter_chunks(chunk_size=1000)]),
+            "sha256": document.sha256,
+            "on_disk": document.fileobj._rolled,
+            "filename": document_data["filename"],
+            "content_type": document_data["content_type"],
+        }
+        self.document = document
+        return await super().perform_classification(request_id, document_data, register)
+
+
+def test_upload_is_spooled_to_disk_and_closed_after_the_request(request_store):
+    body = bytes(range(256)) * 40
+
+    async def scenario():
+        workflow = UploadRecordingWorkflow(request_store)
+        app = fastapi.FastAPI()
+        app.include_router(create_request_router(workflow=workflow, upload_memory_bytes=1024, max_upload_bytes=len(body)))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            headers = {"Content-Type": "application/pdf", "X-Filename": "claim.pdf", "X-Request-ID": "u1"}
+            response = await client.post("/api/request/request/upload", content=body, headers=headers)
+            too_large = await client.post("/api/request/request/upload", content=body + b"x")
+        return workflow, response, too_large
+
+    workflow, response, too_large = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert workflow.seen == {
+        "is_handle": True,
+        "body": body,
+        "sha256": hashlib.sha256(body).hexdigest(),
+        "on_disk": True,
+        "filename": "claim.pdf",
+        "content_type": "application/pdf",
+    }
+    assert workflow.document._file.closed
+    assert too_large.status_code == 413
+    assert workflow.runs == ["u1"]
+
+
+@pytest.mark.parametrize("max_queue, max_queue_wait, status_code", [(0, 5.0, 429), (None, 0.01, 503)])
+def test_workflow_admission_rejections_map_to_status_codes(request_store, max_queue, max_queue_wait, status_code):
+    async def scenario():
+        admission = AdmissionController(
+            "workflow", max_concurrency=1, max_queue=max_queue, max_queue_wait=max_queue_wait, metrics=MetricsRegistry(),
+        )
+        app = fastapi.FastAPI()
+        app.include_router(create_request_router(workflow=FakeWorkflow(request_store), admission=admission))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            # The fake workflow holds the only slot for 50 ms
+            first = asyncio.create_task(client.post("/api/request/request", json={"document": "1"}))
+            await asyncio.sleep(0.01)
+            shed = await client.post("/api/request/request", json={"document": "2"})
+            return await first, shed
+
+    first, shed = asyncio.run(scenario())
+    assert first.status_code == 200
+    assert shed.status_code == status_code
+    assert shed.headers["Retry-After"] == str(max(1, int(max_queue_wait)))
+
+
+def test_backend_admission_rejection_inside_a_stage_maps_to_its_status_code(request_store):
+    class OverloadedWorkflow(FakeWorkflow):
+        async def perform_classification(self, request_id: str, document_data: dict, register: bool = True) -> dict:
+            raise StageFailedError("ocr", AdmissionRejectedError("ocr is overloaded (queue_full)", status_code=429, retry_after=3))
+
+    async def scenario():
+        app = fastapi.FastAPI()
+        app.include_router(create_request_router(workflow=OverloadedWorkflow(request_store)))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post("/api/request/request", json={"document": "1"})
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+
+
+@pytest.mark.parametrize("confidence", [0.8, None])
+def test_response_carries_the_workflow_confidence(request_store, confidence):
+    class ConfidentWorkflow(FakeWorkflow):
+        async def perform_classification(self, request_id: str, document_data: dict, register: bool = True) -> dict:
+            result = await super().perform_classification(request_id, document_data, register)
+            return {**result, "confidence": confidence}
+
+    async def scenario():
+        app = fastapi.FastAPI()
+        app.include_router(create_request_router(workflow=ConfidentWorkflow(request_store)))
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.post("/api/request/request", json={"document": "1"})
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert response.json()["confidence"] == confidence
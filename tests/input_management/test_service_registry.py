@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.common.registry import (
+    LazyService,
+    ServiceRegistry,
+    register_default_tenants,
+    service_name,
+)
+from input_management_app.input_management.service.CachedOcrService import CachedOcrService
+from input_management_app.input_management.service.OcrService import OcrService
+
+
+class EchoOcrService(OcrService):
+    instances = 0
+
+    def __init__(self, language: str = "en"):
+        super().__init__()
+        EchoOcrService.instances += 1
+        self.language = language
+
+    async def perform_ocr(self, document_data: dict) -> dict:
+        return {"text": document_data["content"], "language": self.language}
+
+    async def validate_ocr_response(self, document_data: dict) -> bool:
+        return bool(document_data.get("text"))
+
+
+def test_lazy_proxy_is_an_instance_of_its_interface_and_loads_on_first_use():
+    EchoOcrService.instances = 0
+    registry = ServiceRegistry()
+    registry.register("pnc", "ocr", EchoOcrService, language="pl")
+    proxy = registry.lazy("pnc", "ocr", OcrService)
+
+    assert isinstance(proxy, OcrService)
+    assert isinstance(proxy, LazyService)
+    assert service_name(proxy) == "EchoOcrService"
+    assert EchoOcrService.instances == 0
+
+    result = asyncio.run(proxy.perform_ocr({"content": "hello"}))
+    assert result == {"text": "hello", "language": "pl"}
+    assert proxy.language == "pl"
+    assert EchoOcrService.instances == 1
+    assert proxy.resolve() is registry.get("pnc", "ocr")
+
+
+def test_wrappers_label_lazy_services_by_implementation_without_loading_them():
+    registry = ServiceRegistry()
+    registry.register("pnc", "ocr", "pnc_app.service.AzureAiVisionService:AzureAiVisionService")
+    cached = CachedOcrService(registry.lazy("pnc", "ocr", OcrService))
+    assert cached.provider == "AzureAiVisionService"
+    assert registry.startup_report()[0]["loaded"] is False
+
+
+def test_startup_report_records_import_and_init_cost():
+    registry = ServiceRegistry()
+    registry.register("pnc", "ocr", EchoOcrService)
+    registry.register("health", "ocr", EchoOcrService)
+    registry.get("pnc", "ocr")
+    report = {(row["tenant"], row["role"]): row for row in registry.startup_report()}
+    assert report[("pnc", "ocr")]["loaded"] is True
+    assert report[("pnc", "ocr")]["init_seconds"] >= 0
+    assert report[("health", "ocr")]["loaded"] is False
+    assert report[("health", "ocr")]["init_seconds"] is None
+
+
+def test_unknown_registrations_are_rejected():
+    registry = ServiceRegistry()
+    with pytest.raises(KeyError):
+        registry.lazy("pnc", "ocr")
+    registry.register("pnc", "ocr", "no_colon_reference")
+    with pytest.raises(ValueError):
+        registry.get("pnc", "ocr")
+
+
+def test_load_tenant_constructs_every_service_of_the_tenant():
+    EchoOcrService.instances = 0
+    registry = ServiceRegistry()
+    registry.register("pnc", "ocr", EchoOcrService)
+    registry.register("health", "ocr", EchoOcrService)
+
+    registry.load_tenant("pnc")
+
+    assert EchoOcrService.instances == 1
+    assert [row["loaded"] for row in registry.startup_report() if row["tenant"] == "pnc"] == [True]
+
+
+def test_load_tenant_fails_fast_on_an_abstract_implementation():
+    registry = ServiceRegistry()
+    registry.register("pnc", "ocr", OcrService)
+
+    with pytest.raises(TypeError):
+        registry.load_tenant("pnc")
+
+
+@pytest.mark.parametrize("tenant", ["pnc", "health"])
+def test_default_tenant_services_are_constructible(tenant):
+    registry = register_default_tenants(ServiceRegistry())
+
+    registry.load_tenant(tenant)
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.common.single_flight import SingleFlight
+
+
+def test_concurrent_calls_sharing_a_key_run_once():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            flight.run(["request:a", "content:x"], work),
+            flight.run(["request:b", "content:x"], work),
+            flight.run(["request:a"], work),
+        )
+        return results, calls, flight
+
+    results, calls, flight = asyncio.run(scenario())
+    assert results == [1, 1, 1]
+    assert calls == 1
+    assert flight.deduplicated == 2
+
+
+def test_recent_results_are_reused_until_the_ttl_expires():
+    async def scenario():
+        flight = SingleFlight(result_ttl=0.05)
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        first = await flight.run(["content:x"], work)
+        second = await flight.run(["content:x"], work)
+        await asyncio.sleep(0.06)
+        third = await flight.run(["content:x"], work)
+        return first, second, third
+
+    assert asyncio.run(scenario()) == (1, 1, 2)
+
+
+def test_failures_are_shared_but_not_remembered():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.run(["content:x"], failing),
+            flight.run(["content:x"], failing),
+            return_exceptions=True,
+        )
+        assert not flight.in_flight("content:x")
+        with pytest.raises(ValueError):
+            await flight.run(["content:x"], failing)
+        return results, calls
+
+    results, calls = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == 2
+
+
+def test_cancelled_follower_does_not_cancel_the_shared_work():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.create_task(flight.run(["content:x"], work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.run(["content:x"], work))
+        await asyncio.sleep(0)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(scenario()) == "done"
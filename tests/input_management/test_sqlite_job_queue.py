@@ -0,0 +1,96 @@
+import asyncio
+import sqlite3
+
+from input_management_app.input_management.service.SqliteJobQueueService import SqliteJobQueueService
+
+
+def test_jobs_are_leased_once_and_acked(tmp_path):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"))
+        await queue.enqueue({"request_id": "r1"}, job_id="r1")
+        await queue.enqueue({"request_id": "r1"}, job_id="r1")
+        job = await queue.lease("w1")
+        second = await queue.lease("w2")
+        acked = await queue.ack(job)
+        return job, second, acked, await queue.stats()
+
+    job, second, acked, stats = asyncio.run(scenario())
+    assert job.payload == {"request_id": "r1"} and job.attempts == 1
+    assert second is None
+    assert acked
+    assert stats == {"ready": 0, "leased": 0, "done": 0, "dead": 0}
+
+
+def test_expired_lease_is_handed_out_again_and_stale_token_is_rejected(tmp_path):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"))
+        await queue.enqueue({"request_id": "r1"}, job_id="r1")
+        first = await queue.lease("w1", visibility_timeout=0.0)
+        second = await queue.lease("w2", visibility_timeout=60.0)
+        return first, second, await queue.ack(first), await queue.ack(second)
+
+    first, second, stale_ack, ack = asyncio.run(scenario())
+    assert second.attempts == 2
+    assert not stale_ack
+    assert ack
+
+
+def test_nack_retries_until_max_attempts_then_dead_letters(tmp_path):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"), max_attempts=2)
+        await queue.enqueue({"request_id": "r1"}, job_id="r1")
+        await queue.nack(await queue.lease("w1"), error="boom")
+        await queue.nack(await queue.lease("w1"), error="boom again")
+        return await queue.lease("w1"), await queue.dead_letters()
+
+    job, dead = asyncio.run(scenario())
+    assert job is None
+    assert [(d["job_id"], d["attempts"], d["last_error"]) for d in dead] == [("r1", 2, "boom again")]
+
+
+def test_lease_expiry_on_last_attempt_dead_letters_unreported(tmp_path):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"), max_attempts=1)
+        await queue.enqueue({"request_id": "r1"}, job_id="r1")
+        await queue.lease("w1", visibility_timeout=0.0)
+        assert await queue.lease("w2") is None
+        unreported = await queue.dead_letters(unreported_only=True)
+        await queue.mark_reported([d["job_id"] for d in unreported])
+        return unreported, await queue.dead_letters(unreported_only=True), await queue.dead_letters()
+
+    unreported, after, dead = asyncio.run(scenario())
+    assert [(d["job_id"], d["last_error"]) for d in unreported] == [("r1", "lease expired")]
+    assert after == []
+    assert [d["job_id"] for d in dead] == ["r1"]
+
+
+def test_queue_files_without_reported_column_are_migrated(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, payload TEXT NOT NULL, state TEXT NOT NULL, "
+        "attempts INTEGER NOT NULL DEFAULT 0, available_at REAL NOT NULL, lease_token TEXT, leased_by TEXT, "
+        "last_error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+    )
+    connection.execute("INSERT INTO jobs VALUES ('r1', '{\"request_id\": \"r1\"}', 'DEAD', 5, 0, NULL, NULL, 'x', 0, 0)")
+    connection.commit()
+    connection.close()
+
+    queue = SqliteJobQueueService(path)
+    dead = asyncio.run(queue.dead_letters(unreported_only=True))
+    assert [d["job_id"] for d in dead] == ["r1"]
+
+
+def test_enqueue_rearms_dead_jobs_but_not_queued_ones(tmp_path):
+    async def scenario():
+        queue = SqliteJobQueueService(str(tmp_path / "jobs.sqlite3"), max_attempts=1)
+        await queue.enqueue({"request_id": "r1", "try": 1}, job_id="r1")
+        await queue.nack(await queue.lease("w1"), error="boom")
+        await queue.enqueue({"request_id": "r1", "try": 2}, job_id="r1")
+        await queue.enqueue({"request_id": "r1", "try": 3}, job_id="r1")
+        return await queue.lease("w1"), await queue.stats()
+
+    job, stats = asyncio.run(scenario())
+    assert job.payload == {"request_id": "r1", "try": 2}
+    assert job.attempts == 1
+    assert stats["dead"] == 0
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.common.stage_scheduler import Stage, StageFailedError, StageScheduler
+
+
+def test_independent_stages_run_concurrently_and_dependents_get_results():
+    async def scenario():
+        started = {}
+        loop = asyncio.get_running_loop()
+
+        def stage(name, value, delay=0.05):
+            async def func(deps):
+                started[name] = loop.time()
+                await asyncio.sleep(delay)
+                return value + sum(deps.values())
+            return func
+
+        scheduler = StageScheduler([
+            Stage("store", stage("store", 1)),
+            Stage("ocr", stage("ocr", 10)),
+            Stage("classify", stage("classify", 100, delay=0), depends_on=["ocr"]),
+        ])
+        timings = {}
+        results = await scheduler.run(timings)
+        return results, started, timings
+
+    results, started, timings = asyncio.run(scenario())
+    assert results == {"store": 1, "ocr": 10, "classify": 110}
+    assert abs(started["store"] - started["ocr"]) < 0.02
+    assert started["classify"] >= started["ocr"] + 0.04
+    assert set(timings) == {"store", "ocr", "classify"}
+
+
+def test_failure_cancels_running_siblings():
+    async def scenario():
+        cancelled = asyncio.Event()
+
+        async def slow(_):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def failing(_):
+            raise ValueError("boom")
+
+        scheduler = StageScheduler([Stage("slow", slow), Stage("failing", failing)])
+        with pytest.raises(StageFailedError) as info:
+            await scheduler.run()
+        return info.value, cancelled.is_set()
+
+    error, cancelled = asyncio.run(scenario())
+    assert error.stage == "failing"
+    assert isinstance(error.error, ValueError)
+    assert cancelled
+
+
+def test_invalid_graphs_are_rejected():
+    async def noop(_):
+        return None
+
+    with pytest.raises(ValueError):
+        StageScheduler([Stage("a", noop, depends_on=["missing"])])
+    with pytest.raises(ValueError):
+        StageScheduler([Stage("a", noop, depends_on=["b"]), Stage("b", noop, depends_on=["a"])])
+    with pytest.raises(ValueError):
+        StageScheduler([Stage("a", noop), Stage("a", noop)])
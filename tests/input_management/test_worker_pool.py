@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.common.worker_pool import WorkerPool, WorkerPoolFullError
+
+
+def test_jobs_run_with_bounded_concurrency_and_drain_on_stop():
+    async def scenario():
+        pool = WorkerPool(workers=2, max_queue_size=10)
+        await pool.start()
+        running, peak, done = 0, 0, []
+
+        def make_job(i):
+            async def job():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                done.append(i)
+            return job
+
+        for i in range(6):
+            pool.submit(make_job(i))
+        await pool.stop(drain=True)
+        return peak, done, pool
+
+    peak, done, pool = asyncio.run(scenario())
+    assert peak == 2
+    assert sorted(done) == list(range(6))
+    assert not pool.running
+
+
+def test_submit_rejects_when_queue_is_full():
+    async def scenario():
+        pool = WorkerPool(workers=1, max_queue_size=1)
+        await pool.start()
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        pool.submit(blocker)
+        await asyncio.sleep(0)  # the worker picks up the first job
+        pool.submit(blocker)
+        with pytest.raises(WorkerPoolFullError):
+            pool.submit(blocker)
+        release.set()
+        await pool.stop()
+
+    asyncio.run(scenario())
+
+
+def test_failing_job_does_not_kill_the_worker():
+    async def scenario():
+        pool = WorkerPool(workers=1)
+        await pool.start()
+        done = []
+
+        async def failing():
+            raise ValueError("boom")
+
+        async def ok():
+            done.append(True)
+
+        pool.submit(failing)
+        pool.submit(ok)
+        await pool.stop()
+        return done
+
+    assert asyncio.run(scenario()) == [True]
+
+
+def test_submit_before_start_raises():
+    with pytest.raises(RuntimeError):
+        WorkerPool().submit(lambda: None)
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from input_management_app.input_management.InputManagementWorkflow import InputManagementWorkflow
+from input_management_app.input_management.common.metrics import MetricsRegistry
+
+
+class FakeOcr:
+    async def perform_ocr(self, document_data: dict) -> dict:
+        return {"text": "invoice total", "language": "en"}
+
+    async def validate_ocr_response(self, ocr_result: dict) -> bool:
+        return bool(ocr_result.get("text"))
+
+
+class FakeClassifier:
+    def __init__(self, result: dict):
+        self.result = result
+
+    async def classify_document(self, document_data: dict) -> dict:
+        return self.result
+
+
+class FakeStorage:
+    async def store_document(self, request_id: str, document_data: dict) -> dict:
+        return {"path": f"requests/{request_id}/document.json"}
+
+
+def make_workflow(request_store, classification: dict, **kwargs) -> InputManagementWorkflow:
+    return InputManagementWorkflow(
+        extraction_service=None,
+        classification_service=FakeClassifier(classification),
+        storage_service=FakeStorage(),
+        ocr_service=FakeOcr(),
+        request_store_service=request_store,
+        metrics=MetricsRegistry(),
+        **kwargs,
+    )
+
+
+def test_workflow_without_a_logger_completes(request_store):
+    workflow = make_workflow(request_store, {"label": "invoice", "confidence": 0.9})
+
+    result = asyncio.run(workflow.perform_classification("r1", {"document": "x"}))
+
+    assert result["status"] == "completed"
+    assert set(result["stage_timings"]) == {"ocr", "classification", "storage"}
+    assert request_store.records["r1"]["status"] == "COMPLETED"
+
+
+@pytest.mark.parametrize("classification, confidence", [
+    ({"label": "invoice", "confidence": 0.42}, 0.42),
+    ({"label": "invoice", "confidence": "0.5"}, 0.5),
+    ({"label": "invoice", "confidence": 1.7}, 1.0),
+    ({"label": "invoice", "confidence": -0.2}, 0.0),
+    ({"label": "invoice", "confidence": None}, None),
+    ({"label": "invoice"}, None),
+    (["invoice"], None),
+    (None, None),
+])
+def test_confidence_of_clamps_and_handles_missing_values(classification, confidence):
+    assert InputManagementWorkflow.confidence_of(classification) == confidence
+
+
+@pytest.mark.parametrize("classification, confidence", [
+    ({"label": "invoice", "confidence": 3}, 1.0),
+    ({"label": "invoice"}, None),
+])
+def test_workflow_result_carries_the_confidence(request_store, classification, confidence):
+    workflow = make_workflow(request_store, classification)
+
+    result = asyncio.run(workflow.perform_classification("r1", {"document": "x"}))
+
+    assert result["classification"] == classification
+    assert result["confidence"] == confidence